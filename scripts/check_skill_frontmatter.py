@@ -12,6 +12,13 @@ Usage:
 import sys
 from pathlib import Path
 
+# Make the shared package importable when run as a script
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared.frontmatter import scan_frontmatter  # noqa: E402
+
 
 def check_frontmatter(file_path: str) -> bool:
     """
@@ -24,24 +31,21 @@ def check_frontmatter(file_path: str) -> bool:
         True if valid, False otherwise
     """
     try:
-        content = Path(file_path).read_text(encoding='utf-8')
-    except (IOError, OSError) as e:
+        scan = scan_frontmatter(file_path)
+    except (IOError, OSError, UnicodeDecodeError) as e:
         print(f"Error reading {file_path}: {e}")
         return False
 
-    # Check for opening frontmatter delimiter
-    if not content.startswith('---'):
+    if not scan.opened:
         print(f"Missing frontmatter: {file_path}")
         return False
 
-    # Find closing delimiter
-    end = content.find('\n---', 3)
-    if end == -1:
+    if not scan.closed:
         print(f"Unclosed frontmatter: {file_path}")
         return False
 
-    # Extract and validate frontmatter content
-    frontmatter = content[3:end]
+    # Only the frontmatter block is read; the markdown body is skipped
+    frontmatter = scan.text
     required_fields = ['name:', 'version:', 'description:']
 
     for field in required_fields:
@@ -16,15 +16,24 @@ Usage:
 
     # Consolidate specific skill only
     python scripts/consolidate_duplicate_skills.py --skill ceo-advisor --execute
+
+    # Plan every skill found in both locations at once (JSON plan on stdout)
+    python scripts/consolidate_duplicate_skills.py --plan-all
+
+    # ...and carry the plan out
+    python scripts/consolidate_duplicate_skills.py --plan-all --apply
 """
 
 import argparse
+import hashlib
+import json
 import os
 import platform
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 # Skills that exist in both locations
 DUPLICATE_SKILLS = [
@@ -38,6 +47,12 @@ DUPLICATE_SKILLS = [
     "executive-impact-presentation-generator",
 ]
 
+# Threads used by --plan-all for directory walks and by --apply for copies
+DEFAULT_WORKERS = 8
+
+# Files at least this large are copied in the kernel (copy_file_range/sendfile)
+LARGE_FILE_BYTES = 1 << 20
+
 
 def find_project_root() -> Path:
     """Find the project root directory."""
@@ -45,44 +60,86 @@ def find_project_root() -> Path:
     return script_dir.parent
 
 
-def compare_directories(
-    user_skill: Path, managed_skill: Path
-) -> Tuple[List[Path], List[Path], List[Path]]:
+class FileInfo(NamedTuple):
+    """Size and modification time of a file, from a directory walk."""
+    size: int
+    mtime_ns: int
+
+
+# (real path, mtime_ns, size) -> SHA-256 digest, so a file is hashed at most once
+_digest_cache: Dict[Tuple[str, int, int], str] = {}
+
+
+def scan_directory(root: Path) -> Dict[Path, FileInfo]:
     """
-    Compare two skill directories and find unique files.
+    Walk a skill directory once, recording every file's size and mtime.
 
     Returns:
-        Tuple of (only_in_user, only_in_managed, different_files)
+        Mapping of paths relative to ``root`` to FileInfo
     """
-    only_in_user = []
-    only_in_managed = []
-    different_files = []
+    files: Dict[Path, FileInfo] = {}
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                    continue
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            files[Path(entry.path).relative_to(root)] = FileInfo(stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+def file_digest(path: Path, info: FileInfo) -> str:
+    """Return the SHA-256 of a file, reading it in chunks and caching by mtime and size."""
+    key = (os.path.realpath(path), info.mtime_ns, info.size)
+    digest = _digest_cache.get(key)
+    if digest is None:
+        with open(path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        _digest_cache[key] = digest
+    return digest
+
+
+def files_match(path_a: Path, info_a: FileInfo, path_b: Path, info_b: FileInfo) -> bool:
+    """Compare two files by size, then by content digest."""
+    if info_a.size != info_b.size:
+        return False
+    return file_digest(path_a, info_a) == file_digest(path_b, info_b)
 
-    # Get all files in user skill
-    user_files = set()
-    if user_skill.exists():
-        for file in user_skill.rglob("*"):
-            if file.is_file():
-                user_files.add(file.relative_to(user_skill))
 
-    # Get all files in managed skill
-    managed_files = set()
-    if managed_skill.exists():
-        for file in managed_skill.rglob("*"):
-            if file.is_file():
-                managed_files.add(file.relative_to(managed_skill))
+def compare_scans(
+    user_skill: Path,
+    user_files: Dict[Path, FileInfo],
+    managed_skill: Path,
+    managed_files: Dict[Path, FileInfo],
+) -> Tuple[List[Path], List[Path], List[Path]]:
+    """
+    Compare two directory scans from scan_directory().
 
-    # Find unique files
-    only_in_user = [user_skill / f for f in user_files - managed_files]
-    only_in_managed = [managed_skill / f for f in managed_files - user_files]
+    Returns:
+        Tuple of (only_in_user, only_in_managed, different_files)
+    """
+    only_in_user = [user_skill / f for f in sorted(user_files.keys() - managed_files.keys())]
+    only_in_managed = [managed_skill / f for f in sorted(managed_files.keys() - user_files.keys())]
 
     # Find different files (same name, different content)
-    common_files = user_files & managed_files
-    for rel_path in common_files:
+    different_files = []
+    for rel_path in sorted(user_files.keys() & managed_files.keys()):
         user_file = user_skill / rel_path
         managed_file = managed_skill / rel_path
         try:
-            if user_file.read_bytes() != managed_file.read_bytes():
+            if not files_match(user_file, user_files[rel_path], managed_file, managed_files[rel_path]):
                 different_files.append(rel_path)
         except (IOError, OSError) as e:
             print(f"Warning: Could not compare {user_file}. Error: {e}")
@@ -90,6 +147,22 @@ def compare_directories(
     return only_in_user, only_in_managed, different_files
 
 
+def compare_directories(
+    user_skill: Path, managed_skill: Path
+) -> Tuple[List[Path], List[Path], List[Path]]:
+    """
+    Compare two skill directories and find unique files.
+
+    Files are compared by size first and only hashed when sizes match.
+
+    Returns:
+        Tuple of (only_in_user, only_in_managed, different_files)
+    """
+    return compare_scans(
+        user_skill, scan_directory(user_skill), managed_skill, scan_directory(managed_skill)
+    )
+
+
 def analyze_skill(skill_name: str, project_root: Path) -> Dict:
     """Analyze a duplicate skill and return consolidation plan."""
     user_skill = project_root / "skills" / skill_name
@@ -101,15 +174,16 @@ def analyze_skill(skill_name: str, project_root: Path) -> Dict:
     if not managed_skill.exists():
         return {"status": "no_canonical", "skill": skill_name}
 
-    only_in_user, only_in_managed, different = compare_directories(
-        user_skill, managed_skill
+    # One walk per tree gives both the file lists and the sizes
+    user_files = scan_directory(user_skill)
+    managed_files = scan_directory(managed_skill)
+    only_in_user, only_in_managed, different = compare_scans(
+        user_skill, user_files, managed_skill, managed_files
     )
 
-    # Calculate sizes
-    user_size = sum(f.stat().st_size for f in user_skill.rglob("*") if f.is_file())
-    managed_size = sum(
-        f.stat().st_size for f in managed_skill.rglob("*") if f.is_file()
-    )
+    user_size = sum(info.size for info in user_files.values())
+    managed_size = sum(info.size for info in managed_files.values())
+    merge_size = sum(user_files[f.relative_to(user_skill)].size for f in only_in_user)
 
     return {
         "status": "duplicate",
@@ -118,6 +192,9 @@ def analyze_skill(skill_name: str, project_root: Path) -> Dict:
         "managed_path": str(managed_skill),
         "user_size_kb": user_size // 1024,
         "managed_size_kb": managed_size // 1024,
+        "user_bytes": user_size,
+        "managed_bytes": managed_size,
+        "merge_bytes": merge_size,
         "only_in_user": [str(f.relative_to(user_skill)) for f in only_in_user],
         "only_in_managed": [
             str(f.relative_to(managed_skill)) for f in only_in_managed
@@ -134,10 +211,12 @@ def merge_unique_files(
     managed_skill = project_root / ".claude" / "skills" / skill_name
 
     actions = []
-    only_in_user, _, _ = compare_directories(user_skill, managed_skill)
+    # Only the file lists matter here, so nothing needs to be hashed
+    managed_files = scan_directory(managed_skill)
+    only_in_user = sorted(scan_directory(user_skill).keys() - managed_files.keys())
 
-    for file_path in only_in_user:
-        rel_path = file_path.relative_to(user_skill)
+    for rel_path in only_in_user:
+        file_path = user_skill / rel_path
         dest_path = managed_skill / rel_path
 
         action = f"Copy: {file_path} -> {dest_path}"
@@ -169,7 +248,12 @@ def check_symlink_support() -> bool:
 
 
 def create_symlink(skill_name: str, project_root: Path, dry_run: bool = True) -> str:
-    """Replace skills/{skill} directory with symlink to .claude/skills/{skill}."""
+    """
+    Replace skills/{skill} directory with symlink to .claude/skills/{skill}.
+
+    Warnings and errors go to stderr, so --plan-all --apply output stays
+    valid JSON.
+    """
     user_skill = project_root / "skills" / skill_name
     managed_skill = project_root / ".claude" / "skills" / skill_name
 
@@ -181,11 +265,11 @@ def create_symlink(skill_name: str, project_root: Path, dry_run: bool = True) ->
     if not dry_run:
         # Check Windows symlink support
         if platform.system() == "Windows" and not check_symlink_support():
-            print(f"\n⚠️  WARNING: Windows symlink creation requires either:")
-            print("    1. Administrator privileges, OR")
-            print("    2. Developer Mode enabled (Settings > Update & Security > For developers)")
-            print(f"\n    Skipping symlink creation for {skill_name}")
-            print(f"    The backup was created at: skills/.{skill_name}.backup")
+            print(f"\n⚠️  WARNING: Windows symlink creation requires either:", file=sys.stderr)
+            print("    1. Administrator privileges, OR", file=sys.stderr)
+            print("    2. Developer Mode enabled (Settings > Update & Security > For developers)", file=sys.stderr)
+            print(f"\n    Skipping symlink creation for {skill_name}", file=sys.stderr)
+            print(f"    The backup was created at: skills/.{skill_name}.backup", file=sys.stderr)
             return f"SKIPPED (Windows permissions): {action}"
 
         # Backup and remove the directory
@@ -197,11 +281,11 @@ def create_symlink(skill_name: str, project_root: Path, dry_run: bool = True) ->
         try:
             user_skill.symlink_to(rel_target)
         except OSError as e:
-            print(f"\n❌ ERROR creating symlink for {skill_name}: {e}")
+            print(f"\n❌ ERROR creating symlink for {skill_name}: {e}", file=sys.stderr)
             # Restore from backup
             if backup_path.exists():
                 shutil.move(backup_path, user_skill)
-                print(f"    Restored original directory from backup")
+                print(f"    Restored original directory from backup", file=sys.stderr)
             return f"FAILED: {action}"
 
     return action
@@ -232,6 +316,167 @@ def consolidate_skill(
     return analysis
 
 
+def discover_duplicate_skills(project_root: Path) -> List[str]:
+    """Names of skills that are real directories in both skills/ and .claude/skills/."""
+    user_root = project_root / "skills"
+    managed_root = project_root / ".claude" / "skills"
+    if not user_root.is_dir() or not managed_root.is_dir():
+        return []
+    with os.scandir(user_root) as entries:
+        names = [
+            entry.name for entry in entries
+            if entry.is_dir(follow_symlinks=False) and not entry.name.startswith(".")
+        ]
+    return sorted(name for name in names if (managed_root / name).is_dir())
+
+
+def plan_skill(skill_name: str, project_root: Path) -> Dict:
+    """Analyze one skill and list the copies and symlink its consolidation needs."""
+    analysis = analyze_skill(skill_name, project_root)
+    if analysis["status"] != "duplicate":
+        return analysis
+
+    user_skill = Path(analysis["user_path"])
+    managed_skill = Path(analysis["managed_path"])
+    analysis["copies"] = [
+        {
+            "source": str(user_skill / rel_path),
+            "destination": str(managed_skill / rel_path),
+            "bytes": (user_skill / rel_path).stat().st_size,
+        }
+        for rel_path in analysis["only_in_user"]
+    ]
+    analysis["symlink"] = f"{user_skill} -> {Path('..') / '.claude' / 'skills' / skill_name}"
+    # Freed once skills/<name> is a symlink and its backup is deleted
+    analysis["savings_bytes"] = analysis["user_bytes"] - analysis["merge_bytes"]
+    return analysis
+
+
+def plan_all(
+    project_root: Path,
+    skills: Optional[List[str]] = None,
+    workers: int = DEFAULT_WORKERS
+) -> Dict[str, Any]:
+    """
+    Plan consolidation of several skills concurrently.
+
+    Directory walks and hashing run on a thread pool, one skill per task.
+
+    Args:
+        project_root: Repository root
+        skills: Skill names (default: every skill found in both locations)
+        workers: Thread pool size
+
+    Returns:
+        Merged plan: per-skill analyses with copies and savings, plus totals
+    """
+    if skills is None:
+        skills = discover_duplicate_skills(project_root)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        entries = list(pool.map(lambda name: plan_skill(name, project_root), skills))
+
+    duplicates = [entry for entry in entries if entry["status"] == "duplicate"]
+    return {
+        "project_root": str(project_root),
+        "skills": entries,
+        "total_copies": sum(len(entry["copies"]) for entry in duplicates),
+        "total_copy_bytes": sum(entry["merge_bytes"] for entry in duplicates),
+        "total_savings_bytes": sum(entry["savings_bytes"] for entry in duplicates),
+    }
+
+
+def _copy_in_kernel(src_fd: int, dst_fd: int, size: int) -> bool:
+    """
+    Copy between file descriptors with copy_file_range, or sendfile.
+
+    Returns:
+        False if neither call is usable here (nothing was copied)
+    """
+    count = max(size, 1 << 23)
+    for method in ("copy_file_range", "sendfile"):
+        if not hasattr(os, method):
+            continue
+        copied = 0
+        try:
+            while True:
+                if method == "copy_file_range":
+                    sent = os.copy_file_range(src_fd, dst_fd, count)
+                else:
+                    sent = os.sendfile(dst_fd, src_fd, copied, count)
+                if sent == 0:
+                    return True
+                copied += sent
+        except OSError:
+            # Unsupported for these files (e.g. across file systems on older
+            # kernels): try the next method, unless data was already written
+            if copied:
+                raise
+    return False
+
+
+def copy_file(source: Path, destination: Path, size: int) -> None:
+    """
+    Copy a file and its metadata, in the kernel for large files.
+
+    A copy that fails partway removes the truncated destination.
+    """
+    try:
+        if size < LARGE_FILE_BYTES:
+            shutil.copy2(source, destination)
+            return
+        with open(source, "rb") as fsrc, open(destination, "wb") as fdst:
+            if not _copy_in_kernel(fsrc.fileno(), fdst.fileno(), size):
+                shutil.copyfileobj(fsrc, fdst, 1 << 20)
+        shutil.copystat(source, destination)
+    except BaseException:
+        try:
+            destination.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def apply_plan(plan: Dict[str, Any], project_root: Path, workers: int = DEFAULT_WORKERS) -> Dict[str, str]:
+    """
+    Carry out a plan from plan_all().
+
+    All copies run as one batch on a thread pool (destination directories
+    are created up front); each skill is then replaced by a symlink unless
+    one of its copies failed.
+
+    Returns:
+        Mapping of skill name to the symlink action taken
+    """
+    duplicates = [entry for entry in plan["skills"] if entry["status"] == "duplicate"]
+    copies = [(entry["skill"], copy) for entry in duplicates for copy in entry["copies"]]
+
+    for directory in {Path(copy["destination"]).parent for _, copy in copies}:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    failed = set()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [
+            (skill, copy, pool.submit(
+                copy_file, Path(copy["source"]), Path(copy["destination"]), copy["bytes"]
+            ))
+            for skill, copy in copies
+        ]
+        for skill, copy, future in futures:
+            try:
+                future.result()
+            except OSError as e:
+                print(f"❌ ERROR copying {copy['source']}: {e}", file=sys.stderr)
+                failed.add(skill)
+
+    results = {}
+    for entry in duplicates:
+        if entry["skill"] in failed:
+            results[entry["skill"]] = f"SKIPPED (copy failed): Symlink: {entry['symlink']}"
+        else:
+            results[entry["skill"]] = create_symlink(entry["skill"], project_root, dry_run=False)
+    return results
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Consolidate duplicate skills from skills/ to .claude/skills/"
@@ -251,11 +496,42 @@ def main():
         action="store_true",
         help="Only analyze and report, don't show consolidation plan",
     )
+    parser.add_argument(
+        "--plan-all",
+        action="store_true",
+        help="Plan every skill found in both skills/ and .claude/skills/ concurrently "
+             "and print one JSON plan",
+    )
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="With --plan-all, carry out the plan (batched copies, then symlinks)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Threads for --plan-all and --apply (default: {DEFAULT_WORKERS})",
+    )
     args = parser.parse_args()
 
     project_root = find_project_root()
     dry_run = not args.execute
 
+    if args.apply and not args.plan_all:
+        parser.error("--apply requires --plan-all")
+    if args.plan_all:
+        if args.apply and not check_symlink_support():
+            print("❌ Symlinks require Administrator privileges or Developer Mode on Windows.",
+                  file=sys.stderr)
+            sys.exit(1)
+        plan = plan_all(project_root, [args.skill] if args.skill else None, args.workers)
+        if args.apply:
+            plan["applied"] = apply_plan(plan, project_root, args.workers)
+        print(json.dumps(plan, indent=2))
+        failures = [a for a in plan.get("applied", {}).values() if a.startswith(("FAILED", "SKIPPED"))]
+        sys.exit(1 if failures else 0)
+
     print("=" * 60)
     print("Skill Consolidation Report")
     print("=" * 60)
@@ -14,12 +14,32 @@ Usage:
 
     # Generate only README
     python scripts/generate_skill_docs.py --config skill-definition.yaml --only README
+
+    # Regenerate docs for every skills/**/skill-definition.yaml in parallel
+    python scripts/generate_skill_docs.py --all --jobs 0
+
+    # Render very large docs straight to disk instead of into memory
+    python scripts/generate_skill_docs.py --all --stream
+
+Compiled templates are cached in .cache/jinja-bytecode/ and shared by every
+run and worker process. A fingerprint of each skill's definition, the
+templates and the generator version is kept in .cache/skill-docs/; skills
+whose fingerprint and generated files are unchanged are not re-rendered,
+and files are only rewritten (atomically) when their content changes.
 """
 
 import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from stat import S_IMODE
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Tuple, Union
 
 try:
     import yaml
@@ -28,11 +48,32 @@ except ImportError:
     print("Warning: PyYAML not installed. Install with: pip install pyyaml")
 
 try:
-    from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateNotFound
 except ImportError:
     Environment = None
     print("Warning: Jinja2 not installed. Install with: pip install jinja2")
 
+# Skill definition files picked up by --all
+DEFINITION_FILE = "skill-definition.yaml"
+SKILL_DIRECTORIES = ("skills", ".claude/skills")
+
+DEFAULT_BYTECODE_CACHE_DIR = ".cache/jinja-bytecode"
+
+DEFAULT_MANIFEST = ".cache/skill-docs/manifest.json"
+
+# Bump when generation logic changes so every skill is re-rendered
+GENERATOR_VERSION = 1
+
+# With --stream, template output chunks grouped into each write
+STREAM_BUFFER_CHUNKS = 64
+
+# Template name -> (template file, generated file)
+TEMPLATE_FILES = {
+    "README": ("README.template.md", "README.md"),
+    "SKILL": ("SKILL.template.md", "SKILL.md"),
+    "QUICK-START": ("QUICK-START.template.md", "QUICK-START.md"),
+}
+
 
 def find_project_root() -> Path:
     """Find the project root directory."""
@@ -149,16 +190,29 @@ def create_sample_definition() -> Dict[str, Any]:
     }
 
 
-def setup_jinja_env(template_dir: Path) -> 'Environment':
-    """Set up Jinja2 environment with custom filters."""
+def setup_jinja_env(template_dir: Path, bytecode_cache_dir: Optional[Path] = None) -> 'Environment':
+    """
+    Set up Jinja2 environment with custom filters.
+
+    Args:
+        template_dir: Directory holding the templates
+        bytecode_cache_dir: Persist compiled templates here, so later runs
+            and other processes skip compilation
+    """
     if not Environment:
         raise RuntimeError("Jinja2 is required. Install with: pip install jinja2")
 
+    bytecode_cache = None
+    if bytecode_cache_dir is not None:
+        bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+
     env = Environment(
         loader=FileSystemLoader(str(template_dir)),
         trim_blocks=True,
         lstrip_blocks=True,
         keep_trailing_newline=True,
+        bytecode_cache=bytecode_cache,
     )
 
     # Add custom filters
@@ -167,22 +221,38 @@ def setup_jinja_env(template_dir: Path) -> 'Environment':
     return env
 
 
+class GeneratedDoc(NamedTuple):
+    """A document rendered in streaming mode (its content is not kept)."""
+    path: Path
+    bytes: int
+    sha256: str
+
+
 def generate_docs(
     skill_def: Dict[str, Any],
     template_dir: Path,
     output_dir: Path,
     templates: Optional[list] = None,
-    dry_run: bool = False
-) -> Dict[str, str]:
-    """Generate documentation from templates."""
-    env = setup_jinja_env(template_dir)
-    generated = {}
-
-    template_files = {
-        "README": ("README.template.md", "README.md"),
-        "SKILL": ("SKILL.template.md", "SKILL.md"),
-        "QUICK-START": ("QUICK-START.template.md", "QUICK-START.md"),
-    }
+    dry_run: bool = False,
+    env: Optional['Environment'] = None,
+    stream: bool = False
+) -> Dict[str, Union[str, GeneratedDoc]]:
+    """
+    Generate documentation from templates (reusing ``env`` if given).
+
+    With ``stream``, each template is rendered chunk by chunk straight to
+    its file and only a GeneratedDoc is returned, so memory use does not
+    grow with the size of the documents.
+
+    Returns:
+        Mapping of template name to rendered content, or to GeneratedDoc
+        when streaming
+    """
+    if env is None:
+        env = setup_jinja_env(template_dir)
+    generated: Dict[str, Union[str, GeneratedDoc]] = {}
+
+    template_files = TEMPLATE_FILES
 
     # Filter templates if specified
     if templates:
@@ -191,16 +261,26 @@ def generate_docs(
     for name, (template_file, output_file) in template_files.items():
         try:
             template = env.get_template(template_file)
-            content = template.render(**skill_def)
-            generated[name] = content
-
+            output_path = output_dir / output_file
             if not dry_run:
-                output_path = output_dir / output_file
                 output_dir.mkdir(parents=True, exist_ok=True)
-                output_path.write_text(content, encoding='utf-8')
+
+            if stream:
+                chunks = template.stream(**skill_def)
+                chunks.enable_buffering(STREAM_BUFFER_CHUNKS)
+                doc, written = stream_to_file(chunks, output_path, dry_run=dry_run)
+                generated[name] = doc
+            else:
+                content = template.render(**skill_def)
+                generated[name] = content
+                written = not dry_run and write_if_changed(output_path, content)
+
+            if dry_run:
+                print(f"  [DRY RUN] Would generate: {output_path}")
+            elif written:
                 print(f"  ✅ Generated: {output_path}")
             else:
-                print(f"  [DRY RUN] Would generate: {output_dir / output_file}")
+                print(f"  ⏭️  Unchanged: {output_path}")
 
         except TemplateNotFound:
             print(f"  ⚠️  Template not found: {template_file}")
@@ -210,6 +290,397 @@ def generate_docs(
     return generated
 
 
+def _new_file_mode() -> int:
+    """Permissions a plain open() would give a new file under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+class _AtomicFile:
+    """
+    Binary temporary file next to ``path`` that replaces it on commit().
+
+    The temporary file gets ``path``'s current permissions (or the
+    umask default for a new file), since mkstemp creates it as 0600.
+    Leaving the block without commit() discards it.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        try:
+            mode = S_IMODE(path.stat().st_mode)
+        except OSError:
+            mode = _new_file_mode()
+        fd, self.temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            os.chmod(self.temp_path, mode)
+        except OSError:
+            os.close(fd)
+            os.unlink(self.temp_path)
+            raise
+        self.file = os.fdopen(fd, 'wb')
+        self.committed = False
+
+    def __enter__(self) -> '_AtomicFile':
+        return self
+
+    def write(self, data: bytes) -> None:
+        self.file.write(data)
+
+    def commit(self) -> None:
+        """Close the temporary file and move it over ``path``."""
+        self.file.close()
+        os.replace(self.temp_path, self.path)
+        self.committed = True
+
+    def __exit__(self, *exc_info) -> None:
+        if not self.committed:
+            self.file.close()
+            if os.path.exists(self.temp_path):
+                os.unlink(self.temp_path)
+
+
+def _file_matches(path: Path, size: int, sha256: str) -> bool:
+    """True if a file exists with exactly this size and SHA-256."""
+    try:
+        if path.stat().st_size != size:
+            return False
+        with open(path, 'rb') as f:
+            return hashlib.file_digest(f, 'sha256').hexdigest() == sha256
+    except OSError:
+        return False
+
+
+def stream_to_file(chunks: Iterable[str], path: Path, dry_run: bool = False) -> Tuple[GeneratedDoc, bool]:
+    """
+    Write rendered chunks to a file, hashing them on the way.
+
+    The output goes to a temporary file that replaces ``path`` atomically,
+    unless ``path`` already holds the same bytes (then its mtime is kept).
+
+    Returns:
+        (GeneratedDoc, whether the file was written)
+    """
+    digest = hashlib.sha256()
+    size = 0
+
+    if dry_run:
+        for chunk in chunks:
+            data = chunk.encode('utf-8')
+            digest.update(data)
+            size += len(data)
+        return GeneratedDoc(path, size, digest.hexdigest()), False
+
+    with _AtomicFile(path) as f:
+        for chunk in chunks:
+            data = chunk.encode('utf-8')
+            digest.update(data)
+            size += len(data)
+            f.write(data)
+        doc = GeneratedDoc(path, size, digest.hexdigest())
+        if _file_matches(path, size, doc.sha256):
+            return doc, False
+        f.commit()
+    return doc, True
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """
+    Write a file atomically, but only if its content differs.
+
+    Leaving identical files alone keeps their mtimes, so downstream caches
+    and validators see no change.
+
+    Returns:
+        True if the file was written
+    """
+    data = content.encode('utf-8')
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+
+    with _AtomicFile(path) as f:
+        f.write(data)
+        f.commit()
+    return True
+
+
+def templates_digest(template_dir: Path) -> str:
+    """Hash every file in the template directory (templates may include each other)."""
+    digest = hashlib.sha256()
+    if template_dir.is_dir():
+        for path in sorted(p for p in template_dir.rglob("*") if p.is_file()):
+            digest.update(path.relative_to(template_dir).as_posix().encode() + b"\0")
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _string_keys(value: Any) -> Any:
+    """Copy of ``value`` with every mapping key a string, so keys sort whatever their YAML type."""
+    if isinstance(value, dict):
+        return {
+            key if isinstance(key, str) else f"<{type(key).__name__}>{key!r}": _string_keys(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_string_keys(item) for item in value]
+    return value
+
+
+def docs_fingerprint(skill_def: Dict[str, Any], template_digest: str, templates: Optional[list] = None) -> str:
+    """Hash everything generated docs depend on: definition, templates, selection and generator version."""
+    payload = json.dumps(
+        [GENERATOR_VERSION, template_digest, sorted(templates or TEMPLATE_FILES), _string_keys(skill_def)],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _output_stats(output_dir: Path, names: List[str]) -> Dict[str, List[int]]:
+    """(mtime_ns, size) of generated files, to notice edits and deletions."""
+    stats = {}
+    for name in names:
+        output_file = TEMPLATE_FILES[name][1]
+        try:
+            stat = (output_dir / output_file).stat()
+        except OSError:
+            continue
+        stats[output_file] = [stat.st_mtime_ns, stat.st_size]
+    return stats
+
+
+def docs_up_to_date(entry: Optional[Dict[str, Any]], fingerprint: str, output_dir: Path) -> bool:
+    """True if the recorded fingerprint matches and the generated files are untouched."""
+    if not entry or entry.get('fingerprint') != fingerprint or not entry.get('files'):
+        return False
+    for output_file, recorded in entry['files'].items():
+        try:
+            stat = (output_dir / output_file).stat()
+        except OSError:
+            return False
+        if [stat.st_mtime_ns, stat.st_size] != recorded:
+            return False
+    return True
+
+
+class DocsManifest:
+    """
+    Fingerprints of previously generated docs, keyed by output directory.
+
+    Stored as JSON: {"version": GENERATOR_VERSION, "outputs": {dir: entry}},
+    where entry is {"fingerprint": ..., "files": {name: [mtime_ns, size]}}.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == GENERATOR_VERSION:
+                self.entries = manifest.get('outputs', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def get(self, output_dir: Path) -> Optional[Dict[str, Any]]:
+        return self.entries.get(str(output_dir.resolve()))
+
+    def record(self, output_dir: Path, entry: Dict[str, Any]) -> None:
+        self.entries[str(output_dir.resolve())] = entry
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".manifest-")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': GENERATOR_VERSION, 'outputs': self.entries}, f)
+            os.replace(temp_path, self.path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+
+def generate_docs_incremental(
+    skill_def: Dict[str, Any],
+    template_dir: Path,
+    output_dir: Path,
+    template_digest: str,
+    previous: Optional[Dict[str, Any]] = None,
+    templates: Optional[list] = None,
+    dry_run: bool = False,
+    env: Optional['Environment'] = None,
+    stream: bool = False
+) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """
+    Generate docs unless the recorded fingerprint shows they are current.
+
+    Args:
+        previous: Manifest entry from the last run for ``output_dir``
+        template_digest: templates_digest() of ``template_dir``
+        (other arguments as for generate_docs)
+
+    Returns:
+        (templates rendered or already current, manifest entry to record;
+        None if nothing should be recorded)
+    """
+    fingerprint = docs_fingerprint(skill_def, template_digest, templates)
+    if docs_up_to_date(previous, fingerprint, output_dir):
+        print(f"  ⏭️  Up to date: {output_dir}")
+        return len(previous['files']), previous
+
+    generated = generate_docs(
+        skill_def, template_dir, output_dir, templates=templates, dry_run=dry_run, env=env,
+        stream=stream
+    )
+    expected = [name for name in TEMPLATE_FILES if not templates or name in templates]
+    if dry_run or sorted(generated) != sorted(expected):
+        # Partial output is re-rendered next time
+        return len(generated), None
+    return len(generated), {
+        'fingerprint': fingerprint,
+        'files': _output_stats(output_dir, expected),
+    }
+
+
+def find_skill_definitions(project_root: Path) -> List[Path]:
+    """Find every skill definition file under the skill directories."""
+    definitions = []
+    for directory in SKILL_DIRECTORIES:
+        root = project_root / directory
+        if root.is_dir():
+            definitions.extend(root.rglob(DEFINITION_FILE))
+    return sorted(definitions)
+
+
+def precompile_templates(env: 'Environment', templates: Optional[list] = None) -> None:
+    """Compile the doc templates once, filling the bytecode cache for workers."""
+    for name, (template_file, _) in TEMPLATE_FILES.items():
+        if templates and name not in templates:
+            continue
+        try:
+            env.get_template(template_file)
+        except TemplateNotFound:
+            pass
+
+
+# ============================================================================
+# Bulk generation workers
+# ============================================================================
+
+# Per-process environment, created once by the pool initializer
+_worker_env: Optional['Environment'] = None
+_worker_template_dir: Optional[Path] = None
+
+
+def _init_worker(template_dir: str, bytecode_cache_dir: Optional[str]) -> None:
+    """Create one Jinja2 environment per worker, backed by the shared bytecode cache."""
+    global _worker_env, _worker_template_dir
+    _worker_template_dir = Path(template_dir)
+    _worker_env = setup_jinja_env(
+        _worker_template_dir, Path(bytecode_cache_dir) if bytecode_cache_dir else None
+    )
+
+
+def _generate_definition(
+    task: Tuple[str, Optional[list], bool, bool, str, Optional[Dict[str, Any]]]
+) -> Tuple[str, int, str, Optional[Dict[str, Any]]]:
+    """
+    Render the docs for one skill definition, unless they are up to date.
+
+    Returns:
+        (definition path, templates rendered or current, captured output,
+        manifest entry to record)
+    """
+    config_path, templates, dry_run, stream, template_digest, previous = task
+    output = io.StringIO()
+    count, entry = 0, None
+    with contextlib.redirect_stdout(output):
+        try:
+            skill_def = load_skill_definition(Path(config_path))
+            count, entry = generate_docs_incremental(
+                skill_def,
+                _worker_template_dir,
+                Path(config_path).parent,
+                template_digest,
+                previous=previous,
+                templates=templates,
+                dry_run=dry_run,
+                env=_worker_env,
+                stream=stream,
+            )
+        except SystemExit:
+            pass
+    return config_path, count, output.getvalue(), entry
+
+
+def generate_all(
+    definitions: List[Path],
+    template_dir: Path,
+    templates: Optional[list] = None,
+    dry_run: bool = False,
+    jobs: int = 0,
+    bytecode_cache_dir: Optional[Path] = None,
+    manifest: Optional[DocsManifest] = None,
+    stream: bool = False
+) -> List[Tuple[str, int, str]]:
+    """
+    Generate docs for many skill definitions, next to each definition file.
+
+    Templates are compiled once into the bytecode cache, then the
+    definitions are rendered in a pool of worker processes. With a
+    manifest, skills whose docs are up to date are skipped and the
+    manifest is updated and saved.
+
+    Args:
+        definitions: Skill definition YAML files
+        template_dir: Directory holding the templates
+        templates: Only generate these templates (default: all)
+        dry_run: Preview without writing files
+        jobs: Worker processes; 1 renders in-process, 0 uses every CPU
+        bytecode_cache_dir: Shared compiled-template cache
+        manifest: Fingerprints from earlier runs
+        stream: Render straight to files (see generate_docs)
+
+    Returns:
+        (definition path, templates rendered or current, captured output)
+        per definition, in input order
+    """
+    cache_dir = str(bytecode_cache_dir) if bytecode_cache_dir else None
+    _init_worker(str(template_dir), cache_dir)
+    precompile_templates(_worker_env, templates)
+
+    template_digest = templates_digest(template_dir)
+    tasks = [
+        (str(path), templates, dry_run, stream, template_digest,
+         manifest.get(path.parent) if manifest is not None else None)
+        for path in definitions
+    ]
+    workers = min(jobs or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        results = [_generate_definition(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(str(template_dir), cache_dir),
+        ) as executor:
+            chunk_size = max(1, len(tasks) // (workers * 4))
+            results = list(executor.map(_generate_definition, tasks, chunksize=chunk_size))
+
+    if manifest is not None and not dry_run:
+        for config_path, _, _, entry in results:
+            if entry is not None:
+                manifest.record(Path(config_path).parent, entry)
+        manifest.save()
+
+    return [(config_path, count, output) for config_path, count, output, _ in results]
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate skill documentation from Jinja2 templates"
@@ -247,10 +718,51 @@ def main():
         action="store_true",
         help="Generate sample documentation"
     )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help=f"Generate docs for every {DEFINITION_FILE} under {' and '.join(SKILL_DIRECTORIES)}"
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="With --all, worker processes (default: 0 = one per CPU; 1 = no workers)"
+    )
+    parser.add_argument(
+        "--bytecode-cache",
+        type=str,
+        default=DEFAULT_BYTECODE_CACHE_DIR,
+        help=f"Compiled template cache directory (default: {DEFAULT_BYTECODE_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--no-bytecode-cache",
+        action="store_true",
+        help="Compile templates in memory only"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Render templates straight to disk in chunks (for very large docs)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-render every skill even if its definition and the templates are unchanged"
+    )
     args = parser.parse_args()
 
     project_root = find_project_root()
     template_dir = project_root / args.templates
+    bytecode_cache_dir = None
+    if not args.no_bytecode_cache:
+        bytecode_cache_dir = Path(args.bytecode_cache)
+        if not bytecode_cache_dir.is_absolute():
+            bytecode_cache_dir = project_root / bytecode_cache_dir
+    manifest = DocsManifest(project_root / DEFAULT_MANIFEST)
+    if args.force:
+        manifest.entries = {}
 
     print("=" * 60)
     print("Skill Documentation Generator")
@@ -259,6 +771,39 @@ def main():
     print(f"Mode: {'DRY RUN' if args.dry_run else 'GENERATE'}")
     print()
 
+    if args.all:
+        if args.config or args.sample or args.output:
+            parser.error("--all cannot be combined with --config, --sample or --output")
+        definitions = find_skill_definitions(project_root)
+        print(f"Found {len(definitions)} skill definition(s)")
+
+        results = generate_all(
+            definitions,
+            template_dir,
+            templates=args.only,
+            dry_run=args.dry_run,
+            jobs=args.jobs,
+            bytecode_cache_dir=bytecode_cache_dir,
+            manifest=manifest,
+            stream=args.stream,
+        )
+
+        failed = 0
+        for config_path, count, output in results:
+            print(f"\n{config_path}")
+            print(output, end="")
+            failed += count == 0
+
+        print()
+        print("=" * 60)
+        print("SUMMARY")
+        print("=" * 60)
+        print(f"Skills processed: {len(results)}")
+        print(f"Templates processed: {sum(count for _, count, _ in results)}")
+        if failed:
+            print(f"Skills with no generated docs: {failed}")
+        sys.exit(1 if failed else 0)
+
     # Load or create skill definition
     if args.sample:
         print("Using sample skill definition...")
@@ -284,19 +829,26 @@ def main():
     print()
 
     # Generate documentation
-    generated = generate_docs(
+    count, entry = generate_docs_incremental(
         skill_def,
         template_dir,
         output_dir,
+        templates_digest(template_dir),
+        previous=manifest.get(output_dir),
         templates=args.only,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        env=setup_jinja_env(template_dir, bytecode_cache_dir),
+        stream=args.stream
     )
+    if entry is not None:
+        manifest.record(output_dir, entry)
+        manifest.save()
 
     print()
     print("=" * 60)
     print("SUMMARY")
     print("=" * 60)
-    print(f"Templates processed: {len(generated)}")
+    print(f"Templates processed: {count}")
     if not args.dry_run:
         print(f"Files written to: {output_dir}")
     else:
@@ -17,20 +17,51 @@ Usage:
 
     # Specify output directory
     python scripts/generate_skill_tests.py --skill ceo-advisor --output tests/unit/python/
+
+    # Rebuild without the analysis index
+    python scripts/generate_skill_tests.py --all --no-index
+
+    # Analyze all skills on 4 threads and report per-skill analysis time
+    python scripts/generate_skill_tests.py --all --jobs 4 --report analysis.json
+
+Python sources are parsed with ``ast`` and SKILL.md capabilities extracted
+once; the results are kept in an on-disk index (.cache/skill-tests/)
+keyed by file hash, so later runs only re-analyze files that changed.
+A dry run reads the index but does not update it.
 """
 
 import argparse
+import ast
+import hashlib
+import json
+import os
 import re
 import sys
-from dataclasses import dataclass, field
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 try:
     import yaml
 except ImportError:
     yaml = None
 
+# Make the shared package importable when run as a script
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared import frontmatter as frontmatter_reader  # noqa: E402
+
+DEFAULT_INDEX = ".cache/skill-tests/index.json"
+
+# Bump when the analysis stored in the index changes
+INDEX_VERSION = 1
+
 
 @dataclass
 class SkillCapability:
@@ -40,6 +71,27 @@ class SkillCapability:
     methods: List[str] = field(default_factory=list)
 
 
+@dataclass
+class PythonMethod:
+    """A public method of a class found in a skill's source."""
+    name: str
+    signature: str = ""
+
+
+@dataclass
+class PythonClass:
+    """A module-level class found in a skill's source."""
+    name: str
+    methods: List[PythonMethod] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PythonClass":
+        return cls(
+            name=data["name"],
+            methods=[PythonMethod(**method) for method in data.get("methods", [])]
+        )
+
+
 @dataclass
 class SkillInfo:
     """Information extracted from a skill's SKILL.md."""
@@ -51,6 +103,98 @@ class SkillInfo:
     has_python_src: bool = False
     python_classes: List[str] = field(default_factory=list)
     category: str = "general"
+    class_methods: Dict[str, List[PythonMethod]] = field(default_factory=dict)
+
+
+class SkillIndex:
+    """
+    On-disk cache of per-file analysis results, keyed by file hash.
+
+    Stored as JSON: {"version": INDEX_VERSION, "paths": {path: [mtime_ns,
+    size, sha256]}, "entries": {"kind:sha256": result}}. A file whose
+    mtime and size match its recorded stat is not read at all; otherwise
+    it is hashed and only analyzed if no result exists for its content.
+    Without a path the index only lives for the current run. Lookups are
+    safe to make from several threads.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.paths: Dict[str, List] = {}
+        self.entries: Dict[str, Any] = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if path is None:
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') == INDEX_VERSION:
+                self.paths = index.get('paths', {})
+                self.entries = index.get('entries', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def lookup(self, file_path: Path, kind: str, analyze: Callable[[bytes], Any]) -> Any:
+        """
+        Return the cached ``kind`` analysis of a file, computing it if needed.
+
+        Args:
+            file_path: File to analyze
+            kind: Name of the analysis (files may be analyzed more than one way)
+            analyze: Builds a JSON-serializable result from the file's bytes
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        key_path = str(file_path.resolve())
+        stat = os.stat(key_path)
+        with self._lock:
+            recorded = self.paths.get(key_path)
+            if recorded and recorded[0] == stat.st_mtime_ns and recorded[1] == stat.st_size:
+                key = f"{kind}:{recorded[2]}"
+                if key in self.entries:
+                    self.hits += 1
+                    return self.entries[key]
+
+        with open(key_path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        key = f"{kind}:{digest}"
+        with self._lock:
+            self.paths[key_path] = [stat.st_mtime_ns, stat.st_size, digest]
+            self.dirty = True
+            if key in self.entries:
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+
+        # Analyze outside the lock; a concurrent duplicate just recomputes
+        result = analyze(data)
+        with self._lock:
+            return self.entries.setdefault(key, result)
+
+    def save(self) -> None:
+        """Write the index atomically, dropping results no file refers to."""
+        if self.path is None or not self.dirty:
+            return
+        live = {record[2] for record in self.paths.values()}
+        self.entries = {
+            key: value for key, value in self.entries.items()
+            if key.split(":", 1)[1] in live
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".index-")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'paths': self.paths, 'entries': self.entries}, f)
+            os.replace(temp_path, self.path)
+            self.dirty = False
+        except OSError:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
 
 
 def find_project_root() -> Path:
@@ -59,23 +203,22 @@ def find_project_root() -> Path:
     return script_dir.parent
 
 
-def extract_frontmatter(content: str) -> Optional[Dict]:
-    """Extract YAML frontmatter from markdown content."""
-    if not content.startswith("---"):
-        return None
+def extract_frontmatter(source: Union[Path, str]) -> Optional[Dict]:
+    """
+    Extract YAML frontmatter from a SKILL.md file or its content.
 
-    end_match = content.find("\n---", 3)
-    if end_match == -1:
+    A ``Path`` is read only up to the end of the frontmatter block; a
+    ``str`` is the markdown content itself.
+    """
+    if not yaml:
+        return None
+    try:
+        if isinstance(source, str):
+            text = frontmatter_reader.split_frontmatter(source.splitlines(keepends=True)).text
+            return frontmatter_reader.parse_frontmatter(text) if text is not None else None
+        return frontmatter_reader.load_frontmatter(source)
+    except (OSError, UnicodeDecodeError, yaml.YAMLError):
         return None
-
-    frontmatter_text = content[3:end_match].strip()
-
-    if yaml:
-        try:
-            return yaml.safe_load(frontmatter_text)
-        except yaml.YAMLError:
-            return None
-    return None
 
 
 def extract_capabilities(content: str) -> List[SkillCapability]:
@@ -109,52 +252,98 @@ def extract_capabilities(content: str) -> List[SkillCapability]:
     return capabilities[:10]  # Limit to 10 capabilities
 
 
-def find_python_classes(skill_path: Path) -> List[str]:
-    """Find Python class names in skill source directory."""
+def _analyze_capabilities(data: bytes) -> List[str]:
+    """Index builder: capability names found in SKILL.md bytes."""
+    return [capability.name for capability in extract_capabilities(data.decode("utf-8"))]
+
+
+def parse_python_classes(source: str) -> List[PythonClass]:
+    """
+    Find module-level classes, their public methods and signatures.
+
+    Falls back to matching ``class`` lines (without methods) if the source
+    does not parse.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return [PythonClass(name=match.group(1))
+                for match in re.finditer(r"^class\s+(\w+)", source, re.MULTILINE)]
+
     classes = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        methods = [
+            PythonMethod(name=item.name, signature=ast.unparse(item.args))
+            for item in node.body
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and not item.name.startswith("_")
+        ]
+        classes.append(PythonClass(name=node.name, methods=methods))
+    return classes
+
+
+def _analyze_python(data: bytes) -> List[Dict[str, Any]]:
+    """Index builder: classes found in Python source bytes."""
+    return [asdict(cls) for cls in parse_python_classes(data.decode("utf-8"))]
+
+
+def find_python_api(skill_path: Path, index: Optional[SkillIndex] = None) -> List[PythonClass]:
+    """Find module-level classes and their public methods in a skill's src directory."""
+    classes: List[PythonClass] = []
     src_dir = skill_path / "src"
 
     if not src_dir.exists():
         return classes
 
+    index = index if index is not None else SkillIndex()
     for py_file in src_dir.glob("*.py"):
         try:
-            content = py_file.read_text()
-            # Find class definitions
-            class_pattern = r"^class\s+(\w+)"
-            for match in re.finditer(class_pattern, content, re.MULTILINE):
-                classes.append(match.group(1))
-        except (IOError, UnicodeDecodeError):
-            pass
+            found = index.lookup(py_file, "python", _analyze_python)
+        except (OSError, UnicodeDecodeError):
+            continue
+        classes.extend(PythonClass.from_dict(data) for data in found)
 
     return classes
 
 
-def analyze_skill(skill_path: Path) -> Optional[SkillInfo]:
-    """Analyze a skill directory and extract information."""
+def find_python_classes(skill_path: Path, index: Optional[SkillIndex] = None) -> List[str]:
+    """Find Python class names in skill source directory."""
+    return [cls.name for cls in find_python_api(skill_path, index)]
+
+
+def analyze_skill(skill_path: Path, index: Optional[SkillIndex] = None) -> Optional[SkillInfo]:
+    """
+    Analyze a skill directory and extract information.
+
+    Args:
+        skill_path: Skill directory containing SKILL.md
+        index: Analysis index to reuse results from (default: analyze afresh)
+    """
     skill_md = skill_path / "SKILL.md"
 
     if not skill_md.exists():
         return None
 
+    index = index if index is not None else SkillIndex()
     try:
-        content = skill_md.read_text()
-    except (IOError, UnicodeDecodeError):
+        capability_names = index.lookup(skill_md, "capabilities", _analyze_capabilities)
+    except (OSError, UnicodeDecodeError):
         return None
 
     # Extract frontmatter
-    frontmatter = extract_frontmatter(content) or {}
+    frontmatter = extract_frontmatter(skill_md) or {}
 
     name = frontmatter.get("name", skill_path.name)
     version = frontmatter.get("version", "1.0.0")
     description = frontmatter.get("description", "")
     category = frontmatter.get("category", "general")
 
-    # Extract capabilities
-    capabilities = extract_capabilities(content)
+    capabilities = [SkillCapability(name=name) for name in capability_names]
 
     # Find Python classes
-    python_classes = find_python_classes(skill_path)
+    python_api = find_python_api(skill_path, index)
 
     return SkillInfo(
         name=name,
@@ -163,8 +352,9 @@ def analyze_skill(skill_path: Path) -> Optional[SkillInfo]:
         path=skill_path,
         capabilities=capabilities,
         has_python_src=(skill_path / "src").exists(),
-        python_classes=python_classes,
-        category=category
+        python_classes=[cls.name for cls in python_api],
+        category=category,
+        class_methods={cls.name: cls.methods for cls in python_api}
     )
 
 
@@ -296,6 +486,16 @@ def generate_test_template(skill_info: SkillInfo) -> str:
         "        pass",
         "",
     ]
+
+    # Add a test per public method of the primary class
+    for method in skill_info.class_methods.get(primary_class, [])[:5]:
+        main_class.extend([
+            f"    def test_{sanitize_name(method.name)}(self):",
+            f'        """Test {primary_class}.{method.name}({method.signature})."""',
+            f"        # TODO: Implement {method.name} test",
+            "        pass",
+            "",
+        ])
     test_classes.extend(main_class)
 
     # Add capability-specific test classes
@@ -412,6 +612,82 @@ def find_skill(project_root: Path, skill_name: str) -> Optional[Path]:
     return None
 
 
+def analyze_all(
+    skill_paths: List[Path],
+    index: Optional[SkillIndex] = None,
+    jobs: int = 0
+) -> List[Tuple[Path, Optional[SkillInfo], float]]:
+    """
+    Analyze many skills concurrently.
+
+    Threads share one index, so a file's analysis is stored once however
+    many skills are in flight.
+
+    Args:
+        skill_paths: Skill directories to analyze
+        index: Analysis index to reuse results from
+        jobs: Worker threads; 1 analyzes serially, 0 uses one per CPU
+
+    Returns:
+        (skill path, SkillInfo or None, seconds spent) per skill, in input order
+    """
+    index = index if index is not None else SkillIndex()
+
+    def timed(skill_path: Path) -> Tuple[Path, Optional[SkillInfo], float]:
+        start = time.perf_counter()
+        skill_info = analyze_skill(skill_path, index)
+        return skill_path, skill_info, time.perf_counter() - start
+
+    workers = min(jobs or os.cpu_count() or 1, len(skill_paths))
+    if workers <= 1:
+        return [timed(skill_path) for skill_path in skill_paths]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(timed, skill_paths))
+
+
+def write_templates(templates: List[Tuple[Path, str]]) -> List[Path]:
+    """Write generated templates, creating each output directory once."""
+    for directory in {test_path.parent for test_path, _ in templates}:
+        directory.mkdir(parents=True, exist_ok=True)
+    for test_path, template in templates:
+        test_path.write_text(template)
+    return [test_path for test_path, _ in templates]
+
+
+def build_report(
+    results: List[Tuple[Path, Optional[SkillInfo], float]],
+    jobs: int,
+    total_seconds: float,
+    index: SkillIndex
+) -> Dict[str, Any]:
+    """
+    Summarize per-skill analysis times, slowest first.
+
+    Returns:
+        {"jobs", "total_seconds", "index": {"hits", "misses"}, "skills":
+        [{"skill", "path", "seconds", "analyzed", "capabilities",
+        "python_classes"}]}
+    """
+    skills = [
+        {
+            "skill": skill_info.name if skill_info else skill_path.name,
+            "path": str(skill_path),
+            "seconds": round(seconds, 6),
+            "analyzed": skill_info is not None,
+            "capabilities": len(skill_info.capabilities) if skill_info else 0,
+            "python_classes": len(skill_info.python_classes) if skill_info else 0,
+        }
+        for skill_path, skill_info, seconds in results
+    ]
+    skills.sort(key=lambda entry: entry["seconds"], reverse=True)
+    return {
+        "jobs": jobs,
+        "total_seconds": round(total_seconds, 6),
+        "index": {"hits": index.hits, "misses": index.misses},
+        "skills": skills,
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate pytest test templates for skills"
@@ -442,6 +718,29 @@ def main():
         action="store_true",
         help="Overwrite existing test files"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="Worker threads for analyzing skills (default: 0 = one per CPU; 1 = serial)"
+    )
+    parser.add_argument(
+        "--report",
+        type=str,
+        help="Write a JSON report of per-skill analysis time to this file"
+    )
+    parser.add_argument(
+        "--index",
+        type=str,
+        default=DEFAULT_INDEX,
+        help=f"Analysis index file (default: {DEFAULT_INDEX})"
+    )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help="Analyze every file afresh without reading or writing the index"
+    )
     args = parser.parse_args()
 
     if not args.skill and not args.all:
@@ -450,6 +749,7 @@ def main():
     project_root = find_project_root()
     output_dir = project_root / args.output
     existing_tests = get_existing_tests(project_root)
+    index = SkillIndex(None if args.no_index else project_root / args.index)
 
     print("=" * 60)
     print("Skill Test Template Generator")
@@ -482,9 +782,12 @@ def main():
     print(f"Skills to process: {len(skills_to_process)}")
     print()
 
-    generated_count = 0
-    for skill_path in skills_to_process:
-        skill_info = analyze_skill(skill_path)
+    start = time.perf_counter()
+    results = analyze_all(skills_to_process, index, args.jobs)
+    analysis_seconds = time.perf_counter() - start
+
+    pending: List[Tuple[Path, str]] = []
+    for skill_path, skill_info, _ in results:
         if not skill_info:
             print(f"⚠️  Could not analyze: {skill_path.name}")
             continue
@@ -512,17 +815,34 @@ def main():
             if test_path.exists() and not args.force:
                 print(f"\n  ⚠️  Skipping (exists): {test_path}")
                 continue
+            pending.append((test_path, template))
 
-            output_dir.mkdir(parents=True, exist_ok=True)
-            test_path.write_text(template)
-            print(f"\n  ✅ Generated: {test_path}")
+    generated_count = 0
+    if pending:
+        print()
+        for test_path in write_templates(pending):
+            print(f"  ✅ Generated: {test_path}")
             generated_count += 1
 
+    if not args.dry_run:
+        index.save()
+
+    if args.report:
+        report = build_report(results, args.jobs, analysis_seconds, index)
+        report_path = Path(args.report)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
     print()
     print("=" * 60)
     print("SUMMARY")
     print("=" * 60)
     print(f"Skills analyzed: {len(skills_to_process)}")
+    print(f"Files reused from index: {index.hits} (analyzed: {index.misses})")
+    print(f"Analysis time: {analysis_seconds:.3f}s")
+    if args.report:
+        print(f"Report: {args.report}")
     if not args.dry_run:
         print(f"Test files generated: {generated_count}")
     else:
@@ -6,7 +6,14 @@ Validates that all Claude skills follow the expected directory structure
 and include required files with proper frontmatter.
 
 Usage:
-    python scripts/validate_skill_structure.py [--config CONFIG] [--verbose]
+    python scripts/validate_skill_structure.py [--config CONFIG] [--verbose] [--jobs N]
+        [--changed-since REF] [--cache [--cache-dir DIR]]
+        [--watch [--poll] [--poll-interval SECONDS]]
+
+With --cache, results are cached per skill in .cache/skill-validation/ and
+reused while the skill's files and the configuration are unchanged. With
+--watch the script keeps running and revalidates a skill whenever one of its
+files changes.
 
 Exit codes:
     0 - All validations passed
@@ -15,13 +22,22 @@ Exit codes:
 """
 
 import argparse
+import contextlib
 import fnmatch
+import hashlib
+import json
 import os
+import queue
 import re
+import subprocess
 import sys
-from dataclasses import dataclass, field
+import tempfile
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
 
 try:
     import yaml
@@ -29,6 +45,23 @@ except ImportError:
     print("❌ Error: PyYAML is required. Install with: pip install pyyaml")
     sys.exit(2)
 
+# Prefer the libyaml C loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Make the shared package importable when run as a script
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared import frontmatter  # noqa: E402
+
+# watchdog is optional (pip install watchdog, or the "watch" extra in
+# pyproject.toml); --watch falls back to polling without it
+try:
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None  # type: ignore
+
 
 @dataclass
 class ValidationResult:
@@ -61,6 +94,150 @@ class SkillValidationSummary:
         return len(self.errors) + len(self.warnings)
 
 
+# Per-thread buffer for diagnostics printed while validating one skill
+_diagnostics = threading.local()
+
+# Bump when validation logic changes so cached results are discarded
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = ".cache/skill-validation"
+
+# --watch: polling interval when file system events are unavailable (each
+# poll stats every checked file), and how long to wait for more events after
+# the first (editors save in several steps)
+WATCH_POLL_INTERVAL = 0.5
+WATCH_DEBOUNCE = 0.02
+
+
+def _sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _stat_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a path, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class ValidationCache:
+    """
+    JSON manifest of per-skill validation results.
+
+    Each entry records the skill's checked files (modification time, size
+    and content hash) and the validation results. An entry is reused only
+    if every file still has the same content. Unchanged timestamps skip
+    rehashing, and a touched-but-identical file is rehashed and still hits.
+    The whole manifest is discarded when the configuration or CACHE_VERSION
+    changes.
+    """
+
+    def __init__(self, cache_dir: Path, config_hash: str):
+        """
+        Args:
+            cache_dir: Directory holding manifest.json (created on save)
+            config_hash: Hash of the validation configuration
+        """
+        self.path = Path(cache_dir) / "manifest.json"
+        self.key = f"{CACHE_VERSION}:{config_hash}"
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('key') == self.key:
+                self.entries = manifest.get('skills', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    @staticmethod
+    def _file_state(path: Path, previous: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Describe a file, reusing the previous hash if its stat is unchanged."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        state = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+        if previous and previous['mtime_ns'] == stat.st_mtime_ns and previous['size'] == stat.st_size:
+            state['sha256'] = previous['sha256']
+        else:
+            state['sha256'] = _sha256(path)
+        return state
+
+    def inputs(self, skill_key: str, skill_path: Path, file_names: List[str]) -> Dict[str, Any]:
+        """Return the current state of a skill's checked files."""
+        previous = self.entries.get(skill_key, {}).get('files', {})
+        return {name: self._file_state(skill_path / name, previous.get(name)) for name in file_names}
+
+    def lookup(self, skill_key: str, inputs: Dict[str, Any]) -> Optional[Tuple[SkillValidationSummary, List[str]]]:
+        """Return the cached summary and diagnostics if the inputs are unchanged."""
+        entry = self.entries.get(skill_key)
+        unchanged = entry is not None and set(entry['files']) == set(inputs) and all(
+            (state is None) == (entry['files'][name] is None)
+            and (state is None or state['sha256'] == entry['files'][name]['sha256'])
+            for name, state in inputs.items()
+        )
+        with self._lock:
+            if not unchanged:
+                self.misses += 1
+                return None
+            self.hits += 1
+            entry['files'] = inputs
+
+        summary = SkillValidationSummary(**{
+            key: value for key, value in entry['summary'].items()
+            if key not in ('errors', 'warnings', 'info')
+        })
+        for severity in ('errors', 'warnings', 'info'):
+            getattr(summary, severity).extend(
+                ValidationResult(**result) for result in entry['summary'][severity]
+            )
+        return summary, list(entry['diagnostics'])
+
+    def store(self, skill_key: str, inputs: Dict[str, Any],
+              summary: SkillValidationSummary, diagnostics: List[str]) -> None:
+        """Record a freshly computed result."""
+        with self._lock:
+            self.entries[skill_key] = {
+                'files': inputs,
+                'summary': asdict(summary),
+                'diagnostics': diagnostics,
+            }
+
+    def save(self, keep: Optional[Set[str]] = None) -> None:
+        """
+        Write the manifest atomically; an unwritable cache directory is
+        skipped, leaving results uncached.
+
+        Args:
+            keep: If given, drop entries for skills not in this set
+        """
+        if keep is not None:
+            self.entries = {key: entry for key, entry in self.entries.items() if key in keep}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".manifest-")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'key': self.key, 'skills': self.entries}, f)
+            os.replace(temp_path, self.path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+
 class SkillStructureValidator:
     """Validates Claude skill directory structure."""
 
@@ -76,6 +253,8 @@ class SkillStructureValidator:
         self.verbose = verbose
         self.config = self._load_config()
         self.project_root = self._find_project_root()
+        # Latest result per skill while watching, keyed "<type>:<path>"
+        self._watch_state: Dict[str, SkillValidationSummary] = {}
 
     def _find_project_root(self) -> Path:
         """Find the project root directory."""
@@ -87,7 +266,7 @@ class SkillStructureValidator:
         """Load and parse configuration file."""
         try:
             with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=YAML_LOADER)
             return config
         except FileNotFoundError:
             print(f"❌ Error: Configuration file not found: {self.config_path}")
@@ -141,26 +320,28 @@ class SkillStructureValidator:
             Dictionary of frontmatter fields or None if not found/invalid
         """
         try:
-            with open(skill_md_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Match YAML frontmatter (between --- markers)
-            pattern = r'^---\s*\n(.*?)\n---\s*\n'
-            match = re.match(pattern, content, re.DOTALL)
-
-            if not match:
-                return None
-
-            frontmatter_yaml = match.group(1)
-            frontmatter = yaml.safe_load(frontmatter_yaml)
-
-            return frontmatter if isinstance(frontmatter, dict) else None
-
+            data = frontmatter.load_frontmatter(skill_md_path)
+            return data if isinstance(data, dict) else None
         except Exception as e:
-            if self.verbose:
-                print(f"⚠️  Error extracting frontmatter from {skill_md_path}: {e}")
+            self._print_diagnostic(f"⚠️  Error extracting frontmatter from {skill_md_path}: {e}")
             return None
 
+    def _print_diagnostic(self, message: str) -> None:
+        """Print a verbose diagnostic, or buffer it while validating a skill in validate_all."""
+        buffer = getattr(_diagnostics, "messages", None)
+        if buffer is not None:
+            buffer.append(message)
+        elif self.verbose:
+            print(message)
+
+    def _validate_buffered(self, skill_path: Path, skill_type: str) -> Tuple[SkillValidationSummary, List[str]]:
+        """Validate a skill, returning its diagnostics instead of printing them."""
+        _diagnostics.messages = []
+        try:
+            return self.validate_skill(skill_path, skill_type), _diagnostics.messages
+        finally:
+            _diagnostics.messages = None
+
     def _validate_file_presence(
         self,
         skill_path: Path,
@@ -493,40 +674,395 @@ class SkillStructureValidator:
 
         return summary
 
-    def validate_all(self) -> List[SkillValidationSummary]:
+    def validate_all(
+        self,
+        jobs: int = 1,
+        use_threads: bool = False,
+        cache: Optional[ValidationCache] = None,
+        changed_files: Optional[Set[Path]] = None
+    ) -> List[SkillValidationSummary]:
         """
         Validate all skills in configured directories.
 
+        Arguments are those of iter_validate().
+
         Returns:
             List of SkillValidationSummary for each skill
         """
-        all_summaries = []
+        return list(self.iter_validate(
+            jobs=jobs, use_threads=use_threads, cache=cache, changed_files=changed_files
+        ))
 
+    def iter_validate(
+        self,
+        jobs: int = 1,
+        use_threads: bool = False,
+        cache: Optional[ValidationCache] = None,
+        changed_files: Optional[Set[Path]] = None
+    ) -> Iterator[SkillValidationSummary]:
+        """
+        Validate all skills in configured directories, yielding each result as it is ready.
+
+        With ``jobs`` other than 1, skills are validated in a worker pool.
+        Results and diagnostics are emitted in discovery order, so the
+        output is identical to a serial run.
+
+        Args:
+            jobs: Parallel workers; 1 validates in-process, 0 uses every CPU
+            use_threads: Use a thread pool instead of worker processes
+                (enough when validation is dominated by file system latency;
+                processes also parallelize YAML parsing)
+            cache: Reuse and record results for skills whose files are
+                unchanged; saved once every skill has been yielded
+            changed_files: If given, only validate skills containing one of
+                these (absolute) paths
+
+        Yields:
+            SkillValidationSummary for each skill
+        """
         skill_directories = self.config['settings']['skill_directories']
+        workers = jobs or os.cpu_count() or 1
+        executor: Optional[Executor] = None
+        changed_dirs = None
+        if changed_files is not None:
+            changed_dirs = {parent for path in changed_files for parent in path.parents}
+        seen_keys: Set[str] = set()
 
-        for directory in skill_directories:
-            # Determine skill type
-            skill_type = "managed" if ".claude/skills" in directory else "user"
+        try:
+            for directory in skill_directories:
+                # Determine skill type
+                skill_type = "managed" if ".claude/skills" in directory else "user"
+
+                # Find all skills in this directory
+                skills = self._find_skills(directory)
+                if changed_dirs is not None:
+                    skills = [path for path in skills if path.resolve() in changed_dirs]
+
+                if self.verbose:
+                    print(f"\n🔍 Scanning {directory} ({len(skills)} skills found)")
+
+                # Reuse cached results; collect the skills that need work
+                results: List[Optional[Tuple[SkillValidationSummary, List[str]]]] = []
+                keys: List[str] = []
+                inputs: List[Dict[str, Any]] = []
+                checked_files = self._checked_files(skill_type)
+                for skill_path in skills:
+                    key = f"{skill_type}:{skill_path}"
+                    keys.append(key)
+                    if cache is None:
+                        results.append(None)
+                        continue
+                    seen_keys.add(key)
+                    inputs.append(cache.inputs(key, skill_path, checked_files))
+                    results.append(cache.lookup(key, inputs[-1]))
+                tasks = [(str(skill_path), skill_type)
+                         for skill_path, result in zip(skills, results, strict=True) if result is None]
+
+                if workers != 1 and len(tasks) > 1 and executor is None:
+                    executor = self._create_executor(workers, use_threads)
+                if executor is None:
+                    computed = map(_validate_in_thread(self), tasks)
+                else:
+                    worker = _validate_in_thread(self) if use_threads else _validate_in_process
+                    chunk_size = max(1, len(tasks) // (workers * 4))
+                    computed = executor.map(worker, tasks, chunksize=chunk_size)
+
+                # Hand each result on as soon as it and everything before it is ready
+                for index, result in enumerate(results):
+                    results[index] = None
+                    if result is None:
+                        result = next(computed)
+                        if cache is not None:
+                            cache.store(keys[index], inputs[index], *result)
+                    summary, messages = result
+                    if self.verbose:
+                        for message in messages:
+                            print(message)
+                    yield summary
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if cache is not None:
+            # A partial run keeps entries for the skills it did not visit
+            cache.save(keep=seen_keys if changed_files is None else None)
+
+    def _checked_files(self, skill_type: str) -> List[str]:
+        """Names of the files whose contents determine a skill's results."""
+        skill_config = self.config[f'{skill_type}_skills']
+        names = {"SKILL.md"}
+        for key in ('required_files', 'recommended_files'):
+            names.update(file_config['name'] for file_config in skill_config.get(key, []))
+        return sorted(names)
+
+    def config_hash(self) -> str:
+        """Hash of the configuration file and the validation code, used to key the validation cache."""
+        return hashlib.sha256(
+            (_sha256(self.config_path) + _sha256(Path(__file__))
+             + _sha256(Path(frontmatter.__file__))).encode()
+        ).hexdigest()
+
+    def changed_since(self, ref: str) -> Optional[Set[Path]]:
+        """
+        Files changed relative to a git ref, including uncommitted and untracked files.
 
-            # Find all skills in this directory
-            skills = self._find_skills(directory)
+        Args:
+            ref: Any git revision (e.g. "HEAD", "origin/main")
 
+        Returns:
+            Set of absolute paths, or None if the configuration itself
+            changed (every skill must then be revalidated)
+        """
+        commands = [
+            ["git", "diff", "--name-only", "-z", ref, "--"],
+            ["git", "ls-files", "--others", "--exclude-standard", "-z"],
+        ]
+        changed: Set[Path] = set()
+        for command in commands:
+            try:
+                output = subprocess.run(
+                    command, cwd=self.project_root, capture_output=True, check=True
+                ).stdout
+            except (OSError, subprocess.CalledProcessError) as e:
+                stderr = getattr(e, 'stderr', b'') or b''
+                print(f"❌ Error: cannot list changes since {ref}: {stderr.decode().strip() or e}")
+                sys.exit(2)
+            changed.update(
+                (self.project_root / name).resolve()
+                for name in output.decode('utf-8').split('\0') if name
+            )
+        if self.config_path.resolve() in changed:
+            return None
+        return changed
+
+    def _skill_roots(self) -> List[Tuple[Path, str]]:
+        """Configured skill directories with the type of skill they hold."""
+        return [
+            (self.project_root / directory, "managed" if ".claude/skills" in directory else "user")
+            for directory in self.config['settings']['skill_directories']
+        ]
+
+    def _locate_skill(self, path: Path) -> Optional[Tuple[Path, str]]:
+        """
+        Map a changed path to the skill whose results it can affect.
+
+        Returns:
+            (skill directory, skill type), or None for paths validation
+            does not look at (e.g. editor swap files or source code)
+        """
+        for root, skill_type in self._skill_roots():
+            try:
+                relative = path.relative_to(root.resolve())
+            except ValueError:
+                continue
+            if not relative.parts:
+                return None
+            if len(relative.parts) == 1 or relative.as_posix().split('/', 1)[1] in self._checked_files(skill_type):
+                return root / relative.parts[0], skill_type
+            return None
+        return None
+
+    def _watch_snapshot(self) -> Dict[Path, Optional[Tuple[int, int]]]:
+        """Stat the configuration, every skill directory and its checked files."""
+        snapshot = {self.config_path.resolve(): _stat_signature(self.config_path)}
+        for root, skill_type in self._skill_roots():
+            resolved = root.resolve()
+            checked_files = self._checked_files(skill_type)
+            try:
+                entries = [entry.name for entry in os.scandir(resolved) if entry.is_dir()]
+            except OSError:
+                continue
+            for name in entries:
+                if self._should_exclude(root / name):
+                    continue
+                skill_dir = resolved / name
+                snapshot[skill_dir] = _stat_signature(skill_dir)
+                for file_name in checked_files:
+                    snapshot[skill_dir / file_name] = _stat_signature(skill_dir / file_name)
+        return snapshot
+
+    def _poll_changes(self, changes: "queue.Queue[Path]", interval: float, stop: threading.Event) -> None:
+        """Feed paths whose stat changed into ``changes`` until ``stop`` is set."""
+        previous = self._watch_snapshot()
+        while not stop.wait(interval):
+            current = self._watch_snapshot()
+            for path in previous.keys() | current.keys():
+                if path not in previous or path not in current or previous[path] != current[path]:
+                    changes.put(path)
+            previous = current
+
+    def _start_observer(self, changes: "queue.Queue[Path]"):
+        """Start a watchdog observer feeding ``changes``, or return None if unavailable."""
+        if Observer is None:
+            return None
+        handler = _QueueEventHandler(changes)
+        observer = Observer()
+        for root, _ in self._skill_roots():
+            if root.is_dir():
+                observer.schedule(handler, str(root.resolve()), recursive=True)
+        observer.schedule(handler, str(self.config_path.resolve().parent), recursive=False)
+        observer.start()
+        return observer
+
+    def refresh(self, changed_paths: Iterable[Path]) -> List[SkillValidationSummary]:
+        """
+        Revalidate the skills affected by changed paths and update the watch state.
+
+        A change to the configuration file reloads it and revalidates every
+        skill; a deleted skill directory is dropped from the state.
+
+        Args:
+            changed_paths: Files or directories that changed
+
+        Returns:
+            Summaries of the skills that were revalidated
+        """
+        changed = {Path(path).resolve() for path in changed_paths}
+
+        if self.config_path.resolve() in changed:
+            try:
+                self.config = self._load_config()
+            except SystemExit:
+                print("⚠️  Keeping the previous configuration")
+                return []
+            summaries = self.validate_all()
+            self._watch_state = {f"{s.skill_type}:{s.skill_path}": s for s in summaries}
+            return summaries
+
+        affected: Dict[str, Tuple[Path, str]] = {}
+        for path in sorted(changed):
+            located = self._locate_skill(path)
+            if located is not None:
+                affected.setdefault(f"{located[1]}:{located[0]}", located)
+
+        summaries = []
+        for key, (skill_path, skill_type) in affected.items():
+            if not skill_path.is_dir() or self._should_exclude(skill_path):
+                if self._watch_state.pop(key, None) is not None:
+                    print(f"🗑️  {skill_path.name} ({skill_type}) removed")
+                continue
+            summary, messages = self._validate_buffered(skill_path, skill_type)
             if self.verbose:
-                print(f"\n🔍 Scanning {directory} ({len(skills)} skills found)")
+                for message in messages:
+                    print(message)
+            self._watch_state[key] = summary
+            summaries.append(summary)
+        return summaries
+
+    def _print_watch_update(self, summaries: List[SkillValidationSummary], elapsed: float) -> None:
+        """Print the results of one revalidation in watch mode."""
+        stamp = time.strftime('%H:%M:%S')
+        for summary in summaries:
+            if summary.is_valid:
+                print(f"[{stamp}] ✅ {summary.skill_name} ({summary.skill_type}) is valid")
+            else:
+                print(f"[{stamp}] ❌ {summary.skill_name} ({summary.skill_type}): "
+                      f"{len(summary.errors)} error(s)")
+                for error in summary.errors:
+                    print(f"     {error.message}")
+            if self.verbose:
+                for warning in summary.warnings:
+                    print(f"     {warning.message}")
+        valid = sum(1 for s in self._watch_state.values() if s.is_valid)
+        print(f"           {valid}/{len(self._watch_state)} skill(s) valid, "
+              f"checked in {elapsed * 1000:.0f} ms")
 
-            for skill_path in skills:
-                summary = self.validate_skill(skill_path, skill_type)
-                all_summaries.append(summary)
+    def watch(
+        self,
+        jobs: int = 1,
+        use_threads: bool = False,
+        cache: Optional[ValidationCache] = None,
+        use_polling: bool = False,
+        poll_interval: float = WATCH_POLL_INTERVAL,
+        stop: Optional[threading.Event] = None
+    ) -> None:
+        """
+        Validate all skills, then revalidate each skill as its files change.
 
-        return all_summaries
+        Results stay in memory between changes, and frontmatter is only
+        re-parsed for files whose mtime or size changed, so a save is
+        reported within a few tens of milliseconds of being noticed. Uses
+        file system events when watchdog is installed, and stat polling
+        (every ``poll_interval`` seconds) otherwise.
 
-    def print_summary(self, summaries: List[SkillValidationSummary]) -> None:
+        Args:
+            jobs, use_threads, cache: As for validate_all() (initial run only)
+            use_polling: Poll even if watchdog is available (e.g. network drives)
+            poll_interval: Seconds between polls
+            stop: Event that ends watching when set (default: run until Ctrl+C)
+        """
+        summaries = self.validate_all(jobs=jobs, use_threads=use_threads, cache=cache)
+        self._watch_state = {
+            f"{s.skill_type}:{s.skill_path}": s for s in summaries
+        }
+        self.print_summary(summaries)
+
+        stop = stop or threading.Event()
+        changes: queue.Queue[Path] = queue.Queue()
+        observer = None if use_polling else self._start_observer(changes)
+        poller = None
+        if observer is None:
+            poller = threading.Thread(
+                target=self._poll_changes, args=(changes, poll_interval, stop), daemon=True
+            )
+            poller.start()
+            source = f"polling every {poll_interval * 1000:.0f} ms"
+        else:
+            source = "file system events"
+        print(f"👀 Watching {len(self._watch_state)} skill(s) for changes ({source}); press Ctrl+C to stop",
+              flush=True)
+
+        try:
+            while not stop.is_set():
+                try:
+                    batch = {changes.get(timeout=0.1)}
+                except queue.Empty:
+                    continue
+                deadline = time.monotonic() + WATCH_DEBOUNCE
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.add(changes.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+
+                started = time.perf_counter()
+                updated = self.refresh(batch)
+                if updated:
+                    self._print_watch_update(updated, time.perf_counter() - started)
+                sys.stdout.flush()
+        except KeyboardInterrupt:
+            print()
+        finally:
+            stop.set()
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            if poller is not None:
+                poller.join()
+
+    def _create_executor(self, workers: int, use_threads: bool) -> Executor:
+        """Create the worker pool for parallel validation."""
+        if use_threads:
+            return ThreadPoolExecutor(max_workers=workers)
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(str(self.config_path), self.verbose, str(self.project_root)),
+        )
+
+    def print_summary(self, summaries: List[SkillValidationSummary],
+                      stream: Optional[TextIO] = None) -> None:
         """
         Print validation summary to console.
 
         Args:
             summaries: List of validation summaries
+            stream: Where to write the summary (default: stdout)
         """
+        out = stream or sys.stdout
         total_skills = len(summaries)
         valid_skills = sum(1 for s in summaries if s.is_valid)
         invalid_skills = total_skills - valid_skills
@@ -534,60 +1070,261 @@ class SkillStructureValidator:
         total_errors = sum(len(s.errors) for s in summaries)
         total_warnings = sum(len(s.warnings) for s in summaries)
 
-        print("\n" + "=" * 70)
-        print("SKILL STRUCTURE VALIDATION SUMMARY")
-        print("=" * 70)
+        print("\n" + "=" * 70, file=out)
+        print("SKILL STRUCTURE VALIDATION SUMMARY", file=out)
+        print("=" * 70, file=out)
 
         # Print invalid skills first
         if invalid_skills > 0:
-            print(f"\n❌ {invalid_skills} skill(s) with errors:\n")
+            print(f"\n❌ {invalid_skills} skill(s) with errors:\n", file=out)
 
             for summary in summaries:
                 if not summary.is_valid:
-                    print(f"  📁 {summary.skill_name} ({summary.skill_type})")
+                    print(f"  📁 {summary.skill_name} ({summary.skill_type})", file=out)
 
                     # Print errors
                     for error in summary.errors:
-                        print(f"     {error.message}")
+                        print(f"     {error.message}", file=out)
 
                     # Print warnings if verbose
                     if self.verbose and summary.warnings:
                         for warning in summary.warnings:
-                            print(f"     {warning.message}")
+                            print(f"     {warning.message}", file=out)
 
-                    print()
+                    print(file=out)
 
         # Print valid skills if verbose
         if self.verbose and valid_skills > 0:
-            print(f"\n✅ {valid_skills} skill(s) with valid structure:\n")
+            print(f"\n✅ {valid_skills} skill(s) with valid structure:\n", file=out)
             for summary in summaries:
                 if summary.is_valid:
                     msg = self.config['success_messages']['skill_valid'].format(
                         skill=summary.skill_name
                     )
-                    print(f"  {msg}")
+                    print(f"  {msg}", file=out)
 
                     # Print warnings
                     if summary.warnings:
                         for warning in summary.warnings:
-                            print(f"     {warning.message}")
+                            print(f"     {warning.message}", file=out)
 
         # Overall summary
-        print("\n" + "-" * 70)
-        print(f"Total skills validated: {total_skills}")
-        print(f"  ✅ Valid: {valid_skills}")
-        print(f"  ❌ Invalid: {invalid_skills}")
-        print(f"  🔴 Total errors: {total_errors}")
-        print(f"  ⚠️  Total warnings: {total_warnings}")
-        print("-" * 70)
+        print("\n" + "-" * 70, file=out)
+        print(f"Total skills validated: {total_skills}", file=out)
+        print(f"  ✅ Valid: {valid_skills}", file=out)
+        print(f"  ❌ Invalid: {invalid_skills}", file=out)
+        print(f"  🔴 Total errors: {total_errors}", file=out)
+        print(f"  ⚠️  Total warnings: {total_warnings}", file=out)
+        print("-" * 70, file=out)
 
         if invalid_skills == 0:
             msg = self.config['success_messages']['all_valid'].format(
                 count=total_skills
             )
-            print(f"\n{msg}\n")
+            print(f"\n{msg}\n", file=out)
         else:
-            print(f"\n❌ Validation failed: {invalid_skills} skill(s) have structural errors\n")
+            print(f"\n❌ Validation failed: {invalid_skills} skill(s) have structural errors\n", file=out)
+
+
+# ============================================================================
+# Output formats
+# ============================================================================
+
+OUTPUT_FORMATS = ('text', 'jsonl', 'sarif')
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+# SARIF rule per check type, listed in the tool description
+SARIF_RULES = {
+    'file_presence': "Required skill file is missing",
+    'file_size': "Skill file is smaller than the configured minimum",
+    'recommended_file': "Recommended skill file is missing",
+    'frontmatter': "SKILL.md frontmatter is missing or invalid",
+}
+
+SARIF_LEVELS = {'error': 'error', 'warning': 'warning', 'info': 'note'}
+
+
+class ResultWriter:
+    """Consumes validation summaries one at a time and keeps running totals."""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.skills = 0
+        self.invalid = 0
+        self.errors = 0
+        self.warnings = 0
+
+    def write(self, summary: SkillValidationSummary) -> None:
+        """Record one skill's results."""
+        self.skills += 1
+        self.invalid += not summary.is_valid
+        self.errors += len(summary.errors)
+        self.warnings += len(summary.warnings)
+
+    def close(self) -> None:
+        """Finish the output after the last skill."""
+
+
+class TextWriter(ResultWriter):
+    """The human-readable report; needs every result before printing."""
+
+    def __init__(self, stream: TextIO, validator: "SkillStructureValidator"):
+        super().__init__(stream)
+        self.validator = validator
+        self.summaries: List[SkillValidationSummary] = []
+
+    def write(self, summary: SkillValidationSummary) -> None:
+        super().write(summary)
+        self.summaries.append(summary)
+
+    def close(self) -> None:
+        self.validator.print_summary(self.summaries, self.stream)
+
+
+class JsonLinesWriter(ResultWriter):
+    """
+    Writes one JSON object per skill as soon as it is validated.
+
+    Each line is ``{"type": "skill", "valid": ..., **SkillValidationSummary}``;
+    a final ``{"type": "summary", ...}`` line carries the totals.
+    """
+
+    def _emit(self, record: Dict[str, Any]) -> None:
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+    def write(self, summary: SkillValidationSummary) -> None:
+        super().write(summary)
+        self._emit({'type': 'skill', 'valid': summary.is_valid, **asdict(summary)})
+
+    def close(self) -> None:
+        self._emit({
+            'type': 'summary',
+            'skills': self.skills,
+            'invalid': self.invalid,
+            'errors': self.errors,
+            'warnings': self.warnings,
+        })
+
+
+class SarifWriter(ResultWriter):
+    """
+    Writes a SARIF 2.1.0 log, streaming each finding into the results array.
+
+    Locations are relative to the project root (``%SRCROOT%``), which is
+    what code scanning annotators expect.
+    """
+
+    def __init__(self, stream: TextIO, project_root: Path):
+        super().__init__(stream)
+        self.project_root = project_root.resolve()
+        self._first = True
+        log = {
+            '$schema': SARIF_SCHEMA,
+            'version': '2.1.0',
+            'runs': [{
+                'tool': {'driver': {
+                    'name': 'validate_skill_structure',
+                    'rules': [
+                        {'id': rule_id, 'shortDescription': {'text': text}}
+                        for rule_id, text in SARIF_RULES.items()
+                    ],
+                }},
+                'originalUriBaseIds': {'%SRCROOT%': {'uri': self.project_root.as_uri() + '/'}},
+                'results': [],
+            }],
+        }
+        # Everything up to the (empty) results array goes out now, the rest on close()
+        self._head, self._tail = json.dumps(log, ensure_ascii=False).rsplit('[]', 1)
+        self.stream.write(self._head + '[')
+        self.stream.flush()
+
+    def _artifact(self, summary: SkillValidationSummary, result: ValidationResult) -> Dict[str, str]:
+        if result.file_path:
+            path = Path(result.file_path)
+        elif result.check_type == 'frontmatter':
+            path = Path(summary.skill_path) / 'SKILL.md'
+        else:
+            path = Path(summary.skill_path)
+        path = path.resolve()
+        try:
+            return {'uri': path.relative_to(self.project_root).as_posix(), 'uriBaseId': '%SRCROOT%'}
+        except ValueError:
+            return {'uri': path.as_uri()}
+
+    def write(self, summary: SkillValidationSummary) -> None:
+        super().write(summary)
+        for result in summary.errors + summary.warnings + summary.info:
+            record = {
+                'ruleId': result.check_type,
+                'level': SARIF_LEVELS.get(result.severity, 'none'),
+                'message': {'text': result.message},
+                'locations': [{'physicalLocation': {'artifactLocation': self._artifact(summary, result)}}],
+                'properties': {'skill': summary.skill_name, 'skillType': summary.skill_type},
+            }
+            self.stream.write(('' if self._first else ',') + '\n' + json.dumps(record, ensure_ascii=False))
+            self._first = False
+        self.stream.flush()
+
+    def close(self) -> None:
+        self.stream.write('\n]' + self._tail + '\n')
+        self.stream.flush()
+
+
+def create_writer(output_format: str, stream: TextIO, validator: "SkillStructureValidator") -> ResultWriter:
+    """Return the ResultWriter for an output format name."""
+    if output_format == 'jsonl':
+        return JsonLinesWriter(stream)
+    if output_format == 'sarif':
+        return SarifWriter(stream, validator.project_root)
+    return TextWriter(stream, validator)
+
+
+# ============================================================================
+# Parallel validation workers
+# ============================================================================
+
+# Per-process validator, created once by the pool initializer
+_worker_validator: Optional[SkillStructureValidator] = None
+
+
+def _init_worker(config_path: str, verbose: bool, project_root: str) -> None:
+    """Load the configuration once per worker process."""
+    global _worker_validator
+    _worker_validator = SkillStructureValidator(config_path, verbose=verbose)
+    _worker_validator.project_root = Path(project_root)
+
+
+def _validate_in_process(task: Tuple[str, str]) -> Tuple[SkillValidationSummary, List[str]]:
+    """Validate one skill inside a worker process."""
+    skill_path, skill_type = task
+    return _worker_validator._validate_buffered(Path(skill_path), skill_type)
+
+
+def _validate_in_thread(validator: SkillStructureValidator):
+    """Return a task function that validates skills with a shared validator."""
+    def validate(task: Tuple[str, str]) -> Tuple[SkillValidationSummary, List[str]]:
+        skill_path, skill_type = task
+        return validator._validate_buffered(Path(skill_path), skill_type)
+    return validate
+
+
+class _QueueEventHandler:
+    """watchdog event handler that forwards changed paths to a queue."""
+
+    # Reads (including the validator's own) must not trigger revalidation
+    IGNORED_EVENTS = ('opened', 'closed_no_write')
+
+    def __init__(self, changes: "queue.Queue[Path]"):
+        self.changes = changes
+
+    def dispatch(self, event) -> None:
+        if event.event_type in self.IGNORED_EVENTS:
+            return
+        for path in (event.src_path, getattr(event, 'dest_path', None)):
+            if path:
+                self.changes.put(Path(os.fsdecode(path)))
 
 
 def main():
@@ -606,8 +1343,65 @@ def main():
         action='store_true',
         help='Enable verbose output'
     )
+    parser.add_argument(
+        '--jobs',
+        '-j',
+        type=int,
+        default=1,
+        help='Validate skills in parallel (default: 1; 0 = one per CPU)'
+    )
+    parser.add_argument(
+        '--threads',
+        action='store_true',
+        help='With --jobs, use threads instead of worker processes'
+    )
+    parser.add_argument(
+        '--changed-since',
+        metavar='REF',
+        help='Only validate skills with files changed since a git ref (e.g. HEAD)'
+    )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse results for unchanged skills from the validation cache and update it'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help=f'Validation cache directory; implies --cache (default: {DEFAULT_CACHE_DIR} in the project root)'
+    )
+    parser.add_argument(
+        '--format',
+        choices=OUTPUT_FORMATS,
+        default='text',
+        help='Output format: text report (default), or JSON Lines / SARIF streamed to '
+             'stdout as each skill is validated (progress text then goes to stderr)'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and revalidate each skill when its files change'
+    )
+    parser.add_argument(
+        '--poll',
+        action='store_true',
+        help='With --watch, poll for changes instead of using file system events'
+    )
+    parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=WATCH_POLL_INTERVAL,
+        metavar='SECONDS',
+        help=f'With --watch, seconds between polls when polling (default: {WATCH_POLL_INTERVAL})'
+    )
 
     args = parser.parse_args()
+    if args.watch and args.changed_since:
+        parser.error('--watch cannot be combined with --changed-since')
+    if args.watch and args.format != 'text':
+        parser.error('--watch only supports --format text')
+    if args.poll_interval <= 0:
+        parser.error('--poll-interval must be positive')
 
     # Initialize validator
     validator = SkillStructureValidator(
@@ -616,14 +1410,42 @@ def main():
     )
 
     # Run validation
-    summaries = validator.validate_all()
+    cache = None
+    if args.cache or args.cache_dir:
+        cache_dir = Path(args.cache_dir) if args.cache_dir else validator.project_root / DEFAULT_CACHE_DIR
+        cache = ValidationCache(cache_dir, validator.config_hash())
+
+    if args.watch:
+        validator.watch(jobs=args.jobs, use_threads=args.threads, cache=cache,
+                        use_polling=args.poll, poll_interval=args.poll_interval)
+        sys.exit(0)
+
+    changed_files = validator.changed_since(args.changed_since) if args.changed_since else None
+
+    writer = create_writer(args.format, sys.stdout, validator)
+    # Machine-readable formats own stdout; send progress text to stderr
+    if args.format == 'text':
+        progress = contextlib.nullcontext()
+    else:
+        progress = contextlib.redirect_stdout(sys.stderr)
+
+    with progress:
+        for summary in validator.iter_validate(
+            jobs=args.jobs,
+            use_threads=args.threads,
+            cache=cache,
+            changed_files=changed_files
+        ):
+            writer.write(summary)
+
+        if cache is not None and args.verbose:
+            print(f"\n♻️  Reused {cache.hits} cached result(s), validated {cache.misses} skill(s)")
 
     # Print results
-    validator.print_summary(summaries)
+    writer.close()
 
     # Exit with appropriate code
-    invalid_count = sum(1 for s in summaries if not s.is_valid)
-    sys.exit(1 if invalid_count > 0 else 0)
+    sys.exit(1 if writer.invalid > 0 else 0)
 
 
 if __name__ == '__main__':
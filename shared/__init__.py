@@ -5,12 +5,26 @@ This module provides centralized utilities that are used across multiple skills,
 reducing code duplication and ensuring consistent behavior.
 """
 
-from shared.config_loader import ConfigLoader, ConfigurationError
-from shared.base_orchestrator import BaseOrchestrator, OrchestratorError
+from shared.config_loader import ConfigLoader, ConfigurationError, ConfigWatcher
+from shared.events import Event, EventLog
+from shared.profiling import PhaseProfiler, phase
+from shared.base_orchestrator import BaseOrchestrator, OrchestratorError, run_many
+from shared.pipeline import Pipeline, PipelineError, PipelineResult
+from shared.pool import OrchestratorPool
 
 __all__ = [
     "ConfigLoader",
     "ConfigurationError",
+    "ConfigWatcher",
+    "Event",
+    "EventLog",
+    "PhaseProfiler",
+    "phase",
     "BaseOrchestrator",
     "OrchestratorError",
+    "run_many",
+    "Pipeline",
+    "PipelineError",
+    "PipelineResult",
+    "OrchestratorPool",
 ]
@@ -18,14 +18,42 @@ Usage:
         def execute(self, **kwargs) -> Dict[str, Any]:
             # Main skill logic
             return {"result": "success"}
+
+    # I/O-bound skills can override aexecute() and run on an event loop:
+    results = asyncio.run(run_many(orchestrators, concurrency=50))
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from datetime import datetime
 
 from shared.config_loader import ConfigLoader, ConfigurationError
+from shared.events import EventLog
+from shared.profiling import PhaseProfiler
+
+
+# Marks keys that were looked up and not found
+_MISSING = object()
+
+
+@lru_cache(maxsize=1024)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-notation config key, memoized across lookups."""
+    return tuple(key.split("."))
+
+
+def _resolve(config: Dict[str, Any], key: str) -> Any:
+    """Walk a dot-notation key through nested dicts, or return _MISSING."""
+    value = config
+    for k in _split_key(key):
+        if isinstance(value, dict) and k in value:
+            value = value[k]
+        else:
+            return _MISSING
+    return value
 
 
 class OrchestratorError(Exception):
@@ -45,14 +73,26 @@ class BaseOrchestrator(ABC):
     - Flexible configuration loading (dict, path, or defaults)
     - Standardized result and error tracking
     - Lifecycle hooks for initialization and cleanup
+    - Synchronous (run) and asyncio (arun) execution
+    - Per-phase timing spans (see shared.profiling)
+    - Optional hot reloading of the configuration file
     - Common utility methods
 
     Subclasses must implement:
     - _get_default_config(): Return default configuration dict
     - _initialize(): Set up skill-specific components
     - execute(): Main skill workflow logic
+
+    Set ``event_capacity`` on a subclass to keep only the most recent
+    errors, warnings and info messages of each kind.
     """
 
+    # Maximum events kept per level (None = unbounded)
+    event_capacity: Optional[int] = None
+
+    # Record peak traced memory in phase spans (slows allocation)
+    profile_memory: bool = False
+
     def __init__(
         self,
         config: Optional[Dict[str, Any]] = None,
@@ -72,12 +112,19 @@ class BaseOrchestrator(ABC):
         self.verbose = verbose
         self._started_at: Optional[datetime] = None
         self._completed_at: Optional[datetime] = None
+        self._config_subscription: Optional[int] = None
+        self._ainitialized: Optional[asyncio.Future] = None
+        self.profiler = PhaseProfiler(self.__class__.__name__, memory=self.profile_memory)
+
+        # Only set when the configuration came from a file
+        self.config_path: Optional[Path] = None
 
         # Load configuration with priority: provided > file > defaults
         if config is not None:
             self.config = config
         elif config_path is not None:
             path = Path(config_path) if isinstance(config_path, str) else config_path
+            self.config_path = path
             # Fallback to defaults if config file is empty
             self.config = ConfigLoader.load_yaml(path) or self._get_default_config()
         else:
@@ -85,9 +132,7 @@ class BaseOrchestrator(ABC):
 
         # Initialize result tracking
         self._results: Dict[str, Any] = {}
-        self._errors: List[Dict[str, Any]] = []
-        self._warnings: List[Dict[str, Any]] = []
-        self._info: List[Dict[str, Any]] = []
+        self._new_event_logs()
 
         # Call subclass initialization
         self._initialize()
@@ -131,6 +176,30 @@ class BaseOrchestrator(ABC):
         """
         pass
 
+    async def _ainitialize(self) -> None:  # noqa: B027 - optional hook, no-op by default
+        """
+        Initialize components that need to await I/O.
+
+        Called once, before the first ``arun()``. Override to open async
+        clients or sessions; the default does nothing.
+        """
+
+    async def aexecute(self, **kwargs) -> Dict[str, Any]:
+        """
+        Execute the main skill workflow on an event loop.
+
+        The default runs ``execute()`` in a worker thread so synchronous
+        skills do not block the loop. Override with a native coroutine in
+        skills that wait on network I/O.
+
+        Args:
+            **kwargs: Skill-specific execution parameters
+
+        Returns:
+            Dictionary containing execution results
+        """
+        return await asyncio.to_thread(self.execute, **kwargs)
+
     # =========================================================================
     # Result Management
     # =========================================================================
@@ -151,6 +220,12 @@ class BaseOrchestrator(ABC):
     # Error and Warning Management
     # =========================================================================
 
+    def _new_event_logs(self) -> None:
+        """Create empty error, warning and info logs."""
+        self._errors = EventLog("error", self.event_capacity)
+        self._warnings = EventLog("warning", self.event_capacity)
+        self._info = EventLog("info", self.event_capacity)
+
     def add_error(
         self,
         message: str,
@@ -159,13 +234,7 @@ class BaseOrchestrator(ABC):
         details: Optional[Dict] = None
     ) -> None:
         """Record an error."""
-        self._errors.append({
-            "message": message,
-            "code": code,
-            "phase": phase,
-            "details": details or {},
-            "timestamp": datetime.now().isoformat()
-        })
+        self._errors.append(message, code, phase, details)
 
     def add_warning(
         self,
@@ -174,28 +243,34 @@ class BaseOrchestrator(ABC):
         phase: Optional[str] = None
     ) -> None:
         """Record a warning."""
-        self._warnings.append({
-            "message": message,
-            "code": code,
-            "phase": phase,
-            "timestamp": datetime.now().isoformat()
-        })
+        self._warnings.append(message, code, phase)
 
     def add_info(self, message: str, phase: Optional[str] = None) -> None:
         """Record an informational message."""
-        self._info.append({
-            "message": message,
-            "phase": phase,
-            "timestamp": datetime.now().isoformat()
-        })
+        self._info.append(message, phase=phase)
 
     def get_errors(self) -> List[Dict[str, Any]]:
-        """Return all recorded errors."""
-        return self._errors.copy()
+        """Return all recorded errors as dictionaries."""
+        return self._errors.to_list()
 
     def get_warnings(self) -> List[Dict[str, Any]]:
-        """Return all recorded warnings."""
-        return self._warnings.copy()
+        """Return all recorded warnings as dictionaries."""
+        return self._warnings.to_list()
+
+    def events(self, level: str = "error") -> EventLog:
+        """
+        Return the live log for one level, for iterating without a copy.
+
+        Args:
+            level: 'error', 'warning' or 'info'
+
+        Returns:
+            EventLog of Event records (read them; record via add_* methods)
+        """
+        logs = {"error": self._errors, "warning": self._warnings, "info": self._info}
+        if level not in logs:
+            raise ValueError(f"Unknown event level: {level}")
+        return logs[level]
 
     def has_errors(self) -> bool:
         """Check if any errors have been recorded."""
@@ -225,42 +300,151 @@ class BaseOrchestrator(ABC):
             Dictionary with results, timing, and status information
         """
         self._started_at = datetime.now()
+        # Phase timings cover the current run only
+        self.profiler.clear()
 
         try:
-            result = self.execute(**kwargs)
+            with self.profiler.span("run"):
+                result = self.execute(**kwargs)
             status = "success" if not self.has_errors() else "completed_with_errors"
         except Exception as e:
             self.add_error(str(e), code="EXECUTION_ERROR")
             result = {}
             status = "failed"
 
+        return self._finish_run(result, status)
+
+    async def arun(self, **kwargs) -> Dict[str, Any]:
+        """
+        Run the orchestrator on an event loop with lifecycle tracking.
+
+        Async counterpart of ``run()``: awaits ``_ainitialize()`` on first
+        use, then ``aexecute()``, and returns the same dictionary. Run
+        concurrent calls on separate orchestrator instances, since results
+        and errors are tracked per instance.
+
+        Args:
+            **kwargs: Passed to aexecute()
+
+        Returns:
+            Dictionary with results, timing, and status information
+        """
+        self._started_at = datetime.now()
+        self.profiler.clear()
+
+        try:
+            # Wall time only: other tasks run on this thread while it awaits
+            with self.profiler.span("run", cpu=False):
+                if self._ainitialized is None:
+                    self._ainitialized = asyncio.ensure_future(self._ainitialize())
+                await self._ainitialized
+                result = await self.aexecute(**kwargs)
+            status = "success" if not self.has_errors() else "completed_with_errors"
+        except Exception as e:
+            if self._ainitialized is not None and self._ainitialized.done() \
+                    and self._ainitialized.exception() is not None:
+                # Retry initialization on the next run
+                self._ainitialized = None
+            self.add_error(str(e), code="EXECUTION_ERROR")
+            result = {}
+            status = "failed"
+
+        return self._finish_run(result, status)
+
+    def _finish_run(self, result: Dict[str, Any], status: str) -> Dict[str, Any]:
+        """Record completion time and build the run() return value."""
         self._completed_at = datetime.now()
 
         return {
             "status": status,
             "result": result,
-            "errors": self._errors,
-            "warnings": self._warnings,
+            "errors": self._errors.to_list(),
+            "warnings": self._warnings.to_list(),
             "timing": {
                 "started_at": self._started_at.isoformat(),
                 "completed_at": self._completed_at.isoformat(),
-                "duration_seconds": (self._completed_at - self._started_at).total_seconds()
+                "duration_seconds": (self._completed_at - self._started_at).total_seconds(),
+                "phases": self.profiler.summary()
             }
         }
 
     def reset(self) -> None:
         """Reset the orchestrator state for reuse."""
         self._results = {}
-        self._errors = []
-        self._warnings = []
-        self._info = []
+        self._new_event_logs()
+        self.profiler.clear()
         self._started_at = None
         self._completed_at = None
 
+    # =========================================================================
+    # Config Reloading
+    # =========================================================================
+
+    def watch_config(self, start: bool = True, interval: Optional[float] = None) -> None:
+        """
+        Reload the configuration whenever its file changes on disk.
+
+        The new configuration is fully parsed before ``self.config`` is
+        replaced in a single assignment, so a call in progress sees either
+        the old or the new configuration, never a mix. The watcher holds the
+        orchestrator weakly; it is unsubscribed once garbage collected.
+
+        Args:
+            start: Start the process-wide background watcher
+            interval: Seconds between polls (default: watcher's interval)
+
+        Raises:
+            OrchestratorError: If the configuration was not loaded from a file
+        """
+        if self.config_path is None:
+            raise OrchestratorError(
+                f"{self.__class__.__name__} has no config_path to watch",
+                phase="config"
+            )
+        if self._config_subscription is None:
+            self._config_subscription = ConfigLoader.subscribe(
+                self.config_path, self._reload_config, weak=True
+            )
+        if start:
+            ConfigLoader.start_watching(interval)
+
+    def unwatch_config(self) -> None:
+        """Stop reloading the configuration file."""
+        if self._config_subscription is not None:
+            ConfigLoader.unsubscribe(self._config_subscription)
+            self._config_subscription = None
+
+    def _reload_config(self, path: Path, config: Optional[Dict[str, Any]]) -> None:
+        """Swap in a reloaded configuration and notify the subclass."""
+        old_config = self.config
+        self.config = config or self._get_default_config()
+        self.log(f"Reloaded configuration from {path}")
+        self._on_config_reloaded(old_config, self.config)
+
+    def _on_config_reloaded(  # noqa: B027 - optional hook, no-op by default
+        self, old_config: Dict[str, Any], new_config: Dict[str, Any]
+    ) -> None:
+        """
+        Hook called after the configuration has been reloaded.
+
+        Override to rebuild components derived from the configuration.
+        ``self.config`` already refers to ``new_config``.
+        """
+
     # =========================================================================
     # Utility Methods
     # =========================================================================
 
+    def span(self, phase: str, **attributes):
+        """
+        Time a phase of the run; use as ``with self.span("validation"):``.
+
+        Spans nest, and appear in ``run()["timing"]["phases"]`` and the
+        exports of ``self.profiler``. See also ``shared.profiling.phase``
+        for a method decorator.
+        """
+        return self.profiler.span(phase, **attributes)
+
     def log(self, message: str, level: str = "info") -> None:
         """Log a message if verbose mode is enabled."""
         if self.verbose:
@@ -271,6 +455,9 @@ class BaseOrchestrator(ABC):
         """
         Get a configuration value with dot notation support.
 
+        Only the split key path is cached; the value is read from the live
+        ``self.config``, so in-place changes are seen immediately.
+
         Args:
             key: Configuration key (supports dots, e.g., "database.host")
             default: Default value if key not found
@@ -278,16 +465,29 @@ class BaseOrchestrator(ABC):
         Returns:
             Configuration value or default
         """
-        keys = key.split(".")
-        value = self.config
+        value = _resolve(self.config, key)
+        return default if value is _MISSING else value
 
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+    def get_config_values(self, keys: Iterable[str], default: Any = None) -> Dict[str, Any]:
+        """
+        Get several configuration values from the same configuration.
+
+        All keys are resolved against one snapshot of ``self.config``, so a
+        reload part-way through cannot mix old and new values.
 
-        return value
+        Args:
+            keys: Configuration keys in dot notation
+            default: Value for keys that are not found
+
+        Returns:
+            Dictionary mapping each key to its value or the default
+        """
+        config = self.config
+        values = {}
+        for key in keys:
+            value = _resolve(config, key)
+            values[key] = default if value is _MISSING else value
+        return values
 
     def validate_config(self, required_keys: List[str]) -> None:
         """
@@ -311,8 +511,8 @@ class BaseOrchestrator(ABC):
             "class": self.__class__.__name__,
             "config_keys": list(self.config.keys()),
             "result_count": len(self._results),
-            "error_count": len(self._errors),
-            "warning_count": len(self._warnings),
+            "error_count": self._errors.total,
+            "warning_count": self._warnings.total,
             "has_run": self._completed_at is not None,
             "duration": (
                 (self._completed_at - self._started_at).total_seconds()
@@ -320,3 +520,37 @@ class BaseOrchestrator(ABC):
                 else None
             )
         }
+
+
+async def run_many(
+    orchestrators: Iterable[BaseOrchestrator],
+    concurrency: int = 10,
+    **kwargs
+) -> List[Dict[str, Any]]:
+    """
+    Run many orchestrators on the current event loop.
+
+    At most ``concurrency`` runs are in flight at once, and orchestrators
+    are taken from the iterable only as slots free up. A failing run is
+    reported in its own result rather than cancelling the others.
+
+    Args:
+        orchestrators: Orchestrators to run (one instance per run)
+        concurrency: Maximum number of concurrent runs
+        **kwargs: Passed to every arun()
+
+    Returns:
+        arun() results, in the order the orchestrators were given
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    queue = iter(enumerate(orchestrators))
+    results: Dict[int, Dict[str, Any]] = {}
+
+    async def worker() -> None:
+        for index, orchestrator in queue:
+            results[index] = await orchestrator.arun(**kwargs)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return [results[index] for index in range(len(results))]
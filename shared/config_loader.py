@@ -18,16 +18,49 @@ Usage:
         Path("config/settings.yaml"),
         defaults={"timeout": 30, "retries": 3}
     )
+
+    # Read-only shared view, no copy (cached per path, mtime and size)
+    rules = ConfigLoader.load_yaml(Path("config/rules.yaml"), frozen=True)
+    print(ConfigLoader.cache_info())
+
+    # Reuse a binary snapshot (config/.rules.yaml.snapshot) across processes
+    rules = ConfigLoader.load_yaml(Path("config/rules.yaml"), snapshot=True)
+
+    # Get called with the new config whenever the file changes
+    ConfigLoader.subscribe(Path("config/rules.yaml"), on_rules_changed)
+    ConfigLoader.start_watching(interval=1.0)
 """
 
+import copy
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from itertools import count
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple, Union
+
+from shared import frontmatter
 
 try:
     import yaml
 except ImportError:
     yaml = None  # type: ignore
 
+# Prefer the libyaml C loader when PyYAML was built with it
+if yaml is not None:
+    YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+else:
+    YAML_LOADER = None
+
+# Bump when the snapshot layout changes so old snapshots are ignored
+SNAPSHOT_VERSION = 1
+
 
 class ConfigurationError(Exception):
     """Exception raised for configuration loading errors."""
@@ -37,6 +70,392 @@ class ConfigurationError(Exception):
         super().__init__(message)
 
 
+class CacheInfo(NamedTuple):
+    """Statistics for the parsed configuration cache."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def freeze(value: Any) -> Any:
+    """
+    Return a read-only copy of parsed YAML.
+
+    Mappings become ``MappingProxyType`` views and lists become tuples, so a
+    frozen config can be shared between callers without being modified.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class ConfigCache:
+    """
+    Thread-safe LRU cache of parsed configuration files.
+
+    Entries are keyed by path and validated against the file's modification
+    time and size on every lookup, so an edited file is re-parsed on the
+    next load. Cached values are never handed out directly: callers get a
+    frozen view or a deep copy.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        Args:
+            maxsize: Maximum number of files kept in the cache
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Tuple[Tuple[int, int], Any, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, signature: Tuple[int, int], frozen: bool = False) -> Any:
+        """
+        Look up a parsed file.
+
+        Args:
+            key: Cache key (resolved path and encoding)
+            signature: Current ``(mtime_ns, size)`` of the file
+            frozen: Return the shared read-only view instead of a copy
+
+        Returns:
+            Parsed configuration, or None on a miss or stale entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != signature:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return entry[2] if frozen else copy.deepcopy(entry[1])
+
+    def put(self, key: Hashable, signature: Tuple[int, int], value: Any) -> Any:
+        """
+        Store a parsed file, evicting the least recently used entry if full.
+
+        Returns:
+            The frozen view of ``value``
+        """
+        frozen = freeze(value)
+        with self._lock:
+            self._entries[key] = (signature, copy.deepcopy(value), frozen)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return frozen
+
+    def info(self) -> CacheInfo:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Process-wide cache shared by every ConfigLoader call
+_cache = ConfigCache()
+
+
+# ============================================================================
+# SNAPSHOTS
+# ============================================================================
+
+_MISSING = object()
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    """Unpickler limited to the types YAML safe loading can produce."""
+
+    _ALLOWED = {
+        ("datetime", "date"),
+        ("datetime", "datetime"),
+        ("datetime", "timedelta"),
+        ("datetime", "timezone"),
+    }
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) in self._ALLOWED:
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"Disallowed type in config snapshot: {module}.{name}")
+
+
+def snapshot_path(path: Path) -> Path:
+    """Hidden snapshot file stored next to a configuration file."""
+    return path.with_name(f".{path.name}.snapshot")
+
+
+def _read_snapshot(path: Path, digest: str) -> Any:
+    """Parsed data from a snapshot matching ``digest``, else ``_MISSING``."""
+    try:
+        with open(snapshot_path(path), "rb") as f:
+            snapshot = _SnapshotUnpickler(f).load()
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+        return _MISSING
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("version") != SNAPSHOT_VERSION
+        or snapshot.get("sha256") != digest
+    ):
+        return _MISSING
+    return snapshot.get("data")
+
+
+def _write_snapshot(path: Path, digest: str, data: Any) -> None:
+    """Atomically write a snapshot; unwritable directories are skipped."""
+    target = snapshot_path(path)
+    try:
+        fd, tmp_name = tempfile.mkstemp(prefix=target.name, suffix=".tmp", dir=target.parent)
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(
+                {"version": SNAPSHOT_VERSION, "sha256": digest, "data": data},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_name, target)
+    except (OSError, pickle.PicklingError):
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+
+
+def _parse_yaml_file(path: Path, encoding: str, snapshot: bool) -> Any:
+    """Parse a YAML file, going through its snapshot when requested."""
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    digest = hashlib.sha256(raw).hexdigest() if snapshot else ""
+    if snapshot:
+        config = _read_snapshot(path, digest)
+        if config is not _MISSING:
+            return config
+
+    config = yaml.load(raw.decode(encoding), Loader=YAML_LOADER)
+    # Handle empty files
+    config = config if config is not None else {}
+
+    if snapshot:
+        _write_snapshot(path, digest, config)
+    return config
+
+
+# ============================================================================
+# WATCHING
+# ============================================================================
+
+ConfigCallback = Callable[[Path, Any], None]
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int, int, int]]:
+    """Identify a file's current content; follows symlinks, so a swapped link target shows up."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _report_callback_error(path: Path, error: Exception) -> None:
+    print(f"Warning: config reload callback for {path} failed: {error}", file=sys.stderr)
+
+
+class ConfigWatcher:
+    """
+    Poll-based watcher that reloads configuration files when they change.
+
+    Each poll stats every watched path as the caller gave it, following
+    symlinks, so a link switched to a new target (a Kubernetes ConfigMap
+    or a ``current`` deploy link) counts as a change. Only files that
+    changed are re-parsed (once per real file, however many subscribers
+    or links point at it). Subscribers are called with the new
+    configuration only if it parses; a broken edit leaves the current
+    configuration in place and is retried on every poll, reported once.
+    """
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        on_error: Optional[Callable[[Path, Exception], None]] = None
+    ):
+        """
+        Args:
+            interval: Seconds between polls when running in the background
+            on_error: Called with (path, exception) when a reload fails or a
+                callback raises (default: print to stderr)
+        """
+        self.interval = interval
+        self.on_error = on_error or _report_callback_error
+        # subscription id -> (path, callback or weak method, weak, frozen)
+        self._subscriptions: Dict[int, Tuple[str, Any, bool, bool]] = {}
+        # Watched path -> signature of the last successfully loaded content
+        self._signatures: Dict[str, Optional[Tuple[int, int, int, int]]] = {}
+        # Watched path -> signature whose load failed (reported once)
+        self._failed: Dict[str, Tuple[int, int, int, int]] = {}
+        self._ids = count(1)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def subscribe(
+        self,
+        path: Union[Path, str],
+        callback: ConfigCallback,
+        weak: bool = False,
+        frozen: bool = False
+    ) -> int:
+        """
+        Call ``callback(path, config)`` whenever ``path`` changes.
+
+        Args:
+            path: Configuration file to watch
+            callback: Receives the file path and the newly loaded config
+            weak: Hold a bound-method callback weakly, so subscribing does
+                not keep its object alive; dead subscriptions are dropped
+            frozen: Pass the shared read-only view instead of a private copy
+
+        Returns:
+            Subscription id for ``unsubscribe``
+        """
+        # Keep the path as given (not resolved), so symlink swaps are seen
+        key = os.path.abspath(path)
+        target = weakref.WeakMethod(callback) if weak else callback
+        with self._lock:
+            subscription_id = next(self._ids)
+            self._subscriptions[subscription_id] = (key, target, weak, frozen)
+            if key not in self._signatures:
+                self._signatures[key] = _file_signature(key)
+        return subscription_id
+
+    def unsubscribe(self, subscription_id: int) -> None:
+        """Remove a subscription; unknown ids are ignored."""
+        with self._lock:
+            entry = self._subscriptions.pop(subscription_id, None)
+            if entry and not any(sub[0] == entry[0] for sub in self._subscriptions.values()):
+                self._signatures.pop(entry[0], None)
+                self._failed.pop(entry[0], None)
+
+    def poll(self) -> List[Path]:
+        """
+        Check watched files once and notify subscribers of changed ones.
+
+        Returns:
+            Paths that changed and were reloaded successfully
+        """
+        with self._lock:
+            changed = []
+            for key, signature in self._signatures.items():
+                current = _file_signature(key)
+                if current == signature:
+                    continue
+                if current is None:
+                    self._signatures[key] = None
+                    self._failed.pop(key, None)
+                else:
+                    changed.append((key, current))
+            subscriptions = list(self._subscriptions.items())
+
+        reloaded = []
+        # Real file -> error, so links to one file are parsed once
+        failures: Dict[str, Exception] = {}
+        for key, current in changed:
+            path = Path(key)
+            real_path = os.path.realpath(key)
+            try:
+                if real_path in failures:
+                    raise failures[real_path]
+                ConfigLoader.load_yaml(path, frozen=True)
+            except Exception as e:
+                # Any failure (bad YAML, undecodable bytes, a read error on a
+                # half-written file) is reported and retried, never raised
+                failures[real_path] = e
+                with self._lock:
+                    first_failure = self._failed.get(key) != current
+                    if key in self._signatures:
+                        self._failed[key] = current
+                if first_failure:
+                    self.on_error(path, e)
+                continue
+
+            # Only remember the signature once the content has loaded, so a
+            # half-written file is retried on the next poll
+            with self._lock:
+                if key not in self._signatures:
+                    continue
+                self._signatures[key] = current
+                self._failed.pop(key, None)
+            reloaded.append(path)
+
+            for subscription_id, (sub_key, target, weak, frozen) in subscriptions:
+                if sub_key != key:
+                    continue
+                callback = target() if weak else target
+                if callback is None:
+                    self.unsubscribe(subscription_id)
+                    continue
+                try:
+                    callback(path, ConfigLoader.load_yaml(path, frozen=frozen))
+                except Exception as e:
+                    self.on_error(path, e)
+
+        return reloaded
+
+    def start(self) -> None:
+        """Start polling in a daemon thread (no-op if already running)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="ConfigWatcher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        """True while the background thread is polling."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                # Keep the thread alive even if an on_error handler raises
+                print(f"Warning: config watcher poll failed: {e}", file=sys.stderr)
+
+    def __enter__(self) -> "ConfigWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+# Process-wide watcher behind ConfigLoader.subscribe
+_watcher = ConfigWatcher()
+
+
 class ConfigLoader:
     """Centralized configuration loading with consistent error handling."""
 
@@ -53,15 +472,28 @@ class ConfigLoader:
     def load_yaml(
         path: Union[Path, str],
         required: bool = True,
-        encoding: str = "utf-8"
+        encoding: str = "utf-8",
+        use_cache: bool = True,
+        frozen: bool = False,
+        snapshot: bool = False
     ) -> Optional[Dict[str, Any]]:
         """
         Load YAML configuration from file with standardized error handling.
 
+        Parsed files are cached process-wide and re-parsed only when their
+        modification time or size changes. Parsing uses the libyaml C loader
+        when available.
+
         Args:
             path: Path to the YAML configuration file
             required: If True, raises ConfigurationError when file not found
             encoding: File encoding (default: utf-8)
+            use_cache: If False, always re-parse the file
+            frozen: Return a shared read-only view (no copy) instead of a
+                private mutable dictionary
+            snapshot: Reuse (and refresh) a pickled snapshot stored next to
+                the file while the file's SHA-256 is unchanged, so new
+                processes skip YAML parsing
 
         Returns:
             Parsed configuration dictionary, or None if file not found and not required
@@ -74,10 +506,21 @@ class ConfigLoader:
         path = Path(path) if isinstance(path, str) else path
 
         try:
-            with open(path, "r", encoding=encoding) as f:
-                config = yaml.safe_load(f)
-            # Handle empty files
-            return config if config is not None else {}
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            key = (os.path.realpath(path), encoding)
+
+            if use_cache:
+                cached = _cache.get(key, signature, frozen=frozen)
+                if cached is not None:
+                    return cached
+
+            config = _parse_yaml_file(path, encoding, snapshot)
+
+            if use_cache:
+                view = _cache.put(key, signature, config)
+                return view if frozen else config
+            return freeze(config) if frozen else config
         except FileNotFoundError:
             if required:
                 raise ConfigurationError(
@@ -96,6 +539,57 @@ class ConfigLoader:
                 path=path
             )
 
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """Return hit/miss statistics for the parsed configuration cache."""
+        return _cache.info()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop every cached configuration and reset the counters."""
+        _cache.clear()
+
+    @staticmethod
+    def subscribe(
+        path: Union[Path, str],
+        callback: ConfigCallback,
+        weak: bool = False,
+        frozen: bool = False
+    ) -> int:
+        """
+        Register ``callback(path, config)`` for changes to a config file.
+
+        Changes are detected by the process-wide watcher; call
+        ``start_watching`` to poll in the background, or ``watcher().poll()``
+        to check on demand.
+
+        Returns:
+            Subscription id for ``unsubscribe``
+        """
+        return _watcher.subscribe(path, callback, weak=weak, frozen=frozen)
+
+    @staticmethod
+    def unsubscribe(subscription_id: int) -> None:
+        """Remove a subscription created with ``subscribe``."""
+        _watcher.unsubscribe(subscription_id)
+
+    @staticmethod
+    def start_watching(interval: Optional[float] = None) -> None:
+        """Start background polling of subscribed files."""
+        if interval is not None:
+            _watcher.interval = interval
+        _watcher.start()
+
+    @staticmethod
+    def stop_watching() -> None:
+        """Stop background polling of subscribed files."""
+        _watcher.stop()
+
+    @staticmethod
+    def watcher() -> ConfigWatcher:
+        """Return the process-wide ConfigWatcher."""
+        return _watcher
+
     @staticmethod
     def load_yaml_with_defaults(
         path: Union[Path, str],
@@ -139,7 +633,9 @@ class ConfigLoader:
         """
         Extract and parse YAML frontmatter from a markdown file.
 
-        Frontmatter must be delimited by --- at the start and end.
+        Frontmatter must be delimited by --- lines at the start and end.
+        Only the frontmatter block is read, and results are cached per
+        path, mtime and size (see shared.frontmatter).
 
         Args:
             path: Path to the markdown file
@@ -156,8 +652,7 @@ class ConfigLoader:
         path = Path(path) if isinstance(path, str) else path
 
         try:
-            with open(path, "r", encoding=encoding) as f:
-                content = f.read()
+            return frontmatter.load_frontmatter(path, encoding=encoding)
         except FileNotFoundError:
             return None
         except PermissionError:
@@ -165,20 +660,6 @@ class ConfigLoader:
                 f"Permission denied when reading: {path}",
                 path=path
             )
-
-        # Check for frontmatter
-        if not content.startswith("---"):
-            return None
-
-        # Find closing delimiter
-        end_match = content.find("\n---", 3)
-        if end_match == -1:
-            return None
-
-        frontmatter_text = content[3:end_match].strip()
-
-        try:
-            return yaml.safe_load(frontmatter_text)
         except yaml.YAMLError as e:
             raise ConfigurationError(
                 f"Invalid YAML frontmatter in {path}: {e}",
@@ -0,0 +1,177 @@
+"""
+Orchestrator Event Log
+
+Compact storage for the errors, warnings and info messages an orchestrator
+records. Each event is a ``__slots__`` record stamped with an integer
+monotonic clock reading; the ISO timestamp is only formatted when someone
+reads it. An EventLog can be bounded, in which case it keeps the most
+recent events and counts the ones it dropped.
+
+Events are read-only mappings, so existing code that does
+``event["message"]`` or compares an event to a dict keeps working.
+
+Usage:
+    from shared.events import EventLog
+
+    log = EventLog("error", capacity=10_000)
+    log.append("Balance sheet does not balance", code="MATH_001", phase="validation")
+
+    for event in log:           # iterates the buffer itself, no copy
+        print(event.message)
+
+    log.to_list()               # plain dicts, e.g. for JSON output
+"""
+
+import time
+from collections import deque
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Anchors for converting monotonic readings to wall-clock time
+_WALL_ANCHOR_NS = time.time_ns()
+_MONOTONIC_ANCHOR_NS = time.monotonic_ns()
+
+# Keys exposed by events of each level, matching the historical dict layout
+LEVEL_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "error": ("message", "code", "phase", "details", "timestamp"),
+    "warning": ("message", "code", "phase", "timestamp"),
+    "info": ("message", "phase", "timestamp"),
+}
+
+
+def format_timestamp(monotonic_ns: int) -> str:
+    """Convert a ``time.monotonic_ns()`` reading to a local ISO timestamp."""
+    wall_ns = _WALL_ANCHOR_NS + (monotonic_ns - _MONOTONIC_ANCHOR_NS)
+    return datetime.fromtimestamp(wall_ns / 1e9).isoformat()
+
+
+class Event(Mapping):
+    """A single recorded message."""
+
+    __slots__ = ("level", "message", "code", "phase", "_details", "monotonic_ns")
+
+    def __init__(
+        self,
+        level: str,
+        message: str,
+        code: Optional[str] = None,
+        phase: Optional[str] = None,
+        details: Optional[Dict] = None,
+        monotonic_ns: Optional[int] = None
+    ):
+        self.level = level
+        self.message = message
+        self.code = code
+        self.phase = phase
+        self._details = details
+        self.monotonic_ns = time.monotonic_ns() if monotonic_ns is None else monotonic_ns
+
+    @property
+    def details(self) -> Dict:
+        """Extra context for the event (empty dict if none was given)."""
+        if self._details is None:
+            self._details = {}
+        return self._details
+
+    @property
+    def timestamp(self) -> str:
+        """ISO-formatted time the event was recorded."""
+        return format_timestamp(self.monotonic_ns)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in LEVEL_FIELDS[self.level]:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(LEVEL_FIELDS[self.level])
+
+    def __len__(self) -> int:
+        return len(LEVEL_FIELDS[self.level])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the event as a plain dictionary."""
+        return {key: getattr(self, key) for key in LEVEL_FIELDS[self.level]}
+
+    def __repr__(self) -> str:
+        return f"Event({self.level!r}, {self.message!r}, code={self.code!r}, phase={self.phase!r})"
+
+
+class EventLog(Sequence):
+    """
+    Append-only buffer of events of one level.
+
+    With a ``capacity`` the log is a ring buffer: once full, each append
+    drops the oldest event. ``total`` counts every event ever appended.
+    Iterating the log walks the buffer directly; append while iterating
+    and the iteration raises RuntimeError, like a dict.
+    """
+
+    __slots__ = ("level", "_events", "total")
+
+    def __init__(self, level: str, capacity: Optional[int] = None):
+        """
+        Args:
+            level: 'error', 'warning' or 'info'
+            capacity: Maximum events kept (default: unbounded)
+        """
+        if level not in LEVEL_FIELDS:
+            raise ValueError(f"Unknown event level: {level}")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.level = level
+        self._events: deque = deque(maxlen=capacity)
+        self.total = 0
+
+    @property
+    def capacity(self) -> Optional[int]:
+        """Maximum number of events kept, or None if unbounded."""
+        return self._events.maxlen
+
+    @property
+    def dropped(self) -> int:
+        """Number of events discarded because the buffer was full."""
+        return self.total - len(self._events)
+
+    def append(
+        self,
+        message: str,
+        code: Optional[str] = None,
+        phase: Optional[str] = None,
+        details: Optional[Dict] = None
+    ) -> None:
+        """Record an event stamped with the current monotonic time."""
+        self._events.append(Event(self.level, message, code, phase, details, time.monotonic_ns()))
+        self.total += 1
+
+    def clear(self) -> None:
+        """Remove all events and reset the counters."""
+        self._events.clear()
+        self.total = 0
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Return the kept events as plain dictionaries, oldest first."""
+        return [event.to_dict() for event in self._events]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._events)[index]
+        return self._events[index]
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._events)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __bool__(self) -> bool:
+        return bool(self._events)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (EventLog, list, tuple)):
+            return list(self._events) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"EventLog({self.level!r}, {len(self._events)} events, capacity={self.capacity})"
@@ -0,0 +1,237 @@
+"""
+Frontmatter Scanner
+
+One reader for the YAML frontmatter at the top of SKILL.md and other
+markdown files. The file is read line by line through a small buffer and
+reading stops at the closing ``---``, so the markdown body is never
+loaded. Scans and parsed results are cached by path, mtime and size.
+
+A frontmatter block is an opening line ``---`` at the very start of the
+file, followed by YAML, followed by a closing line ``---`` (trailing
+whitespace allowed on both).
+
+Usage:
+    from shared.frontmatter import load_frontmatter, scan_frontmatter
+
+    data = load_frontmatter("skills/my-skill/SKILL.md")   # dict or None
+
+    scan = scan_frontmatter("skills/my-skill/SKILL.md")   # no YAML needed
+    if scan.opened and not scan.closed:
+        print("Unclosed frontmatter")
+"""
+
+import copy
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Iterable, NamedTuple, Optional, Tuple, Union
+
+try:
+    import yaml
+except ImportError:
+    yaml = None  # type: ignore
+
+if yaml is not None:
+    YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+else:
+    YAML_LOADER = None
+
+DELIMITER = "---"
+
+# Buffer size for reading markdown files
+READ_BUFFER_SIZE = 8192
+
+# Longest frontmatter block read before giving up (in characters), so an
+# unclosed block in a large file does not pull in the whole body
+MAX_FRONTMATTER_LENGTH = 256 * 1024
+
+# Longest single line read in one call
+MAX_LINE_LENGTH = 16 * 1024
+
+CACHE_SIZE = 512
+
+
+class FrontmatterScan(NamedTuple):
+    """Result of scanning a file for a frontmatter block."""
+    text: Optional[str]
+    opened: bool
+
+    @property
+    def closed(self) -> bool:
+        """True if a complete frontmatter block was found."""
+        return self.text is not None
+
+
+class FrontmatterInfo(NamedTuple):
+    """Statistics for the frontmatter cache."""
+    hits: int
+    misses: int
+    currsize: int
+
+
+def split_frontmatter(lines: Iterable[str], max_length: int = MAX_FRONTMATTER_LENGTH) -> FrontmatterScan:
+    """
+    Find the frontmatter block in a sequence of lines.
+
+    Consumes ``lines`` only up to the closing delimiter.
+
+    Args:
+        lines: Lines of the document, with or without line endings
+        max_length: Treat the block as unclosed past this many characters
+
+    Returns:
+        FrontmatterScan with the block's text (None if absent or unclosed)
+    """
+    lines = iter(lines)
+    first = next(lines, "")
+    if first.rstrip() != DELIMITER:
+        return FrontmatterScan(None, False)
+
+    body = []
+    length = 0
+    for line in lines:
+        if line.rstrip() == DELIMITER:
+            return FrontmatterScan("".join(body), True)
+        length += len(line)
+        if length > max_length:
+            break
+        body.append(line if line.endswith("\n") else line + "\n")
+    return FrontmatterScan(None, True)
+
+
+def _read_lines(f, max_length: int) -> Iterable[str]:
+    """Yield lines of an open text file without reading past ``max_length``."""
+    remaining = max_length + 2 * MAX_LINE_LENGTH
+    while remaining > 0:
+        line = f.readline(min(MAX_LINE_LENGTH, remaining))
+        if not line:
+            return
+        remaining -= len(line)
+        yield line
+
+
+def parse_frontmatter(text: str) -> Any:
+    """Parse frontmatter text as YAML (raises yaml.YAMLError if invalid)."""
+    if yaml is None:
+        raise ImportError("PyYAML is required to parse frontmatter. Install with: pip install pyyaml")
+    return yaml.load(text, Loader=YAML_LOADER)
+
+
+def _signature(path: Union[Path, str], encoding: str) -> Tuple[Hashable, ...]:
+    """Cache key for a file; raises OSError if it cannot be stat'ed."""
+    real_path = os.path.realpath(path)
+    stat = os.stat(real_path)
+    return (real_path, stat.st_mtime_ns, stat.st_size, encoding)
+
+
+class _FrontmatterCache:
+    """Bounded LRU of scans and parsed frontmatter keyed by file signature."""
+
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, list]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[list]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Hashable, entry: list) -> None:
+        with self._lock:
+            # Drop entries for older versions of the same file
+            stale = [k for k in self._entries if k[0] == key[0] and k != key]
+            for k in stale:
+                del self._entries[k]
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> FrontmatterInfo:
+        with self._lock:
+            return FrontmatterInfo(self.hits, self.misses, len(self._entries))
+
+
+# Sentinel for "scanned but not parsed yet"
+_UNPARSED = object()
+
+_cache = _FrontmatterCache()
+
+
+def _cached_entry(path: Union[Path, str], encoding: str) -> list:
+    """Return the cache entry ``[scan, parsed]`` for a file, scanning it if needed."""
+    key = _signature(path, encoding)
+    entry = _cache.get(key)
+    if entry is None:
+        with open(key[0], "r", encoding=encoding, buffering=READ_BUFFER_SIZE) as f:
+            scan = split_frontmatter(_read_lines(f, MAX_FRONTMATTER_LENGTH))
+        entry = [scan, _UNPARSED]
+        _cache.put(key, entry)
+    return entry
+
+
+def scan_frontmatter(path: Union[Path, str], encoding: str = "utf-8") -> FrontmatterScan:
+    """
+    Read a file's frontmatter block without parsing it.
+
+    Args:
+        path: Path to the markdown file
+        encoding: File encoding
+
+    Returns:
+        FrontmatterScan for the file
+
+    Raises:
+        OSError: If the file cannot be read
+        UnicodeDecodeError: If the frontmatter is not valid in ``encoding``
+    """
+    return _cached_entry(path, encoding)[0]
+
+
+def load_frontmatter(path: Union[Path, str], encoding: str = "utf-8") -> Any:
+    """
+    Read and parse a file's YAML frontmatter.
+
+    Args:
+        path: Path to the markdown file
+        encoding: File encoding
+
+    Returns:
+        Parsed frontmatter (a private copy), or None if the file has no
+        complete frontmatter block
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the frontmatter is not valid YAML
+    """
+    entry = _cached_entry(path, encoding)
+    scan, parsed = entry
+    if scan.text is None:
+        return None
+    if parsed is _UNPARSED:
+        parsed = parse_frontmatter(scan.text)
+        entry[1] = parsed
+    return copy.deepcopy(parsed)
+
+
+def clear_cache() -> None:
+    """Forget all cached scans and parsed frontmatter."""
+    _cache.clear()
+
+
+def cache_info() -> FrontmatterInfo:
+    """Return hit/miss counts and the number of cached files."""
+    return _cache.info()
@@ -0,0 +1,348 @@
+"""
+Orchestrator Pipelines
+
+Composes BaseOrchestrator subclasses into a workflow. Each node is an
+orchestrator whose execute() keyword arguments are wired to the pipeline's
+inputs or to the outputs of other nodes. A node starts as soon as the nodes
+it depends on have finished, so independent branches overlap.
+
+Usage:
+    from shared.pipeline import Pipeline
+
+    pipeline = (
+        Pipeline()
+        .add("extract", IntelligenceExtractor(), inputs={"source_data": "input.notes"})
+        .add("personas", PersonaBuilder(), inputs={"stakeholder_data": "input.notes"})
+        .add("dashboard", DashboardUpdater(), inputs={"intelligence_data": "extract"})
+    )
+    result = pipeline.run(notes=meeting_notes)        # threads
+    result = await pipeline.arun(notes=meeting_notes)  # asyncio
+
+Input sources:
+    "input.<name>"   Keyword argument passed to run()/arun()
+    "<node>"         Whole result of another node
+    "<node>.<key>"   One key of another node's result dictionary
+"""
+
+import asyncio
+import inspect
+import time
+import typing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type
+
+from shared.base_orchestrator import BaseOrchestrator, OrchestratorError
+
+# Source prefix for values passed to run()/arun()
+PIPELINE_INPUT = "input"
+
+_NO_TYPE = object()
+
+
+class PipelineError(OrchestratorError):
+    """Raised when a pipeline is wired incorrectly."""
+
+    def __init__(self, message: str, details: Optional[Dict] = None):
+        super().__init__(message, phase="pipeline", details=details)
+
+
+def _expected_type(annotation: Any) -> Any:
+    """Return the runtime class to check an annotation against, if any."""
+    if annotation is inspect.Parameter.empty or annotation is Any:
+        return _NO_TYPE
+    origin = typing.get_origin(annotation) or annotation
+    return origin if isinstance(origin, type) else _NO_TYPE
+
+
+@dataclass(frozen=True)
+class PipelineNode:
+    """A named orchestrator and the sources of its execute() arguments."""
+    name: str
+    orchestrator: BaseOrchestrator
+    inputs: Mapping[str, Tuple[str, Optional[str]]]
+    output_type: Optional[Type] = dict
+
+    @property
+    def dependencies(self) -> Tuple[str, ...]:
+        """Nodes whose results this node consumes."""
+        return tuple(sorted({
+            source for source, _ in self.inputs.values() if source != PIPELINE_INPUT
+        }))
+
+    def parameter_types(self) -> Dict[str, Any]:
+        """Runtime types declared on execute() for each wired input."""
+        parameters = inspect.signature(self.orchestrator.execute).parameters
+        return {name: _expected_type(parameters[name].annotation)
+                for name in self.inputs if name in parameters}
+
+
+@dataclass
+class NodeResult:
+    """Outcome of one node in a pipeline run."""
+    name: str
+    status: str
+    output: Any = None
+    errors: List[Dict[str, Any]] = field(default_factory=list)
+    started_at: float = 0.0
+    duration_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True if the node produced its output."""
+        return self.status in ("success", "completed_with_errors")
+
+
+@dataclass
+class PipelineResult:
+    """Node results and timing for a pipeline run."""
+    nodes: Dict[str, NodeResult]
+    duration_seconds: float = 0.0
+
+    @property
+    def status(self) -> str:
+        """'success' if every node produced output, otherwise 'failed'."""
+        return "success" if all(node.ok for node in self.nodes.values()) else "failed"
+
+    @property
+    def outputs(self) -> Dict[str, Any]:
+        """Outputs of the nodes that succeeded."""
+        return {name: node.output for name, node in self.nodes.items() if node.ok}
+
+    def __getitem__(self, name: str) -> NodeResult:
+        return self.nodes[name]
+
+
+class Pipeline:
+    """
+    Directed acyclic graph of orchestrators.
+
+    Wiring is checked when nodes are added and when the pipeline runs:
+    unknown sources, cycles and inputs that execute() does not accept raise
+    PipelineError. At run time an input whose value does not match the
+    execute() annotation, or an output that is not ``output_type``, fails
+    that node. Nodes downstream of a failed node are skipped; other
+    branches keep running.
+
+    Each orchestrator instance may appear in one node only, since run state
+    is tracked per instance.
+    """
+
+    def __init__(self):
+        self._nodes: Dict[str, PipelineNode] = {}
+
+    def add(
+        self,
+        name: str,
+        orchestrator: BaseOrchestrator,
+        inputs: Optional[Mapping[str, str]] = None,
+        output_type: Optional[Type] = dict
+    ) -> "Pipeline":
+        """
+        Add a node.
+
+        Args:
+            name: Unique node name (cannot contain '.' or be 'input')
+            orchestrator: Orchestrator to run for this node
+            inputs: execute() keyword argument -> source (see module docs)
+            output_type: Expected type of the execute() result, or None
+
+        Returns:
+            The pipeline, for chaining
+        """
+        if not name or "." in name or name == PIPELINE_INPUT:
+            raise PipelineError(f"Invalid node name: {name!r}")
+        if name in self._nodes:
+            raise PipelineError(f"Duplicate node name: {name}")
+        if any(node.orchestrator is orchestrator for node in self._nodes.values()):
+            raise PipelineError(f"Orchestrator for '{name}' is already used by another node")
+
+        parsed = {}
+        for parameter, source in (inputs or {}).items():
+            node_name, _, key = source.partition(".")
+            if node_name == PIPELINE_INPUT and not key:
+                raise PipelineError(f"'{name}.{parameter}': pipeline inputs are referenced as 'input.<name>'")
+            parsed[parameter] = (node_name, key or None)
+
+        parameters = inspect.signature(orchestrator.execute).parameters
+        accepts_kwargs = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values())
+        unknown = [p for p in parsed if p not in parameters and not accepts_kwargs]
+        if unknown:
+            raise PipelineError(
+                f"'{name}': {type(orchestrator).__name__}.execute() has no parameter(s) {', '.join(unknown)}"
+            )
+        missing = [
+            p.name for p in parameters.values()
+            if p.default is inspect.Parameter.empty
+            and p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+            and p.name not in parsed
+        ]
+        if missing:
+            raise PipelineError(f"'{name}': no source for required input(s) {', '.join(missing)}")
+
+        self._nodes[name] = PipelineNode(name, orchestrator, parsed, output_type)
+        return self
+
+    @property
+    def nodes(self) -> Dict[str, PipelineNode]:
+        """Nodes by name, in insertion order."""
+        return dict(self._nodes)
+
+    def _sorter(self) -> TopologicalSorter:
+        """Build a prepared topological sorter, validating the graph."""
+        sorter: TopologicalSorter = TopologicalSorter()
+        for node in self._nodes.values():
+            for dependency in node.dependencies:
+                if dependency not in self._nodes:
+                    raise PipelineError(f"'{node.name}' depends on unknown node '{dependency}'")
+            sorter.add(node.name, *node.dependencies)
+        try:
+            sorter.prepare()
+        except CycleError as e:
+            raise PipelineError(f"Pipeline has a cycle: {' -> '.join(e.args[1])}") from e
+        return sorter
+
+    def order(self) -> List[str]:
+        """Return node names in a valid execution order."""
+        return list(self._sorter().static_order())
+
+    # =========================================================================
+    # Execution
+    # =========================================================================
+
+    def _prepare(self, node: PipelineNode, inputs: Dict[str, Any],
+                 results: Dict[str, NodeResult]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Collect a node's keyword arguments, or return why it cannot run."""
+        failed = [d for d in node.dependencies if not results[d].ok]
+        if failed:
+            return None, f"Skipped: upstream node(s) {', '.join(failed)} did not succeed"
+
+        types = node.parameter_types()
+        kwargs = {}
+        for parameter, (source, key) in node.inputs.items():
+            if source == PIPELINE_INPUT:
+                if key not in inputs:
+                    return None, f"Missing pipeline input '{key}'"
+                value = inputs[key]
+            else:
+                value = results[source].output
+                if key is not None:
+                    if not isinstance(value, Mapping) or key not in value:
+                        return None, f"'{source}' result has no key '{key}'"
+                    value = value[key]
+            expected = types.get(parameter, _NO_TYPE)
+            if expected is not _NO_TYPE and not isinstance(value, expected):
+                return None, (f"Input '{parameter}' is {type(value).__name__}, "
+                              f"expected {expected.__name__}")
+            kwargs[parameter] = value
+        return kwargs, None
+
+    def _finish(self, node: PipelineNode, run: Dict[str, Any], started_at: float,
+                duration: float) -> NodeResult:
+        """Convert an orchestrator run() result into a NodeResult."""
+        status, output = run["status"], run["result"]
+        errors = list(run["errors"])
+        if status != "failed" and node.output_type is not None and not isinstance(output, node.output_type):
+            status = "failed"
+            errors.append({"message": f"Output is {type(output).__name__}, "
+                                      f"expected {node.output_type.__name__}",
+                           "code": "PIPELINE_OUTPUT_TYPE"})
+        return NodeResult(node.name, status, output, errors, started_at, duration)
+
+    @staticmethod
+    def _not_run(name: str, message: str, started_at: float) -> NodeResult:
+        status = "skipped" if message.startswith("Skipped") else "failed"
+        return NodeResult(name, status, errors=[{"message": message, "code": "PIPELINE_INPUT"}],
+                          started_at=started_at)
+
+    def run(self, max_workers: Optional[int] = None, **inputs) -> PipelineResult:
+        """
+        Run the pipeline on a thread pool.
+
+        Args:
+            max_workers: Maximum nodes running at once (default: node count)
+            **inputs: Values referenced as ``input.<name>``
+
+        Returns:
+            PipelineResult with every node's outcome
+        """
+        sorter = self._sorter()
+        results: Dict[str, NodeResult] = {}
+        clock = time.perf_counter()
+
+        def execute(node: PipelineNode, kwargs: Dict[str, Any]) -> NodeResult:
+            started = time.perf_counter()
+            run = node.orchestrator.run(**kwargs)
+            return self._finish(node, run, started - clock, time.perf_counter() - started)
+
+        with ThreadPoolExecutor(max_workers=max_workers or max(len(self._nodes), 1)) as executor:
+            running: Dict[Future, str] = {}
+            while sorter.is_active():
+                for name in sorter.get_ready():
+                    node = self._nodes[name]
+                    kwargs, problem = self._prepare(node, inputs, results)
+                    if problem is not None:
+                        results[name] = self._not_run(name, problem, time.perf_counter() - clock)
+                        sorter.done(name)
+                    else:
+                        running[executor.submit(execute, node, kwargs)] = name
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    results[name] = future.result()
+                    sorter.done(name)
+
+        return PipelineResult(self._ordered(results), time.perf_counter() - clock)
+
+    async def arun(self, concurrency: Optional[int] = None, **inputs) -> PipelineResult:
+        """
+        Run the pipeline on the current event loop via each node's arun().
+
+        Args:
+            concurrency: Maximum nodes running at once (default: unlimited)
+            **inputs: Values referenced as ``input.<name>``
+
+        Returns:
+            PipelineResult with every node's outcome
+        """
+        sorter = self._sorter()
+        results: Dict[str, NodeResult] = {}
+        clock = time.perf_counter()
+        limit = asyncio.Semaphore(concurrency or max(len(self._nodes), 1))
+
+        async def execute(node: PipelineNode, kwargs: Dict[str, Any]) -> NodeResult:
+            async with limit:
+                started = time.perf_counter()
+                run = await node.orchestrator.arun(**kwargs)
+                return self._finish(node, run, started - clock, time.perf_counter() - started)
+
+        running: Dict[asyncio.Task, str] = {}
+        try:
+            while sorter.is_active():
+                for name in sorter.get_ready():
+                    node = self._nodes[name]
+                    kwargs, problem = self._prepare(node, inputs, results)
+                    if problem is not None:
+                        results[name] = self._not_run(name, problem, time.perf_counter() - clock)
+                        sorter.done(name)
+                    else:
+                        running[asyncio.ensure_future(execute(node, kwargs))] = name
+                if not running:
+                    continue
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    name = running.pop(task)
+                    results[name] = task.result()
+                    sorter.done(name)
+        finally:
+            for task in running:
+                task.cancel()
+
+        return PipelineResult(self._ordered(results), time.perf_counter() - clock)
+
+    def _ordered(self, results: Dict[str, NodeResult]) -> Dict[str, NodeResult]:
+        """Return results in node insertion order."""
+        return {name: results[name] for name in self._nodes}
@@ -0,0 +1,208 @@
+"""
+Orchestrator Pooling
+
+Reuses initialized orchestrators across jobs instead of constructing a new
+one per request. Instances are pooled by class and configuration
+fingerprint, reset() when returned, capped per key, and dropped once they
+have been idle too long.
+
+Usage:
+    from shared.pool import OrchestratorPool
+
+    pool = OrchestratorPool(max_size=8, max_idle_seconds=300)
+
+    with pool.lease(MySkillOrchestrator, config_path="config/skill.yaml") as orch:
+        result = orch.run(**job)
+
+Subclasses that keep per-job state outside the base result/error tracking
+should override reset() (calling super().reset()) so returned instances
+start clean. A job that replaces ``orch.config`` gets its instance
+discarded rather than pooled.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, NamedTuple, Optional, Tuple, Type, Union
+
+from shared.base_orchestrator import BaseOrchestrator
+
+
+class PoolInfo(NamedTuple):
+    """Pool statistics, in the style of functools.lru_cache."""
+    hits: int
+    misses: int
+    evictions: int
+    idle: int
+
+
+def config_fingerprint(config: Any) -> str:
+    """Return a stable digest of a configuration dictionary."""
+    encoded = json.dumps(config, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _path_fingerprint(path: Union[Path, str]) -> Tuple[str, Optional[Tuple[int, int]]]:
+    """Identify a config file by real path and current modification stamp."""
+    real_path = os.path.realpath(path)
+    try:
+        stat = os.stat(real_path)
+    except OSError:
+        return (real_path, None)
+    return (real_path, (stat.st_mtime_ns, stat.st_size))
+
+
+class OrchestratorPool:
+    """Thread-safe pool of initialized orchestrators."""
+
+    def __init__(self, max_size: int = 8, max_idle_seconds: Optional[float] = 300.0):
+        """
+        Args:
+            max_size: Idle instances kept per class/config (0 disables pooling)
+            max_idle_seconds: Drop instances idle longer than this (None = never)
+        """
+        if max_size < 0:
+            raise ValueError("max_size cannot be negative")
+        self.max_size = max_size
+        self.max_idle_seconds = max_idle_seconds
+        # key -> deque of (orchestrator, returned_at), most recent on the right
+        self._idle: Dict[Hashable, deque] = {}
+        # leased orchestrator -> (key, config object it was handed out with)
+        self._leased: "weakref.WeakKeyDictionary[BaseOrchestrator, Tuple[Hashable, Any]]" = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _key(
+        cls: Type[BaseOrchestrator],
+        config: Optional[Dict[str, Any]],
+        config_path: Optional[Union[Path, str]],
+        kwargs: Dict[str, Any]
+    ) -> Hashable:
+        if config is not None:
+            source: Hashable = ("config", config_fingerprint(config))
+        elif config_path is not None:
+            # Changing the file changes the key, so stale instances age out
+            source = ("path", _path_fingerprint(config_path))
+        else:
+            source = ("defaults",)
+        return (cls, source, tuple(sorted(kwargs.items())))
+
+    def acquire(
+        self,
+        cls: Type[BaseOrchestrator],
+        config: Optional[Dict[str, Any]] = None,
+        config_path: Optional[Union[Path, str]] = None,
+        **kwargs
+    ) -> BaseOrchestrator:
+        """
+        Return an initialized orchestrator, reusing an idle one if possible.
+
+        Arguments are those of the orchestrator's constructor. Pass the
+        instance back with ``release()`` when the job is done.
+        """
+        key = self._key(cls, config, config_path, kwargs)
+        with self._lock:
+            self._evict_idle_locked(time.monotonic())
+            idle = self._idle.get(key)
+            if idle:
+                orchestrator = idle.pop()[0]
+                if not idle:
+                    del self._idle[key]
+                self._hits += 1
+                self._leased[orchestrator] = (key, orchestrator.config)
+                return orchestrator
+            self._misses += 1
+
+        # Construct outside the lock; initialization may be slow
+        orchestrator = cls(config=config, config_path=config_path, **kwargs)
+        with self._lock:
+            self._leased[orchestrator] = (key, orchestrator.config)
+        return orchestrator
+
+    def release(self, orchestrator: BaseOrchestrator) -> None:
+        """
+        Reset an orchestrator and return it to the pool.
+
+        Instances that were not acquired from this pool, whose config was
+        replaced, whose reset() fails, or that exceed ``max_size`` are
+        discarded.
+        """
+        with self._lock:
+            lease = self._leased.pop(orchestrator, None)
+        if lease is None:
+            return
+        key, config = lease
+        if orchestrator.config is not config:
+            return
+        try:
+            orchestrator.reset()
+        except Exception:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.setdefault(key, deque())
+            if len(idle) >= self.max_size:
+                self._evictions += 1
+                if not idle:
+                    del self._idle[key]
+                return
+            idle.append((orchestrator, now))
+            self._evict_idle_locked(now)
+
+    @contextmanager
+    def lease(
+        self,
+        cls: Type[BaseOrchestrator],
+        config: Optional[Dict[str, Any]] = None,
+        config_path: Optional[Union[Path, str]] = None,
+        **kwargs
+    ) -> Iterator[BaseOrchestrator]:
+        """Context manager that acquires an orchestrator and releases it after use."""
+        orchestrator = self.acquire(cls, config=config, config_path=config_path, **kwargs)
+        try:
+            yield orchestrator
+        finally:
+            self.release(orchestrator)
+
+    def evict_idle(self) -> int:
+        """Drop instances idle longer than ``max_idle_seconds``; return how many."""
+        with self._lock:
+            return self._evict_idle_locked(time.monotonic())
+
+    def _evict_idle_locked(self, now: float) -> int:
+        if self.max_idle_seconds is None:
+            return 0
+        cutoff = now - self.max_idle_seconds
+        evicted = 0
+        for key in list(self._idle):
+            idle = self._idle[key]
+            while idle and idle[0][1] < cutoff:
+                idle.popleft()
+                evicted += 1
+            if not idle:
+                del self._idle[key]
+        self._evictions += evicted
+        return evicted
+
+    def clear(self) -> None:
+        """Drop every idle instance and reset the counters."""
+        with self._lock:
+            self._idle.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> PoolInfo:
+        """Return hit, miss and eviction counts and the idle instance count."""
+        with self._lock:
+            idle = sum(len(entries) for entries in self._idle.values())
+            return PoolInfo(self._hits, self._misses, self._evictions, idle)
@@ -0,0 +1,369 @@
+"""
+Phase Profiling
+
+Records nested timing spans for the phases of an orchestrator run: wall
+time, CPU time of the running thread and, optionally, peak Python memory
+(via tracemalloc). Spans can be exported as OpenTelemetry (OTLP/JSON)
+traces or as collapsed stacks for flamegraph tools.
+
+Usage:
+    from shared.profiling import PhaseProfiler, phase
+
+    profiler = PhaseProfiler(memory=True)
+    with profiler.span("validation"):
+        with profiler.span("math"):
+            ...
+    profiler.write_otel("trace.json")
+    profiler.write_collapsed("run.folded")   # flamegraph.pl run.folded > run.svg
+
+    class MySkillOrchestrator(BaseOrchestrator):
+        @phase("populate")
+        def populate(self): ...              # timed by self.profiler
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+
+class Span:
+    """One timed phase."""
+
+    __slots__ = (
+        "name", "span_id", "parent_id", "start_ns", "end_ns",
+        "cpu_ns", "peak_memory", "attributes", "error", "_owner", "_parent",
+        "_cpu_start", "_memory_start", "_peak_seen",
+    )
+
+    def __init__(self, name: str, span_id: int, parent: Optional["Span"],
+                 attributes: Dict[str, Any], owner: "PhaseProfiler"):
+        self.name = name
+        self.span_id = span_id
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attributes = attributes
+        self.start_ns = 0
+        self.end_ns = 0
+        self.cpu_ns: Optional[int] = None
+        self.peak_memory: Optional[int] = None
+        self.error: Optional[str] = None
+        self._owner = owner
+        self._parent = parent
+        self._cpu_start = 0
+        self._memory_start = 0
+        self._peak_seen = 0
+
+    @property
+    def duration_seconds(self) -> float:
+        """Wall-clock duration."""
+        return (self.end_ns - self.start_ns) / 1e9
+
+    @property
+    def cpu_seconds(self) -> Optional[float]:
+        """CPU time used by the thread that ran the span (None if not measured)."""
+        return None if self.cpu_ns is None else self.cpu_ns / 1e9
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the span as a plain dictionary."""
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "duration_seconds": self.duration_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "peak_memory_bytes": self.peak_memory,
+            "attributes": dict(self.attributes),
+            "error": self.error,
+        }
+
+
+# Innermost open span in the current thread or asyncio task. Context
+# variables follow asyncio.to_thread, so spans opened inside a worker
+# thread still nest under the span that awaited it.
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class PhaseProfiler:
+    """
+    Collects nested spans.
+
+    Nesting follows the current thread or asyncio task. Memory tracking
+    starts tracemalloc on first use (and stops it again when the last open
+    span ends), which slows allocation noticeably; leave ``memory`` off
+    except when investigating. Peaks are process-wide, so spans running
+    concurrently on other threads share them.
+    """
+
+    def __init__(self, service_name: str = "orchestrator", memory: bool = False, enabled: bool = True):
+        """
+        Args:
+            service_name: Reported as service.name in OpenTelemetry output
+            memory: Record peak traced memory per span
+            enabled: Record spans at all; disabled spans cost one check
+        """
+        self.service_name = service_name
+        self.memory = memory
+        self.enabled = enabled
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._open = 0
+        self._started_tracemalloc = False
+        self._trace_id = os.urandom(16).hex()
+        # Converts perf_counter readings to Unix time for exports
+        self._wall_anchor_ns = time.time_ns()
+        self._clock_anchor_ns = time.perf_counter_ns()
+
+    def current(self) -> Optional[Span]:
+        """Return the innermost open span of this profiler, if any."""
+        span = _current_span.get()
+        while span is not None and span._owner is not self:
+            span = span._parent
+        return span
+
+    @contextmanager
+    def span(self, name: str, cpu: bool = True, **attributes) -> Iterator[Optional[Span]]:
+        """
+        Time a block as a child of the enclosing span in this thread or task.
+
+        Args:
+            name: Phase name
+            cpu: Record the thread's CPU time. Pass False for spans that
+                await: the event loop thread also runs other tasks then,
+                so its CPU time would be charged to this span.
+            **attributes: Extra attributes to export with the span
+
+        Yields:
+            The open Span (None when the profiler is disabled)
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        parent = self.current()
+        with self._lock:
+            span_id = self._next_id
+            self._next_id += 1
+            self._open += 1
+        span = Span(name, span_id, parent, attributes, self)
+
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            current, peak = tracemalloc.get_traced_memory()
+            if parent is not None:
+                parent._peak_seen = max(parent._peak_seen, peak)
+            tracemalloc.reset_peak()
+            span._memory_start = current
+            span._peak_seen = current
+
+        token = _current_span.set(span)
+        if cpu:
+            span._cpu_start = time.thread_time_ns()
+        span.start_ns = time.perf_counter_ns()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.perf_counter_ns()
+            if cpu:
+                span.cpu_ns = time.thread_time_ns() - span._cpu_start
+            _current_span.reset(token)
+
+            if self.memory and tracemalloc.is_tracing():
+                peak = max(span._peak_seen, tracemalloc.get_traced_memory()[1])
+                span.peak_memory = peak - span._memory_start
+                if parent is not None:
+                    parent._peak_seen = max(parent._peak_seen, peak)
+                    tracemalloc.reset_peak()
+
+            with self._lock:
+                self.spans.append(span)
+                self._open -= 1
+                if self._open == 0 and self._started_tracemalloc:
+                    tracemalloc.stop()
+                    self._started_tracemalloc = False
+
+    def phase(self, name: Optional[str] = None) -> Callable:
+        """
+        Decorator that runs a function inside a span (default: its name).
+
+        Coroutine functions are timed until they finish, wall time only.
+        """
+        def decorator(func: Callable) -> Callable:
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(name or func.__name__, cpu=False):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name or func.__name__):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def clear(self) -> None:
+        """Discard recorded spans."""
+        with self._lock:
+            self.spans = []
+
+    # =========================================================================
+    # Summaries and Export
+    # =========================================================================
+
+    def _paths(self) -> Dict[int, str]:
+        """Map span ids to their ';'-joined stack of names."""
+        by_id = {span.span_id: span for span in self.spans}
+        paths: Dict[int, str] = {}
+
+        def path(span: Span) -> str:
+            if span.span_id not in paths:
+                parent = by_id.get(span.parent_id)
+                paths[span.span_id] = f"{path(parent)};{span.name}" if parent else span.name
+            return paths[span.span_id]
+
+        for span in self.spans:
+            path(span)
+        return paths
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate spans by stack path.
+
+        Returns:
+            {"run;validate": {"calls", "duration_seconds", "cpu_seconds",
+            "peak_memory_bytes"}} in order of first appearance; cpu_seconds
+            is None for paths whose spans only measured wall time
+        """
+        totals: Dict[str, Dict[str, Any]] = {}
+        paths = self._paths()
+        for span in sorted(self.spans, key=lambda s: s.start_ns):
+            entry = totals.setdefault(paths[span.span_id], {
+                "calls": 0, "duration_seconds": 0.0, "cpu_seconds": None, "peak_memory_bytes": None,
+            })
+            entry["calls"] += 1
+            entry["duration_seconds"] += span.duration_seconds
+            if span.cpu_seconds is not None:
+                entry["cpu_seconds"] = (entry["cpu_seconds"] or 0.0) + span.cpu_seconds
+            if span.peak_memory is not None:
+                entry["peak_memory_bytes"] = max(entry["peak_memory_bytes"] or 0, span.peak_memory)
+        return totals
+
+    def to_collapsed(self, weight: str = "wall") -> str:
+        """
+        Render spans as collapsed stacks ("a;b;c <microseconds>" per line).
+
+        Each line carries the span's self time (its time minus its
+        children's), so a flamegraph of the output adds up correctly.
+
+        Args:
+            weight: 'wall' or 'cpu' time
+        """
+        if weight not in ("wall", "cpu"):
+            raise ValueError("weight must be 'wall' or 'cpu'")
+
+        def amount(span: Span) -> int:
+            return span.end_ns - span.start_ns if weight == "wall" else (span.cpu_ns or 0)
+
+        child_time: Dict[int, int] = defaultdict(int)
+        for span in self.spans:
+            if span.parent_id is not None:
+                child_time[span.parent_id] += amount(span)
+
+        stacks: Dict[str, int] = defaultdict(int)
+        paths = self._paths()
+        for span in self.spans:
+            stacks[paths[span.span_id]] += max(amount(span) - child_time[span.span_id], 0)
+
+        return "".join(f"{stack} {ns // 1000}\n" for stack, ns in stacks.items())
+
+    def _unix_ns(self, perf_ns: int) -> str:
+        return str(self._wall_anchor_ns + (perf_ns - self._clock_anchor_ns))
+
+    def to_otel(self) -> Dict[str, Any]:
+        """Return spans as an OTLP/JSON ``ExportTraceServiceRequest``."""
+        def attribute(key: str, value: Any) -> Dict[str, Any]:
+            if isinstance(value, bool):
+                return {"key": key, "value": {"boolValue": value}}
+            if isinstance(value, int):
+                return {"key": key, "value": {"intValue": str(value)}}
+            if isinstance(value, float):
+                return {"key": key, "value": {"doubleValue": value}}
+            return {"key": key, "value": {"stringValue": str(value)}}
+
+        spans = []
+        for span in self.spans:
+            attributes = [attribute(k, v) for k, v in span.attributes.items()]
+            if span.cpu_ns is not None:
+                attributes.append(attribute("process.cpu.time_ns", span.cpu_ns))
+            if span.peak_memory is not None:
+                attributes.append(attribute("process.memory.peak_bytes", span.peak_memory))
+            record = {
+                "traceId": self._trace_id,
+                "spanId": f"{span.span_id:016x}",
+                "name": span.name,
+                "kind": 1,
+                "startTimeUnixNano": self._unix_ns(span.start_ns),
+                "endTimeUnixNano": self._unix_ns(span.end_ns),
+                "attributes": attributes,
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+            }
+            if span.parent_id is not None:
+                record["parentSpanId"] = f"{span.parent_id:016x}"
+            spans.append(record)
+
+        return {"resourceSpans": [{
+            "resource": {"attributes": [attribute("service.name", self.service_name)]},
+            "scopeSpans": [{"scope": {"name": "shared.profiling"}, "spans": spans}],
+        }]}
+
+    def write_otel(self, path: Union[Path, str]) -> None:
+        """Write the OTLP/JSON trace to a file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_otel(), f, indent=2)
+
+    def write_collapsed(self, path: Union[Path, str], weight: str = "wall") -> None:
+        """Write collapsed stacks to a file for flamegraph tools."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_collapsed(weight))
+
+
+def phase(name: Optional[str] = None) -> Callable:
+    """
+    Decorator for orchestrator methods that times them as a phase.
+
+    Uses the instance's ``profiler`` attribute, so it works on any
+    BaseOrchestrator subclass. Async methods are timed until they finish,
+    wall time only.
+
+    Args:
+        name: Phase name (default: the method name)
+    """
+    def decorator(method: Callable) -> Callable:
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                with self.profiler.span(name or method.__name__, cpu=False):
+                    return await method(self, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.profiler.span(name or method.__name__):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -7,6 +7,9 @@ package generation.
 
 Main Components:
     - Form990EZOrchestrator: Main workflow coordinator for 990-EZ preparation
+    - run_batch: Non-interactive preparation of many returns in one run
+    - FieldPlan: Form population plan compiled from form-mappings.yaml
+    - RuleEngine: Compiled mathematical validation rules, vectorized over many forms
 
 Example:
     >>> from form_990ez.src import Form990EZOrchestrator
@@ -14,11 +17,24 @@ Example:
     >>> package = orchestrator.prepare_filing()
 """
 
+from .batch import BatchReport, InvalidRecord, iter_records, prepare_batch, prepare_parallel, run_batch
+from .field_plan import FieldPlan, MappingError
 from .orchestrator import Form990EZOrchestrator, main
+from .rule_engine import RuleEngine, RuleError
 
 __all__ = [
     "Form990EZOrchestrator",
     "main",
+    "BatchReport",
+    "InvalidRecord",
+    "iter_records",
+    "prepare_batch",
+    "prepare_parallel",
+    "run_batch",
+    "FieldPlan",
+    "MappingError",
+    "RuleEngine",
+    "RuleError",
 ]
 
 __version__ = "1.0.0"
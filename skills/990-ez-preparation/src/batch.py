@@ -0,0 +1,451 @@
+"""
+IRS Form 990-EZ Batch Preparation
+Non-interactive driver for preparing many returns in one run
+
+Reads organization records from a directory of JSON files or a JSONL
+stream, runs eligibility, form population, validation and filing package
+generation for each one, and writes one result per organization.
+
+Usage:
+    python src/batch.py records.jsonl --output results/
+    python src/batch.py records/ --output results.jsonl --config config/
+    python src/batch.py records.jsonl --output results/ --workers 32
+    python src/batch.py records.jsonl --output results/ -j 8 --config-snapshots
+    cat records.jsonl | python src/batch.py - --output -
+
+Record format (one JSON object per organization):
+    {
+        "organization": {"legal_name": ..., "ein": ..., "classification": ...},
+        "financial": {"revenue": {...}, "expenses": {...}, "expense_lines": {...},
+                      "balance_sheet": {...}},
+        "programs": [{"number": 1, "description": ..., "expenses": ...}],
+        "governance": {"officers": [...], "policies": {...}}
+    }
+
+Version: 1.0.0
+Author: 360 Social Impact Studios
+Date: November 2025
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Union
+
+try:
+    from .orchestrator import Form990EZOrchestrator
+except ImportError:
+    from orchestrator import Form990EZOrchestrator  # type: ignore[no-redef]
+
+
+@dataclass
+class BatchReport:
+    """Summary of a batch preparation run."""
+    total: int = 0
+    filing_ready: int = 0
+    needs_review: int = 0
+    ineligible: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Returns processed per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total / self.elapsed_seconds
+
+    def record(self, status: str) -> None:
+        """Count one result by status."""
+        self.total += 1
+        setattr(self, status, getattr(self, status) + 1)
+
+
+# ============================================================================
+# INPUT
+# ============================================================================
+
+@dataclass
+class InvalidRecord:
+    """Input that could not be parsed as a record; prepared as ``failed``."""
+    source: str
+    line: int
+    error: str
+
+
+# A parsed organization record, or the parse error that replaced it
+Record = Union[Dict, InvalidRecord]
+
+
+def _iter_jsonl(stream: TextIO, source: str) -> Iterator[Record]:
+    """Yield records from a JSONL stream, skipping blank lines."""
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            yield InvalidRecord(source, line_number, f"Invalid JSON: {e}")
+
+
+def _load_json(path: Path) -> Record:
+    """Load a single-record JSON file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            record: Dict = json.load(f)
+        except json.JSONDecodeError as e:
+            return InvalidRecord(str(path), e.lineno, f"Invalid JSON: {e}")
+    return record
+
+
+def iter_records(source: Union[str, Path]) -> Iterator[Record]:
+    """
+    Yield organization records from a directory, JSONL file or stdin.
+
+    Unparsable input does not stop the stream: each bad line (or ``.json``
+    file) is yielded as an ``InvalidRecord``, which ``prepare_record``
+    reports as a ``failed`` result.
+
+    Args:
+        source: Directory of ``*.json``/``*.jsonl`` files, a JSONL file,
+            or ``"-"`` for a JSONL stream on stdin
+
+    Returns:
+        Iterator over record dictionaries, in a stable order
+    """
+    if str(source) == "-":
+        yield from _iter_jsonl(sys.stdin, "<stdin>")
+        return
+
+    path = Path(source)
+    if path.is_dir():
+        for file_path in sorted(path.iterdir()):
+            if file_path.suffix == ".json":
+                yield _load_json(file_path)
+            elif file_path.suffix == ".jsonl":
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    yield from _iter_jsonl(f, str(file_path))
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from _iter_jsonl(f, str(path))
+
+
+# ============================================================================
+# PREPARATION
+# ============================================================================
+
+def prepare_record(orchestrator: Form990EZOrchestrator, record: Record) -> Dict:
+    """
+    Prepare one return, converting unexpected failures into a result.
+
+    A malformed record must not abort a run of thousands, so exceptions are
+    reported as ``failed`` results instead of propagating.
+    """
+    if isinstance(record, InvalidRecord):
+        return {
+            'organization': None,
+            'ein': None,
+            'status': 'failed',
+            'error': record.error,
+            'source': record.source,
+            'line': record.line,
+        }
+    try:
+        return orchestrator.prepare_return(record)
+    except Exception as e:
+        organization = record.get('organization', {}) if isinstance(record, dict) else {}
+        return {
+            'organization': organization.get('legal_name'),
+            'ein': organization.get('ein'),
+            'status': 'failed',
+            'error': f"{type(e).__name__}: {e}",
+        }
+
+
+def prepare_batch(
+    records: Iterable[Record],
+    config_path: str = "config/",
+    snapshot: bool = False,
+) -> Iterator[Dict]:
+    """
+    Prepare returns for a stream of records with a single orchestrator.
+
+    Configuration is loaded once and the orchestrator is reused for every
+    record, so per-return cost is only the workflow itself.
+
+    Args:
+        records: Organization records accepted by ``load_record``
+        config_path: Path to configuration directory
+        snapshot: Reuse binary config snapshots (see ``Form990EZOrchestrator``)
+
+    Returns:
+        Iterator over result dictionaries, in input order
+    """
+    orchestrator = Form990EZOrchestrator(config_path=config_path, quiet=True, snapshot=snapshot)
+    for record in records:
+        yield prepare_record(orchestrator, record)
+
+
+# Per-process orchestrator, created once by the pool initializer
+_worker_orchestrator: Optional[Form990EZOrchestrator] = None
+
+
+def _init_worker(config_path: str, snapshot: bool = False) -> None:
+    """Load the YAML configuration once per worker process."""
+    global _worker_orchestrator
+    _worker_orchestrator = Form990EZOrchestrator(
+        config_path=config_path, quiet=True, snapshot=snapshot
+    )
+
+
+def _prepare_chunk(records: List[Record]) -> List[Dict]:
+    """Prepare a chunk of records inside a worker process."""
+    orchestrator = _worker_orchestrator
+    if orchestrator is None:
+        raise RuntimeError("Worker process was not initialized with _init_worker")
+    return [prepare_record(orchestrator, record) for record in records]
+
+
+def _chunked(records: Iterable[Record], size: int) -> Iterator[List[Record]]:
+    """Split a record stream into lists of at most ``size`` records."""
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def prepare_parallel(
+    records: Iterable[Record],
+    config_path: str = "config/",
+    workers: Optional[int] = None,
+    chunk_size: int = 32,
+    snapshot: bool = False,
+) -> Iterator[Dict]:
+    """
+    Prepare returns across a pool of worker processes.
+
+    Each worker builds one orchestrator when it starts, so the three YAML
+    configs are parsed once per process rather than once per return.
+    Records are shipped in chunks to amortize inter-process overhead, and
+    at most two chunks per worker are in flight so memory stays bounded on
+    large inputs. Results are yielded in input order regardless of which
+    worker finishes first.
+
+    Args:
+        records: Organization records accepted by ``load_record``
+        config_path: Path to configuration directory
+        workers: Number of worker processes (default: CPU count)
+        chunk_size: Records sent to a worker per task
+        snapshot: Reuse binary config snapshots, so workers after the first
+            skip YAML parsing (writes ``.<name>.snapshot`` files into
+            ``config_path``)
+
+    Returns:
+        Iterator over result dictionaries, in input order
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(config_path, snapshot),
+    ) as executor:
+        pending: deque = deque()
+        for chunk in _chunked(records, chunk_size):
+            pending.append(executor.submit(_prepare_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+class ResultWriter:
+    """Writes one result per organization to a directory or JSONL stream."""
+
+    def __init__(self, output: Union[str, Path]):
+        """
+        Args:
+            output: Directory for one JSON file per organization, a
+                ``.jsonl`` file, or ``"-"`` for JSONL on stdout
+        """
+        self.output = str(output)
+        self._stream: Optional[TextIO] = None
+        self._directory: Optional[Path] = None
+
+        if self.output == "-":
+            self._stream = sys.stdout
+        elif self.output.endswith(".jsonl"):
+            Path(self.output).parent.mkdir(parents=True, exist_ok=True)
+            self._stream = open(self.output, 'w', encoding='utf-8')
+        else:
+            self._directory = Path(self.output)
+            self._directory.mkdir(parents=True, exist_ok=True)
+
+    def write(self, index: int, result: Dict) -> None:
+        """Write a single result."""
+        if self._stream is not None:
+            self._stream.write(json.dumps(result, default=str) + "\n")
+            return
+
+        slug = re.sub(r"[^0-9A-Za-z]+", "", str(result.get('ein') or '')) or "org"
+        assert self._directory is not None
+        file_path = self._directory / f"{index:05d}_{slug}.json"
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, default=str)
+
+    def close(self) -> None:
+        """Flush and close the output stream, if any."""
+        if self._stream is not None and self._stream is not sys.stdout:
+            self._stream.close()
+        elif self._stream is not None:
+            self._stream.flush()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_results(results: Iterable[Dict], output: Union[str, Path]) -> BatchReport:
+    """
+    Write results as they are produced and tally a report.
+
+    Args:
+        results: Result dictionaries in output order
+        output: Destination accepted by ``ResultWriter``
+
+    Returns:
+        BatchReport with status counts and elapsed wall-clock time
+    """
+    report = BatchReport()
+    started = time.perf_counter()
+
+    with ResultWriter(output) as writer:
+        for index, result in enumerate(results):
+            writer.write(index, result)
+            report.record(result['status'])
+
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+def run_batch(
+    source: Union[str, Path],
+    output: Union[str, Path],
+    config_path: str = "config/",
+    workers: int = 1,
+    snapshot: bool = False,
+) -> BatchReport:
+    """
+    Prepare every record in ``source`` and write results to ``output``.
+
+    Args:
+        source: Input accepted by ``iter_records``
+        output: Destination accepted by ``ResultWriter``
+        config_path: Path to configuration directory
+        workers: Worker processes; 1 runs in-process, 0 uses every CPU
+        snapshot: Reuse binary config snapshots (see ``prepare_parallel``)
+
+    Returns:
+        BatchReport for the run
+    """
+    records = iter_records(source)
+    if workers == 1:
+        results = prepare_batch(records, config_path, snapshot=snapshot)
+    else:
+        results = prepare_parallel(
+            records, config_path, workers=workers or None, snapshot=snapshot
+        )
+    return write_results(results, output)
+
+
+def print_report(report: BatchReport, stream: TextIO = sys.stderr) -> None:
+    """Print the throughput summary for a batch run."""
+    print("\n" + "="*70, file=stream)
+    print("FORM 990-EZ BATCH PREPARATION SUMMARY", file=stream)
+    print("="*70, file=stream)
+    print(f"  Returns processed: {report.total}", file=stream)
+    print(f"  Filing ready:      {report.filing_ready}", file=stream)
+    print(f"  Needs review:      {report.needs_review}", file=stream)
+    print(f"  Ineligible:        {report.ineligible}", file=stream)
+    print(f"  Failed:            {report.failed}", file=stream)
+    print(f"\n  Elapsed:    {report.elapsed_seconds:.2f}s", file=stream)
+    print(f"  Throughput: {report.throughput:,.1f} returns/sec", file=stream)
+    print("="*70 + "\n", file=stream)
+
+
+def _worker_count(value: str) -> int:
+    """argparse type for ``--workers``: a positive process count."""
+    try:
+        workers = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid worker count: {value!r}") from None
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f"worker count must be at least 1, got {workers}")
+    return workers
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Main entry point for batch 990-EZ preparation."""
+    parser = argparse.ArgumentParser(
+        description="Prepare Form 990-EZ returns for many organizations without prompts"
+    )
+    parser.add_argument(
+        "input",
+        help="Directory of JSON/JSONL records, a JSONL file, or - for stdin"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        required=True,
+        help="Output directory (one JSON per org), a .jsonl file, or - for stdout"
+    )
+    parser.add_argument(
+        "--config",
+        default="config/",
+        help="Path to configuration directory (default: config/)"
+    )
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=_worker_count,
+        default=1,
+        help="Worker processes (default: 1)"
+    )
+    parser.add_argument(
+        "--config-snapshots",
+        action="store_true",
+        help="Cache parsed configs as .<name>.snapshot files in the config directory"
+    )
+    args = parser.parse_args(argv)
+
+    config_path = args.config if args.config.endswith("/") else args.config + "/"
+    report = run_batch(
+        args.input, args.output, config_path=config_path,
+        workers=args.workers, snapshot=args.config_snapshots,
+    )
+    print_report(report)
+
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
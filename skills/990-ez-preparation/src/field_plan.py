@@ -0,0 +1,379 @@
+"""
+IRS Form 990-EZ Field Plan
+Compiles form-mappings.yaml into a reusable form population plan
+
+Every numbered line in Parts I, II and V of form-mappings.yaml becomes one
+step of the plan. Each step has a precompiled getter for its
+``data_source``, a compiled ``calculation`` and a ``default``. Steps are
+topologically ordered by their calculation dependencies, so running the
+plan for a return is one pass over a flat list of closures.
+
+A line's value is the first of these that is available:
+    1. ``data_source`` from the collected data
+    2. ``calculation`` over other lines of the same part
+    3. ``default`` (0 for the numeric Parts I and II)
+
+Data source paths:
+    financial.revenue.contributions     Nested keys
+    programs[0].expenses                List index
+    governance.officers[].compensation  Sum over every list item
+
+Part II lines are computed per column. ``data_source`` may be a mapping of
+``beginning``/``ending`` paths, and calculations use the same column.
+
+Version: 1.0.0
+Author: 360 Social Impact Studios
+Date: November 2025
+"""
+
+import re
+from dataclasses import dataclass
+from graphlib import CycleError, TopologicalSorter
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+try:
+    from .rule_engine import RuleError, compile_expression
+except ImportError:
+    from rule_engine import RuleError, compile_expression  # type: ignore[no-redef]
+
+
+# Parts populated from the plan, in form order
+PLAN_PARTS = ('part_i', 'part_ii', 'part_v')
+
+# Parts whose unresolved lines are reported as zero
+NUMERIC_PARTS = ('part_i', 'part_ii')
+
+# Parts with one value per balance sheet column
+PART_COLUMNS = {'part_ii': ('beginning', 'ending')}
+
+# Used for any part form-mappings.yaml does not define
+DEFAULT_MAPPINGS: Dict[str, Dict[str, Any]] = {
+    'part_i': {
+        'revenue': {
+            'line_1': {'data_source': "financial.revenue.contributions"},
+            'line_2': {'data_source': "financial.revenue.program_service_revenue"},
+            'line_3': {'data_source': "financial.revenue.membership_dues"},
+            'line_4': {'data_source': "financial.revenue.investment_income"},
+            'line_8': {'data_source': "financial.revenue.other"},
+            'line_9': {'data_source': "financial.revenue.total",
+                       'calculation': "sum(lines_1_through_8)"},
+        },
+        'expenses': {
+            'line_10': {'data_source': "financial.expense_lines.grants_paid"},
+            'line_11a': {'data_source': "financial.expense_lines.member_benefits"},
+            'line_11b': {'data_source': "financial.expense_lines.compensation"},
+            'line_12': {'data_source': "financial.expense_lines.professional_fees"},
+            'line_13': {'data_source': "financial.expense_lines.occupancy"},
+            'line_14': {'data_source': "financial.expense_lines.printing_postage"},
+            'line_15': {'data_source': "financial.expense_lines.other"},
+            'line_16': {'calculation': "sum(lines_10_through_15)"},
+            'line_17': {'calculation': "line_9 - line_16"},
+        },
+        'net_assets': {
+            'line_18': {'data_source': "financial.balance_sheet.beginning.net_assets"},
+            'line_21': {'data_source': "financial.balance_sheet.ending.net_assets"},
+        },
+    },
+    'part_ii': {
+        'assets': {
+            'line_22': {'data_source': {
+                'beginning': "financial.balance_sheet.beginning.cash",
+                'ending': "financial.balance_sheet.ending.cash",
+            }},
+            'line_24': {'data_source': {
+                'beginning': "financial.balance_sheet.beginning.other_assets",
+                'ending': "financial.balance_sheet.ending.other_assets",
+            }},
+            'line_25': {'data_source': {
+                'beginning': "financial.balance_sheet.beginning.total_assets",
+                'ending': "financial.balance_sheet.ending.total_assets",
+            }, 'calculation': "sum(lines_22_through_24)"},
+        },
+        'liabilities': {
+            'line_26': {'data_source': {
+                'beginning': "financial.balance_sheet.beginning.liabilities",
+                'ending': "financial.balance_sheet.ending.liabilities",
+            }},
+        },
+        'net_assets': {
+            'line_27': {'data_source': {
+                'beginning': "financial.balance_sheet.beginning.net_assets",
+                'ending': "financial.balance_sheet.ending.net_assets",
+            }, 'calculation': "line_25 - line_26"},
+        },
+    },
+    'part_v': {
+        'questions': {
+            'line_33': {'data_source': "compliance.political_activity", 'default': False},
+            'line_34': {'data_source': "compliance.lobbying_activity", 'default': False},
+        },
+        'governance_questions': {
+            'line_44a': {'data_source': "governance.policies.conflict_of_interest", 'default': False},
+            'line_44b': {'data_source': "governance.policies.whistleblower", 'default': False},
+            'line_44c': {'data_source': "governance.policies.document_retention", 'default': False},
+        },
+    },
+}
+
+
+class MappingError(ValueError):
+    """Raised when form-mappings.yaml cannot be compiled into a plan."""
+
+
+Getter = Callable[[Mapping[str, Any]], Any]
+
+
+@dataclass(frozen=True)
+class FieldStep:
+    """One compiled line (or Part II column) of the plan."""
+    key: str
+    part: str
+    line: str
+    column: Optional[str]
+    getter: Optional[Getter]
+    calculate: Optional[Callable[[Mapping[str, Any]], Any]]
+    default: Any
+    depends_on: Tuple[str, ...] = ()
+
+    def resolve(self, sources: Mapping[str, Any], values: Mapping[str, Any]) -> Any:
+        """Value from data source, else calculation, else default."""
+        if self.getter is not None:
+            value = self.getter(sources)
+            if value is not None:
+                return value
+        if self.calculate is not None:
+            return self.calculate(values)
+        return self.default
+
+
+# ============================================================================
+# COMPILATION
+# ============================================================================
+
+_LINE_PATTERN = re.compile(r"^line_(\d+)([a-z]*)$")
+_PATH_TOKEN = re.compile(r"([^.\[\]]+)|\[(\d*)\]")
+_RANGE_PATTERN = re.compile(r"sum\(\s*lines_(\w+?)_through_(\w+?)\s*\)")
+_EACH = object()
+
+
+def _line_order(line: str) -> Tuple[int, str]:
+    match = _LINE_PATTERN.match(line)
+    return (int(match.group(1)), match.group(2)) if match else (0, line)
+
+
+def _walk(value: Any, steps: Tuple[Any, ...]) -> Any:
+    for index, step in enumerate(steps):
+        if step is _EACH:
+            if not isinstance(value, (list, tuple)):
+                return None
+            rest = steps[index + 1:]
+            return sum(v for v in (_walk(item, rest) for item in value) if v is not None)
+        try:
+            value = value[step]
+        except (KeyError, IndexError, TypeError):
+            return None
+        if value is None:
+            return None
+    return value
+
+
+def compile_getter(path: str) -> Getter:
+    """
+    Compile a data source path into a getter over the collected data.
+
+    Raises:
+        MappingError: If the path is empty or malformed
+    """
+    steps: List[Any] = []
+    position = 0
+    for match in _PATH_TOKEN.finditer(path):
+        separator = path[position:match.start()]
+        if separator not in ('', '.') or (separator and not steps):
+            break
+        key, index = match.groups()
+        if key is not None:
+            steps.append(key)
+        else:
+            steps.append(int(index) if index else _EACH)
+        position = match.end()
+    if not steps or position != len(path):
+        raise MappingError(f"Invalid data_source path: {path!r}")
+
+    frozen = tuple(steps)
+    if _EACH in frozen:
+        return lambda sources: _walk(sources, frozen)
+
+    def get(sources: Mapping[str, Any]) -> Any:
+        value = sources
+        try:
+            for step in frozen:
+                value = value[step]
+        except (KeyError, IndexError, TypeError):
+            return None
+        return value
+
+    return get
+
+
+def _collect_lines(part_mapping: Mapping[str, Any]) -> Dict[str, Mapping[str, Any]]:
+    """Line specs of a part, from the part itself or one level of groups."""
+    lines: Dict[str, Mapping[str, Any]] = {}
+    for key, value in part_mapping.items():
+        if not isinstance(value, Mapping):
+            continue
+        if _LINE_PATTERN.match(key):
+            lines[key] = value
+            continue
+        for line, spec in value.items():
+            if _LINE_PATTERN.match(line) and isinstance(spec, Mapping):
+                lines[line] = spec
+    return lines
+
+
+def _own_calculation(line: str, spec: Mapping[str, Any]) -> Optional[str]:
+    """
+    The calculation for ``line`` itself.
+
+    Mappings annotate input lines with the line they feed
+    (``calculation: "line_5c = line_5a - line_5b"`` on line 5b); those notes
+    are not the input line's own calculation.
+    """
+    calculation = spec.get('calculation')
+    if not isinstance(calculation, str) or not calculation.strip():
+        return None
+    target, separator, expression = calculation.partition('=')
+    if separator and not expression.startswith('='):
+        return expression.strip() if target.strip() == line else None
+    return calculation.strip()
+
+
+def _expand_ranges(expression: str, lines: List[str], components: Dict[str, set]) -> str:
+    """
+    Expand ``sum(lines_1_through_8)`` into an explicit sum.
+
+    Lines that another line in the range calculates from (5a and 5b feed 5c)
+    are left out, so subtotals are not counted twice.
+    """
+    def expand(match: "re.Match") -> str:
+        low, high = _line_order(f"line_{match.group(1)}"), _line_order(f"line_{match.group(2)}")
+        in_range = [line for line in lines if low[0] <= _line_order(line)[0] <= high[0]]
+        inputs = set().union(*(components.get(line, set()) for line in in_range))
+        terms = [line for line in in_range if line not in inputs]
+        return "(" + " + ".join(terms) + ")" if terms else "0"
+
+    return _RANGE_PATTERN.sub(expand, expression)
+
+
+def _compile_part(part: str, part_mapping: Mapping[str, Any]) -> List[FieldStep]:
+    specs = _collect_lines(part_mapping)
+    lines = sorted(specs, key=_line_order)
+    calculations = {line: _own_calculation(line, specs[line]) for line in lines}
+    components = {
+        line: set(re.findall(r"line_\w+", calculation))
+        for line, calculation in calculations.items() if calculation
+    }
+    columns = PART_COLUMNS.get(part, (None,))
+    numeric_default = 0 if part in NUMERIC_PARTS else None
+
+    steps = []
+    for line in lines:
+        spec = specs[line]
+        source = spec.get('data_source')
+        calculation = calculations[line]
+        if calculation:
+            calculation = _expand_ranges(calculation, lines, components)
+
+        for column in columns:
+            path = source.get(column) if isinstance(source, Mapping) else source
+            calculate, depends_on = None, ()
+            if calculation:
+                try:
+                    calculate, depends_on = compile_expression(calculation, part, column)
+                except RuleError as e:
+                    raise MappingError(f"{part}.{line}: {e}") from e
+
+            steps.append(FieldStep(
+                key=f"{part}.{line}" + (f".{column}" if column else ""),
+                part=part,
+                line=line,
+                column=column,
+                getter=compile_getter(path) if isinstance(path, str) else None,
+                calculate=calculate,
+                default=spec.get('default', numeric_default),
+                depends_on=depends_on,
+            ))
+    return steps
+
+
+# ============================================================================
+# PLAN
+# ============================================================================
+
+class FieldPlan:
+    """
+    Precompiled, dependency-ordered population plan for Form 990-EZ.
+
+    Example:
+        plan = FieldPlan.from_config(form_mappings)
+        lines = plan.populate({'financial': ..., 'governance': ...})
+        lines['part_ii']['line_25']['ending']
+    """
+
+    def __init__(self, steps: List[FieldStep]):
+        by_key = {step.key: step for step in steps}
+        graph = {
+            step.key: [key for key in step.depends_on if key in by_key]
+            for step in steps
+        }
+        try:
+            order = list(TopologicalSorter(graph).static_order())
+        except CycleError as e:
+            raise MappingError(f"Circular line calculations: {' -> '.join(e.args[1])}") from e
+
+        # Evaluation order follows dependencies; output keeps form order
+        self.steps: List[FieldStep] = [by_key[key] for key in order]
+        self.layout: List[FieldStep] = steps
+
+    @classmethod
+    def from_config(cls, form_mappings: Optional[Mapping[str, Any]]) -> "FieldPlan":
+        """
+        Compile Parts I, II and V of form-mappings.yaml.
+
+        Parts missing from the mappings fall back to DEFAULT_MAPPINGS.
+
+        Raises:
+            MappingError: If a path or calculation is invalid or circular
+        """
+        form_mappings = form_mappings or {}
+        steps: List[FieldStep] = []
+        for part in PLAN_PARTS:
+            part_mapping = form_mappings.get(part) or DEFAULT_MAPPINGS[part]
+            steps.extend(_compile_part(part, part_mapping))
+        return cls(steps)
+
+    def populate(self, sources: Mapping[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run the plan against collected data.
+
+        Args:
+            sources: Collected data keyed by root (``organization``,
+                ``financial``, ``programs``, ``governance``)
+
+        Returns:
+            Dictionary of part name to populated lines; Part II lines are
+            ``{'beginning': ..., 'ending': ...}`` dictionaries
+        """
+        values: Dict[str, Any] = {}
+        numbers: Dict[str, Any] = {}
+        for step in self.steps:
+            value = step.resolve(sources, numbers)
+            values[step.key] = value
+            numbers[step.key] = 0 if value is None else value
+
+        form: Dict[str, Dict[str, Any]] = {part: {} for part in PLAN_PARTS}
+        for step in self.layout:
+            if step.column is None:
+                form[step.part][step.line] = values[step.key]
+            else:
+                form[step.part].setdefault(step.line, {})[step.column] = values[step.key]
+        return form
@@ -10,6 +10,7 @@ Date: November 2025
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from decimal import Decimal
+from pathlib import Path
 import json
 
 # Import yaml with guard to provide helpful error message
@@ -18,6 +19,28 @@ try:
 except ImportError:
     yaml = None  # type: ignore
 
+# Shared loader caches parsed configs process-wide; used when the repository
+# root is importable, otherwise configs are parsed directly
+try:
+    from shared.config_loader import ConfigLoader
+except ImportError:
+    ConfigLoader = None  # type: ignore
+
+try:
+    from .field_plan import FieldPlan
+    from .rule_engine import RuleEngine
+except ImportError:
+    from field_plan import FieldPlan  # type: ignore[no-redef]
+    from rule_engine import RuleEngine  # type: ignore[no-redef]
+
+
+# Itemized expenses by object class (financial['expense_lines']) feeding
+# Part I lines 10-14; 'other' feeds line 15
+EXPENSE_LINE_KEYS = (
+    'grants_paid', 'member_benefits', 'compensation',
+    'professional_fees', 'occupancy', 'printing_postage',
+)
+
 
 class Form990EZOrchestrator:
     """
@@ -31,18 +54,32 @@ class Form990EZOrchestrator:
     5. Filing Package Generation
     """
 
-    def __init__(self, config_path: str = "config/"):
+    def __init__(self, config_path: str = "config/", quiet: bool = False,
+                 snapshot: bool = False):
         """
         Initialize the orchestrator with configuration files.
 
         Args:
             config_path: Path to configuration directory
+            quiet: Suppress console output from the population, validation
+                and filing package phases (used for batch preparation)
+            snapshot: Reuse and refresh binary snapshots written next to the
+                configuration files (``.<name>.snapshot``). Off by default so
+                the configuration directory is only ever read.
         """
         self.config_path = config_path
+        self.quiet = quiet
+        self.snapshot = snapshot
         self.validation_rules = self._load_config("validation-rules.yaml")
         self.form_mappings = self._load_config("form-mappings.yaml")
         self.api_config = self._load_config("api-integrations.yaml")
 
+        # Field mappings and validation formulas are compiled once per orchestrator
+        self.field_plan = FieldPlan.from_config(self.form_mappings)
+        self.rule_engine = RuleEngine.from_config(self.validation_rules)
+        self._config_subscriptions: List[int] = []
+        self._plan_run: Optional[Tuple[Tuple, Dict[str, Dict]]] = None
+
         # Initialize data storage
         self.organization_data = {}
         self.financial_data = {}
@@ -57,19 +94,100 @@ class Form990EZOrchestrator:
         self.info = []
 
     def _load_config(self, filename: str) -> Dict:
-        """Load a YAML configuration file."""
+        """
+        Load a YAML configuration file.
+
+        Returns a shared read-only view when the cached shared loader is
+        available, so constructing many orchestrators parses each file once.
+        With ``snapshot`` enabled, new worker processes also start from the
+        file's binary snapshot instead of parsing it.
+        """
         if yaml is None:
             raise ImportError(
                 "PyYAML is required for Form 990-EZ preparation. "
                 "Install with: pip install pyyaml"
             )
+        path = f"{self.config_path}{filename}"
+        if ConfigLoader is not None:
+            config = ConfigLoader.load_yaml(path, required=False, frozen=True, snapshot=self.snapshot)
+            if config is None:
+                print(f"Warning: Config file {filename} not found")
+                return {}
+            return config
         try:
-            with open(f"{self.config_path}{filename}", 'r') as f:
-                return yaml.safe_load(f)
+            with open(path, 'r') as f:
+                return yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
         except FileNotFoundError:
             print(f"Warning: Config file {filename} not found")
             return {}
 
+    def _echo(self, *args) -> None:
+        """Print progress output unless running in quiet mode."""
+        if not self.quiet:
+            print(*args)
+
+    # ========================================================================
+    # CONFIGURATION RELOADING
+    # ========================================================================
+
+    def watch_config(self, start: bool = True, interval: Optional[float] = None) -> None:
+        """
+        Reload the configuration files when they change on disk.
+
+        Lets long-running workers pick up edits such as a new eligibility
+        threshold without a restart. Changed files are re-parsed once and
+        the field plan or rule engine is recompiled before being swapped in;
+        an edit that fails to parse or compile leaves the current
+        configuration in place.
+
+        Args:
+            start: Start the process-wide background watcher
+            interval: Seconds between polls (default: watcher's interval)
+
+        Raises:
+            RuntimeError: If the shared ConfigLoader is not importable
+        """
+        if ConfigLoader is None:
+            raise RuntimeError(
+                "Config watching requires the shared package; "
+                "run from the repository root or add it to PYTHONPATH"
+            )
+        if not self._config_subscriptions:
+            # One bound callback per file, so a symlinked config whose target
+            # has a different name still reaches the right handler
+            for filename, callback in (
+                ("validation-rules.yaml", self._reload_validation_rules),
+                ("form-mappings.yaml", self._reload_form_mappings),
+                ("api-integrations.yaml", self._reload_api_config),
+            ):
+                self._config_subscriptions.append(ConfigLoader.subscribe(
+                    f"{self.config_path}{filename}", callback, weak=True, frozen=True
+                ))
+        if start:
+            ConfigLoader.start_watching(interval)
+
+    def unwatch_config(self) -> None:
+        """Stop reloading the configuration files."""
+        for subscription_id in self._config_subscriptions:
+            ConfigLoader.unsubscribe(subscription_id)
+        self._config_subscriptions = []
+
+    def _reload_validation_rules(self, path: Path, config: Optional[Dict]) -> None:
+        """Recompile and swap in reloaded validation rules."""
+        config = config or {}
+        rule_engine = RuleEngine.from_config(config)
+        self.validation_rules, self.rule_engine = config, rule_engine
+
+    def _reload_form_mappings(self, path: Path, config: Optional[Dict]) -> None:
+        """Recompile and swap in reloaded form mappings."""
+        config = config or {}
+        field_plan = FieldPlan.from_config(config)
+        self.form_mappings, self.field_plan = config, field_plan
+
+    def _reload_api_config(self, path: Path, config: Optional[Dict]) -> None:
+        """Swap in reloaded API integration settings."""
+        self.api_config = config or {}
+
     # ========================================================================
     # PHASE 1: ELIGIBILITY VERIFICATION
     # ========================================================================
@@ -398,6 +516,102 @@ class Form990EZOrchestrator:
         self.governance_data = governance
         return governance
 
+    # ========================================================================
+    # NON-INTERACTIVE PREPARATION
+    # ========================================================================
+
+    def load_record(self, record: Dict) -> None:
+        """
+        Load a complete organization record without interactive prompts.
+
+        Non-interactive counterpart to the ``collect_*`` methods. Records use
+        the same structure those methods produce; missing totals are derived
+        the same way ``_collect_financial_manual`` derives them.
+
+        Args:
+            record: Dictionary with ``organization``, ``financial``,
+                ``programs`` and ``governance`` sections
+        """
+        self.organization_data = record.get('organization', {})
+        self.financial_data = self._complete_financials(record.get('financial', {}))
+        self.program_data = record.get('programs', [])
+        self.governance_data = record.get('governance', {'officers': [], 'policies': {}})
+
+    @staticmethod
+    def _complete_financials(financial: Dict) -> Dict:
+        """Fill in derived totals that a record may omit."""
+        completed = dict(financial)
+
+        revenue = dict(financial.get('revenue', {}))
+        if 'total' not in revenue:
+            revenue['total'] = sum(revenue.values())
+        completed['revenue'] = revenue
+
+        expenses = dict(financial.get('expenses', {}))
+        if 'total' not in expenses:
+            expenses['total'] = sum(expenses.values())
+        completed['expenses'] = expenses
+
+        balance_sheet = financial.get('balance_sheet', {})
+        completed['balance_sheet'] = {}
+        for side in ('beginning', 'ending'):
+            values = dict(balance_sheet.get(side, {}))
+            values.setdefault('total_assets', values.get('cash', 0) + values.get('other_assets', 0))
+            values.setdefault('net_assets', values['total_assets'] - values.get('liabilities', 0))
+            completed['balance_sheet'][side] = values
+
+        completed.setdefault('net_income', revenue['total'] - expenses['total'])
+        return completed
+
+    def prepare_return(self, record: Dict) -> Dict:
+        """
+        Run the full preparation workflow for one organization record.
+
+        Runs eligibility, form population, validation and (when the form is
+        filing ready) filing package generation without prompting.
+
+        Args:
+            record: Organization record accepted by ``load_record``
+
+        Returns:
+            Result dictionary with ``status`` of ``ineligible``,
+            ``needs_review`` or ``filing_ready``
+        """
+        self.load_record(record)
+        organization = self.organization_data
+        financial = self.financial_data
+
+        eligible, reason = self.verify_eligibility(
+            gross_receipts=financial.get('gross_receipts', financial['revenue']['total']),
+            total_assets=financial['balance_sheet']['ending']['total_assets'],
+            donor_advised_fund=bool(organization.get('donor_advised_funds', False)),
+            operates_hospital=bool(organization.get('operates_hospital', False)),
+        )
+
+        result = {
+            'organization': organization.get('legal_name'),
+            'ein': organization.get('ein'),
+            'eligible': eligible,
+            'reason': reason,
+        }
+
+        if not eligible:
+            result['status'] = 'ineligible'
+            return result
+
+        form = self.populate_form()
+        validation = self.validate_form(form)
+        result['validation'] = validation
+
+        if validation['filing_ready']:
+            result['status'] = 'filing_ready'
+            result['filing_package'] = self.generate_filing_package(form, validation)
+        else:
+            result['status'] = 'needs_review'
+            result['form_990ez'] = form
+
+        return result
+
     # ========================================================================
     # PHASE 3: FORM POPULATION
     # ========================================================================
@@ -409,82 +623,85 @@ class Form990EZOrchestrator:
         Returns:
             Dictionary representing completed form
         """
-        print("\n" + "="*70)
-        print("GENERATING FORM 990-EZ")
-        print("="*70 + "\n")
+        self._echo("\n" + "="*70)
+        self._echo("GENERATING FORM 990-EZ")
+        self._echo("="*70 + "\n")
 
+        self._plan_run = None
+        lines = self._field_lines()
         form = {
             'organization': self.organization_data,
-            'part_i': self._populate_part_i(),
-            'part_ii': self._populate_part_ii(),
+            'functional_expenses': self._functional_expenses(),
+            'part_i': lines['part_i'],
+            'part_ii': lines['part_ii'],
             'part_iii': self._populate_part_iii(),
             'part_iv': self._populate_part_iv(),
-            'part_v': self._populate_part_v(),
+            'part_v': lines['part_v'],
         }
 
-        print("✓ Form 990-EZ populated successfully")
+        self._echo("✓ Form 990-EZ populated successfully")
         return form
 
-    def _populate_part_i(self) -> Dict:
-        """Populate Part I: Revenue, Expenses, and Changes in Net Assets."""
-        revenue = self.financial_data['revenue']
-        expenses = self.financial_data['expenses']
-        bs_begin = self.financial_data['balance_sheet']['beginning']
-        bs_end = self.financial_data['balance_sheet']['ending']
-
-        part_i = {
-            # Revenue
-            'line_1': revenue.get('contributions', 0),
-            'line_2': revenue.get('program_service_revenue', 0),
-            'line_3': 0,  # Membership dues
-            'line_4': revenue.get('investment_income', 0),
-            'line_8': revenue.get('other', 0),
-            'line_9': revenue['total'],
-
-            # Expenses
-            'line_10': expenses.get('program_services', 0),
-            'line_11b': sum(officer['compensation'] for officer in self.governance_data.get('officers', [])),
-            'line_13': expenses.get('management_general', 0),
-            'line_14': expenses.get('fundraising', 0),
-            'line_16': expenses['total'],
-
-            # Net Assets
-            'line_17': revenue['total'] - expenses['total'],  # Excess or deficit
-            'line_18': bs_begin.get('net_assets', 0),
-            'line_21': bs_end.get('net_assets', 0),
+    def _field_lines(self) -> Dict[str, Dict]:
+        """
+        Lines of Parts I, II and V for the current return.
+
+        The plan runs once per return: the result is reused until the field
+        plan or any of the collected data dictionaries is replaced.
+        """
+        inputs = (self.field_plan, self.organization_data, self.financial_data,
+                  self.program_data, self.governance_data)
+        run = self._plan_run
+        if run is None or any(a is not b for a, b in zip(run[0], inputs)):
+            run = self._plan_run = (inputs, self._run_field_plan())
+        return run[1]
+
+    def _run_field_plan(self) -> Dict[str, Dict]:
+        """Populate the numbered lines of Parts I, II and V from collected data."""
+        return self.field_plan.populate({
+            'organization': self.organization_data,
+            'financial': {**self.financial_data, 'expense_lines': self._expense_lines()},
+            'programs': self.program_data,
+            'governance': self.governance_data,
+        })
+
+    def _expense_lines(self) -> Dict:
+        """
+        Expenses by object class for Part I lines 10-15.
+
+        Uses ``financial['expense_lines']`` where given. Salaries default to
+        the officers' total compensation, and whatever part of the
+        functional expense total is not itemized is reported as other
+        expenses (line 15), so line 16 still equals total expenses.
+        """
+        lines = dict(self.financial_data.get('expense_lines') or {})
+        if lines.get('compensation') is None:
+            lines['compensation'] = sum(
+                officer.get('compensation') or 0
+                for officer in self.governance_data.get('officers', [])
+            )
+        if lines.get('other') is None:
+            itemized = sum(lines.get(key) or 0 for key in EXPENSE_LINE_KEYS)
+            lines['other'] = max(self._functional_expenses()['total'] - itemized, 0)
+        return lines
+
+    def _functional_expenses(self) -> Dict:
+        """Expenses by function (program services, management and general, fundraising)."""
+        expenses = self.financial_data.get('expenses', {})
+        functional = {
+            key: expenses.get(key, 0)
+            for key in ('program_services', 'management_general', 'fundraising')
         }
+        functional['total'] = expenses.get('total', sum(functional.values()))
+        return functional
 
-        return part_i
+    def _populate_part_i(self) -> Dict:
+        """Populate Part I: Revenue, Expenses, and Changes in Net Assets."""
+        return self._field_lines()['part_i']
 
     def _populate_part_ii(self) -> Dict:
         """Populate Part II: Balance Sheet."""
-        bs_begin = self.financial_data['balance_sheet']['beginning']
-        bs_end = self.financial_data['balance_sheet']['ending']
-
-        part_ii = {
-            'line_22': {
-                'beginning': bs_begin.get('cash', 0),
-                'ending': bs_end.get('cash', 0),
-            },
-            'line_24': {
-                'beginning': bs_begin.get('other_assets', 0),
-                'ending': bs_end.get('other_assets', 0),
-            },
-            'line_25': {
-                'beginning': bs_begin.get('total_assets', 0),
-                'ending': bs_end.get('total_assets', 0),
-            },
-            'line_26': {
-                'beginning': bs_begin.get('liabilities', 0),
-                'ending': bs_end.get('liabilities', 0),
-            },
-            'line_27': {
-                'beginning': bs_begin.get('net_assets', 0),
-                'ending': bs_end.get('net_assets', 0),
-            },
-        }
-
-        return part_ii
+        return self._field_lines()['part_ii']
 
     def _populate_part_iii(self) -> List[Dict]:
         """Populate Part III: Program Service Accomplishments."""
@@ -496,17 +713,7 @@ class Form990EZOrchestrator:
 
     def _populate_part_v(self) -> Dict:
         """Populate Part V: Other Information."""
-        policies = self.governance_data.get('policies', {})
-
-        part_v = {
-            'line_33': False,  # Political activity (typically No for 501(c)(3))
-            'line_34': False,  # Lobbying
-            'line_44a': policies.get('conflict_of_interest', False),
-            'line_44b': policies.get('whistleblower', False),
-            'line_44c': policies.get('document_retention', False),
-        }
-
-        return part_v
+        return self._field_lines()['part_v']
 
     # ========================================================================
     # PHASE 4: VALIDATION
@@ -522,9 +729,9 @@ class Form990EZOrchestrator:
         Returns:
             Validation report
         """
-        print("\n" + "="*70)
-        print("VALIDATING FORM 990-EZ")
-        print("="*70 + "\n")
+        self._echo("\n" + "="*70)
+        self._echo("VALIDATING FORM 990-EZ")
+        self._echo("="*70 + "\n")
 
         self.validation_results = []
         self.errors = []
@@ -557,45 +764,30 @@ class Form990EZOrchestrator:
         }
 
         # Print summary
-        print("\n--- VALIDATION SUMMARY ---\n")
-        print(f"  Errors:   {summary['errors']}")
-        print(f"  Warnings: {summary['warnings']}")
-        print(f"  Info:     {summary['info']}")
-        print(f"\n  Filing Ready: {'YES ✓' if summary['filing_ready'] else 'NO ✗'}")
+        self._echo("\n--- VALIDATION SUMMARY ---\n")
+        self._echo(f"  Errors:   {summary['errors']}")
+        self._echo(f"  Warnings: {summary['warnings']}")
+        self._echo(f"  Info:     {summary['info']}")
+        self._echo(f"\n  Filing Ready: {'YES ✓' if summary['filing_ready'] else 'NO ✗'}")
 
         if self.errors:
-            print("\n  ERRORS (must fix before filing):")
+            self._echo("\n  ERRORS (must fix before filing):")
             for error in self.errors:
-                print(f"    ✗ {error}")
+                self._echo(f"    ✗ {error}")
 
         if self.warnings:
-            print("\n  WARNINGS (should address):")
+            self._echo("\n  WARNINGS (should address):")
             for warning in self.warnings:
-                print(f"    ⚠️  {warning}")
+                self._echo(f"    ⚠️  {warning}")
 
         return summary
 
     def _validate_mathematical(self, form: Dict):
         """Level 1: Mathematical accuracy validation."""
-        part_i = form['part_i']
-        part_ii = form['part_ii']
-
-        # Check revenue totals
-        revenue_sum = part_i['line_1'] + part_i['line_2'] + part_i['line_3'] + part_i['line_4'] + part_i['line_8']
-        if abs(revenue_sum - part_i['line_9']) > 0.01:
-            self.errors.append(f"Part I revenue lines don't sum correctly ({revenue_sum} ≠ {part_i['line_9']})")
-
-        # Check balance sheet equation
-        ending_assets = part_ii['line_25']['ending']
-        ending_liabilities = part_ii['line_26']['ending']
-        ending_net_assets = part_ii['line_27']['ending']
-
-        if abs(ending_assets - (ending_liabilities + ending_net_assets)) > 0.01:
-            self.errors.append("Balance sheet doesn't balance (Assets ≠ Liabilities + Net Assets)")
-
-        # Check Part I and Part II reconciliation
-        if abs(part_i['line_21'] - ending_net_assets) > 0.01:
-            self.errors.append("Part I ending net assets doesn't match Part II net assets")
+        results = self.rule_engine.evaluate(form)
+        self.errors.extend(results['errors'])
+        self.warnings.extend(results['warnings'])
+        self.info.extend(results['info'])
 
         if len(self.errors) == 0:
             self.info.append("All mathematical calculations verified ✓")
@@ -606,11 +798,22 @@ class Form990EZOrchestrator:
         part_v = form['part_v']
 
         # Check expense allocation
-        total_expenses = part_i['line_16']
+        functional = form.get('functional_expenses') or self._functional_expenses()
+        total_expenses = functional['total']
         if total_expenses > 0:
-            program_ratio = part_i['line_10'] / total_expenses
+            program_ratio = functional['program_services'] / total_expenses
             if program_ratio < 0.65:
                 self.warnings.append(f"Program expense ratio {program_ratio:.1%} below recommended 65%")
+        if abs(total_expenses - part_i['line_16']) > 0.01:
+            self.warnings.append(
+                f"Functional expenses ${total_expenses:,.2f} do not equal "
+                f"Part I line 16 total expenses ${part_i['line_16']:,.2f}"
+            )
+        if not self.financial_data.get('expense_lines') and part_i.get('line_15'):
+            self.info.append(
+                "Expenses were not itemized by Part I line; the remainder is reported "
+                "on line 15 (describe in Schedule O)"
+            )
 
         # Check governance policies
         if not part_v.get('line_44a'):
@@ -658,9 +861,9 @@ class Form990EZOrchestrator:
         Returns:
             Filing package with all components
         """
-        print("\n" + "="*70)
-        print("GENERATING FILING PACKAGE")
-        print("="*70 + "\n")
+        self._echo("\n" + "="*70)
+        self._echo("GENERATING FILING PACKAGE")
+        self._echo("="*70 + "\n")
 
         package = {
             'form_990ez': form,
@@ -673,13 +876,13 @@ class Form990EZOrchestrator:
         # Determine required schedules
         if self.organization_data.get('classification') == '501(c)(3)':
             package['schedules']['schedule_a'] = True
-            print("  ✓ Schedule A (Public Charity Status) - Required")
+            self._echo("  ✓ Schedule A (Public Charity Status) - Required")
 
         if form['part_i']['line_1'] >= 5000:  # Check if any single contribution >= $5,000
             package['schedules']['schedule_b'] = True
-            print("  ✓ Schedule B (Contributors) - Required")
+            self._echo("  ✓ Schedule B (Contributors) - Required")
 
-        print("\n  Filing package generated successfully!")
+        self._echo("\n  Filing package generated successfully!")
 
         return package
 
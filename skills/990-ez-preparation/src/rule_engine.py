@@ -0,0 +1,470 @@
+"""
+IRS Form 990-EZ Rule Engine
+Compiles mathematical validation formulas into reusable checks
+
+Formulas from the ``mathematical_validation`` section of
+validation-rules.yaml are parsed once into small Python closures. The same
+compiled rule evaluates a single populated form (plain floats) or a NumPy
+column store holding many forms at once, so revalidating a whole client
+book is one vectorized pass per rule.
+
+Formula syntax:
+    line_9 == line_1 + line_2 + line_8      Lines of the group's part
+    line_25.beginning == ...                Part II beginning-of-year column
+    line_27 == part_i_line_21               Line from another part
+    ==, !=, <, <=, >, >=, +, -, *, /, and, or, numeric constants
+
+Equality comparisons allow a $0.01 rounding tolerance. Lines that are not
+reported on a form count as zero. Division by zero and non-numeric line
+values evaluate to NaN, and every comparison involving NaN is false, so the
+rule fails and is reported instead of aborting evaluation.
+
+Version: 1.0.0
+Author: 360 Social Impact Studios
+Date: November 2025
+"""
+
+import ast
+import math
+import operator
+import re
+from dataclasses import dataclass
+from functools import reduce
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+# NumPy is only needed for evaluating many forms at once
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+
+TOLERANCE = 0.01
+
+# Result bucket for each severity level
+SEVERITY_BUCKETS = {
+    'ERROR': 'errors',
+    'WARNING': 'warnings',
+    'INFO': 'info',
+}
+
+# Parts with numeric lines, longest prefix first so part_ii wins over part_i
+PARTS = ('part_ii', 'part_i')
+
+# Part II lines report beginning and ending of year columns
+DEFAULT_COLUMN = {'part_ii': 'ending'}
+
+# Used when validation-rules.yaml has no mathematical_validation section
+DEFAULT_RULES = {
+    'part_i_revenue': {
+        'line_9_equals_sum': {
+            'formula': "line_9 == line_1 + line_2 + line_3 + line_4 + line_5c + line_6d + line_7c + line_8",
+            'error_message': "Part I revenue lines don't sum correctly",
+            'severity': 'ERROR',
+        },
+    },
+    'part_ii_balance_sheet': {
+        'assets_equal_liabilities_plus_net': {
+            'formula': "line_25 == line_26 + line_27",
+            'error_message': "Balance sheet doesn't balance (Assets ≠ Liabilities + Net Assets)",
+            'severity': 'ERROR',
+        },
+        'net_assets_reconciliation': {
+            'formula': "line_27 == part_i_line_21",
+            'error_message': "Part I ending net assets doesn't match Part II net assets",
+            'severity': 'ERROR',
+        },
+    },
+}
+
+
+class RuleError(ValueError):
+    """Raised when a validation formula cannot be compiled."""
+
+
+Evaluator = Callable[[Mapping[str, Any]], Any]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A compiled validation rule."""
+    name: str
+    formula: str
+    message: str
+    severity: str
+    fields: Tuple[str, ...]
+    check: Evaluator
+    # Left and right sides of a single ``==`` for failure details
+    sides: Optional[Tuple[Evaluator, Evaluator]] = None
+
+    @property
+    def bucket(self) -> str:
+        """Result list this rule reports into."""
+        return SEVERITY_BUCKETS[self.severity]
+
+    def describe(self, lhs: Optional[float] = None, rhs: Optional[float] = None) -> str:
+        """Failure message, with the compared values when available."""
+        if lhs is None or rhs is None:
+            return self.message
+        if math.isnan(lhs) or math.isnan(rhs):
+            return f"{self.message} (not computable: division by zero or a non-numeric line)"
+        return f"{self.message} ({lhs} ≠ {rhs})"
+
+
+# ============================================================================
+# COMPILATION
+# ============================================================================
+
+_NAME_PATTERN = re.compile(r"^(?:(part_ii|part_i)_)?(line_\w+)$")
+
+def _divide(left: Any, right: Any) -> Any:
+    """Quotient, or NaN where the divisor is zero."""
+    if np is not None and (isinstance(left, np.ndarray) or isinstance(right, np.ndarray)):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            quotient = np.true_divide(left, right)
+        return np.where(np.asarray(right) == 0, np.nan, quotient)
+    return left / right if right != 0 else math.nan
+
+
+_BINARY_OPS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: _divide,
+}
+
+_UNARY_OPS: Dict[type, Callable[[Any], Any]] = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+
+def _equal(left: Any, right: Any) -> Any:
+    return abs(left - right) <= TOLERANCE
+
+
+def _not_equal(left: Any, right: Any) -> Any:
+    return abs(left - right) > TOLERANCE
+
+
+_COMPARE_OPS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Eq: _equal,
+    ast.NotEq: _not_equal,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+
+def _group_part(group: str) -> Optional[str]:
+    """Part a rule group refers to, from its ``part_i_``/``part_ii_`` prefix."""
+    for part in PARTS:
+        if group == part or group.startswith(part + "_"):
+            return part
+    return None
+
+
+class _Compiler:
+    """Turns one formula AST into a closure over a field mapping."""
+
+    def __init__(self, formula: str, part: Optional[str], column: Optional[str] = None):
+        self.formula = formula
+        self.part = part
+        self.column = column
+        self.fields: List[str] = []
+
+    def field(self, name: str, column: Optional[str] = None) -> str:
+        match = _NAME_PATTERN.match(name)
+        if not match:
+            raise RuleError(f"Unknown name '{name}' in formula: {self.formula}")
+        part = match.group(1) or self.part
+        if part is None:
+            raise RuleError(
+                f"'{name}' needs a part prefix (e.g. part_i_{name}) outside a "
+                f"part_i/part_ii rule group: {self.formula}"
+            )
+        column = column or self.column or DEFAULT_COLUMN.get(part)
+        key = f"{part}.{match.group(2)}" + (f".{column}" if column else "")
+        if key not in self.fields:
+            self.fields.append(key)
+        return key
+
+    def compile(self, node: ast.AST) -> Evaluator:
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            value = node.value
+            return lambda env: value
+
+        if isinstance(node, ast.Name):
+            key = self.field(node.id)
+            return lambda env: env.get(key, 0.0)
+
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            key = self.field(node.value.id, node.attr)
+            return lambda env: env.get(key, 0.0)
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+            op = _BINARY_OPS[type(node.op)]
+            left, right = self.compile(node.left), self.compile(node.right)
+            return lambda env: op(left(env), right(env))
+
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+            op = _UNARY_OPS[type(node.op)]
+            operand = self.compile(node.operand)
+            return lambda env: op(operand(env))
+
+        if isinstance(node, ast.Compare):
+            operands = [self.compile(node.left)] + [self.compile(c) for c in node.comparators]
+            checks = []
+            for index, op_node in enumerate(node.ops):
+                if type(op_node) not in _COMPARE_OPS:
+                    break
+                checks.append((_COMPARE_OPS[type(op_node)], operands[index], operands[index + 1]))
+            else:
+                # Element-wise & keeps chained comparisons valid for arrays
+                return lambda env: reduce(
+                    operator.and_, (op(left(env), right(env)) for op, left, right in checks)
+                )
+
+        if isinstance(node, ast.BoolOp):
+            combine = operator.and_ if isinstance(node.op, ast.And) else operator.or_
+            values = [self.compile(v) for v in node.values]
+            return lambda env: reduce(combine, (value(env) for value in values))
+
+        raise RuleError(
+            f"Unsupported expression '{ast.unparse(node)}' in formula: {self.formula}"
+        )
+
+
+def compile_expression(
+    expression: str,
+    part: Optional[str],
+    column: Optional[str] = None,
+) -> Tuple[Evaluator, Tuple[str, ...]]:
+    """
+    Compile an arithmetic or comparison expression over form lines.
+
+    Args:
+        expression: Formula such as ``line_5a - line_5b``
+        part: Part that bare ``line_N`` names refer to
+        column: Column for multi-column parts (default: ending)
+
+    Returns:
+        Tuple of (evaluator over a field mapping, referenced field keys)
+
+    Raises:
+        RuleError: If the expression is invalid
+    """
+    try:
+        tree = ast.parse(expression, mode='eval').body
+    except SyntaxError as e:
+        raise RuleError(f"Invalid formula: {expression}") from e
+
+    compiler = _Compiler(expression, part, column)
+    return compiler.compile(tree), tuple(compiler.fields)
+
+
+def compile_rule(name: str, spec: Mapping[str, Any], part: Optional[str] = None) -> Rule:
+    """
+    Compile one rule definition from validation-rules.yaml.
+
+    Args:
+        name: Rule identifier (``group.rule``)
+        spec: Mapping with ``formula``, ``error_message`` and ``severity``
+        part: Part that bare ``line_N`` names refer to
+
+    Returns:
+        Compiled Rule
+
+    Raises:
+        RuleError: If the formula or severity is invalid
+    """
+    formula = spec.get('formula')
+    if not isinstance(formula, str) or not formula.strip():
+        raise RuleError(f"Rule '{name}' has no formula")
+
+    severity = str(spec.get('severity', 'ERROR')).upper()
+    if severity not in SEVERITY_BUCKETS:
+        raise RuleError(f"Rule '{name}' has unknown severity '{severity}'")
+
+    try:
+        tree = ast.parse(formula, mode='eval').body
+    except SyntaxError as e:
+        raise RuleError(f"Invalid formula for rule '{name}': {formula}") from e
+
+    if not isinstance(tree, (ast.Compare, ast.BoolOp)):
+        raise RuleError(f"Formula for rule '{name}' must be a comparison: {formula}")
+
+    compiler = _Compiler(formula, part)
+    check = compiler.compile(tree)
+
+    sides = None
+    if isinstance(tree, ast.Compare) and len(tree.ops) == 1 and isinstance(tree.ops[0], ast.Eq):
+        sides = (compiler.compile(tree.left), compiler.compile(tree.comparators[0]))
+
+    return Rule(
+        name=name,
+        formula=formula,
+        message=spec.get('error_message') or f"Validation rule failed: {formula}",
+        severity=severity,
+        fields=tuple(compiler.fields),
+        check=check,
+        sides=sides,
+    )
+
+
+# ============================================================================
+# EVALUATION
+# ============================================================================
+
+def _empty_results() -> Dict[str, List[str]]:
+    return {bucket: [] for bucket in SEVERITY_BUCKETS.values()}
+
+
+def field_value(form: Mapping[str, Any], key: str) -> float:
+    """
+    Look up a field such as ``part_ii.line_25.ending`` on a populated form.
+
+    Missing parts, lines and columns count as zero; values that are not
+    numbers are NaN, which fails every rule that reads them.
+    """
+    value: Any = form
+    for segment in key.split('.'):
+        if not isinstance(value, Mapping):
+            return 0.0
+        value = value.get(segment)
+        if value is None:
+            return 0.0
+    if isinstance(value, Mapping):
+        return 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class RuleEngine:
+    """
+    Evaluates compiled mathematical validation rules.
+
+    Example:
+        engine = RuleEngine.from_config(validation_rules)
+        results = engine.evaluate(form)               # one form
+        results = engine.evaluate_many(client_forms)  # vectorized
+    """
+
+    def __init__(self, rules: Iterable[Rule]):
+        self.rules: List[Rule] = list(rules)
+        self.fields: Tuple[str, ...] = tuple(
+            dict.fromkeys(key for rule in self.rules for key in rule.fields)
+        )
+
+    @classmethod
+    def from_config(cls, validation_rules: Optional[Mapping[str, Any]]) -> "RuleEngine":
+        """
+        Compile the ``mathematical_validation`` section of validation-rules.yaml.
+
+        Rule groups named ``part_i_*`` or ``part_ii_*`` set the part bare line
+        names refer to. Falls back to DEFAULT_RULES when the section is absent.
+
+        Raises:
+            RuleError: If any rule fails to compile
+        """
+        section = (validation_rules or {}).get('mathematical_validation') or DEFAULT_RULES
+
+        rules = []
+        for group, group_rules in section.items():
+            part = _group_part(group)
+            for rule_name, spec in (group_rules or {}).items():
+                rules.append(compile_rule(f"{group}.{rule_name}", spec, part))
+        return cls(rules)
+
+    def evaluate(self, form: Mapping[str, Any]) -> Dict[str, List[str]]:
+        """
+        Evaluate every rule against one populated form.
+
+        Returns:
+            Dictionary with ``errors``, ``warnings`` and ``info`` message lists
+        """
+        env = {key: field_value(form, key) for key in self.fields}
+        results = _empty_results()
+
+        for rule in self.rules:
+            if rule.check(env):
+                continue
+            if rule.sides:
+                lhs, rhs = rule.sides
+                results[rule.bucket].append(rule.describe(lhs(env), rhs(env)))
+            else:
+                results[rule.bucket].append(rule.message)
+
+        return results
+
+    def build_columns(self, forms: Iterable[Mapping[str, Any]]) -> Dict[str, Any]:
+        """
+        Build a column store: one float64 array per referenced field.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError(
+                "NumPy is required for vectorized validation. "
+                "Install with: pip install numpy"
+            )
+        forms = list(forms)
+        return {
+            key: np.fromiter((field_value(form, key) for form in forms),
+                             dtype=np.float64, count=len(forms))
+            for key in self.fields
+        }
+
+    def evaluate_columns(self, columns: Mapping[str, Any], count: int) -> List[Dict[str, List[str]]]:
+        """
+        Evaluate every rule once over a column store of ``count`` forms.
+
+        Returns:
+            Per-form result dictionaries, in column order
+        """
+        if np is None:
+            raise ImportError(
+                "NumPy is required for vectorized validation. "
+                "Install with: pip install numpy"
+            )
+        results = [_empty_results() for _ in range(count)]
+
+        for rule in self.rules:
+            passed = np.broadcast_to(np.asarray(rule.check(columns), dtype=bool), (count,))
+            failing = np.flatnonzero(~passed)
+            if failing.size == 0:
+                continue
+
+            if rule.sides:
+                lhs = np.broadcast_to(rule.sides[0](columns), (count,))
+                rhs = np.broadcast_to(rule.sides[1](columns), (count,))
+                for index in failing:
+                    results[index][rule.bucket].append(
+                        rule.describe(float(lhs[index]), float(rhs[index]))
+                    )
+            else:
+                for index in failing:
+                    results[index][rule.bucket].append(rule.message)
+
+        return results
+
+    def evaluate_many(self, forms: Iterable[Mapping[str, Any]]) -> List[Dict[str, List[str]]]:
+        """
+        Evaluate every rule over many populated forms in one vectorized pass.
+
+        Args:
+            forms: Populated forms as returned by ``populate_form``
+
+        Returns:
+            Per-form result dictionaries, in input order
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        forms = list(forms)
+        return self.evaluate_columns(self.build_columns(forms), len(forms))
@@ -9,6 +9,8 @@ Tests realistic scenarios where multiple skills work together:
 These tests use the test data factories and shared utilities.
 """
 
+import asyncio
+
 import pytest
 from typing import Dict, Any
 from pathlib import Path
@@ -24,6 +26,7 @@ from tests.factories import (
 # Import shared utilities
 from shared.config_loader import ConfigLoader, ConfigurationError
 from shared.base_orchestrator import BaseOrchestrator
+from shared.pipeline import Pipeline
 
 
 # =============================================================================
@@ -227,6 +230,45 @@ class TestIntelligenceToDashboardWorkflow:
         assert result["updates"][0]["entity"] == original_name
 
 
+@pytest.mark.integration
+class TestPipelineWorkflow:
+    """
+    Test workflow: Intelligence → Dashboard and Persona, composed as a pipeline
+
+    Scenario: The same chain as above, declared once and run end to end with
+    the persona branch overlapping the intelligence branch.
+    """
+
+    @staticmethod
+    def build_pipeline() -> Pipeline:
+        return (
+            Pipeline()
+            .add("intelligence", MockIntelligenceExtractor(), inputs={"source_data": "input.stakeholder"})
+            .add("persona", MockPersonaBuilder(), inputs={"stakeholder_data": "input.stakeholder"})
+            .add("dashboard", MockDashboardUpdater(), inputs={"intelligence_data": "intelligence"})
+        )
+
+    def test_pipeline_matches_manual_chain(self, persona_factory):
+        """Test that the pipeline produces the hand-chained outputs."""
+        stakeholder = persona_factory.create_stakeholder(stakeholder_type="partner")
+
+        result = self.build_pipeline().run(stakeholder=stakeholder)
+
+        assert result.status == "success"
+        assert result["dashboard"].output["updates"][0]["entity"] == stakeholder["name"]
+        assert result["persona"].output["persona"]["name"] == stakeholder["name"]
+        assert all(node.duration_seconds >= 0 for node in result.nodes.values())
+
+    def test_pipeline_runs_on_event_loop(self, persona_factory):
+        """Test the asyncio runner on the same chain."""
+        stakeholder = persona_factory.create_stakeholder()
+
+        result = asyncio.run(self.build_pipeline().arun(stakeholder=stakeholder))
+
+        assert result.status == "success"
+        assert result["dashboard"].output["status"] == "success"
+
+
 @pytest.mark.integration
 class TestResearchToPortfolioWorkflow:
     """
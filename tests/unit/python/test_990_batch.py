@@ -0,0 +1,292 @@
+"""
+Unit tests for non-interactive Form 990-EZ batch preparation.
+
+Tests cover:
+- Loading records without prompts (derived totals)
+- Single-return preparation statuses
+- Record input from JSONL files and directories
+- Result output and throughput reporting
+- Process-pool preparation ordering
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Import yaml with guard to prevent CI failures
+try:
+    import yaml
+except ImportError:
+    yaml = None  # type: ignore
+
+# Skip all tests in this module if yaml is not available
+pytestmark = pytest.mark.skipif(
+    yaml is None,
+    reason="PyYAML not installed - skipping yaml-dependent tests"
+)
+
+# Add skills directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "skills" / "990-ez-preparation" / "src"))
+
+if yaml is not None:
+    from batch import BatchReport, iter_records, main, prepare_batch, prepare_parallel, run_batch
+    from orchestrator import Form990EZOrchestrator
+else:
+    Form990EZOrchestrator = None  # type: ignore
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Create a configuration directory with eligibility thresholds."""
+    validation_rules = {
+        'eligibility': {
+            'gross_receipts': {'threshold': 200000},
+            'total_assets': {'threshold': 500000},
+        }
+    }
+    with open(tmp_path / 'validation-rules.yaml', 'w') as f:
+        yaml.dump(validation_rules, f)
+    for name in ('form-mappings.yaml', 'api-integrations.yaml'):
+        with open(tmp_path / name, 'w') as f:
+            yaml.dump({}, f)
+    return str(tmp_path) + "/"
+
+
+def make_record(name='Test Nonprofit', ein='12-3456789', contributions=100000.0, **organization):
+    """Build an organization record in the batch input format."""
+    return {
+        'organization': {
+            'legal_name': name,
+            'ein': ein,
+            'tax_year': 2024,
+            'classification': '501(c)(3)',
+            **organization,
+        },
+        'financial': {
+            'revenue': {
+                'contributions': contributions,
+                'program_service_revenue': 40000.0,
+                'investment_income': 5000.0,
+                'other': 5000.0,
+            },
+            'expenses': {
+                'program_services': 90000.0,
+                'management_general': 25000.0,
+                'fundraising': 10000.0,
+            },
+            'balance_sheet': {
+                'beginning': {'cash': 50000.0, 'other_assets': 150000.0, 'liabilities': 50000.0},
+                'ending': {'cash': 60000.0, 'other_assets': 165000.0, 'liabilities': 50000.0},
+            },
+        },
+        'programs': [{
+            'number': 1,
+            'description': 'Provided educational workshops to 500 underserved youth with measurable literacy gains.',
+            'expenses': 90000.0,
+            'revenue': 0.0,
+        }],
+        'governance': {
+            'officers': [{'name': 'Jane Doe', 'title': 'Executive Director',
+                          'hours_per_week': 40.0, 'compensation': 75000.0}],
+            'policies': {'conflict_of_interest': True, 'whistleblower': True,
+                         'document_retention': True},
+        },
+    }
+
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.financial
+class TestLoadRecord:
+    """Tests for loading records without interactive prompts."""
+
+    def test_load_record_derives_totals(self, config_dir):
+        """Test that missing totals are derived like manual collection."""
+        orchestrator = Form990EZOrchestrator(config_path=config_dir, quiet=True)
+        orchestrator.load_record(make_record())
+
+        financial = orchestrator.financial_data
+        assert financial['revenue']['total'] == 150000.0
+        assert financial['expenses']['total'] == 125000.0
+        assert financial['balance_sheet']['ending']['total_assets'] == 225000.0
+        assert financial['balance_sheet']['ending']['net_assets'] == 175000.0
+        assert financial['net_income'] == 25000.0
+
+    def test_load_record_does_not_mutate_input(self, config_dir):
+        """Test that derived totals are not written back into the record."""
+        record = make_record()
+        orchestrator = Form990EZOrchestrator(config_path=config_dir, quiet=True)
+        orchestrator.load_record(record)
+
+        assert 'total' not in record['financial']['revenue']
+
+
+@pytest.mark.unit
+@pytest.mark.financial
+@pytest.mark.compliance
+class TestPrepareReturn:
+    """Tests for single-return non-interactive preparation."""
+
+    def test_prepare_return_filing_ready(self, config_dir, capsys):
+        """Test that a clean record produces a filing package silently."""
+        orchestrator = Form990EZOrchestrator(config_path=config_dir, quiet=True)
+
+        result = orchestrator.prepare_return(make_record())
+
+        assert result['status'] == 'filing_ready'
+        assert result['filing_package']['executive_summary']['total_revenue'] == 150000.0
+        assert capsys.readouterr().out == ""
+
+    def test_prepare_return_ineligible(self, config_dir):
+        """Test that ineligible organizations stop after eligibility."""
+        orchestrator = Form990EZOrchestrator(config_path=config_dir, quiet=True)
+
+        result = orchestrator.prepare_return(make_record(operates_hospital=True))
+
+        assert result['status'] == 'ineligible'
+        assert 'hospital' in result['reason'].lower()
+        assert 'validation' not in result
+
+    def test_prepare_return_needs_review(self, config_dir):
+        """Test that validation errors are reported instead of a package."""
+        record = make_record()
+        record['financial']['revenue']['total'] = 1.0  # Does not match revenue lines
+        orchestrator = Form990EZOrchestrator(config_path=config_dir, quiet=True)
+
+        result = orchestrator.prepare_return(record)
+
+        assert result['status'] == 'needs_review'
+        assert result['validation']['errors'] > 0
+        assert 'filing_package' not in result
+
+
+@pytest.mark.unit
+class TestBatchRun:
+    """Tests for batch input, output and reporting."""
+
+    def test_iter_records_jsonl(self, tmp_path):
+        """Test reading records from a JSONL file."""
+        source = tmp_path / 'records.jsonl'
+        source.write_text(
+            json.dumps(make_record(ein='11-1111111')) + "\n\n"
+            + json.dumps(make_record(ein='22-2222222')) + "\n"
+        )
+
+        records = list(iter_records(source))
+
+        assert [r['organization']['ein'] for r in records] == ['11-1111111', '22-2222222']
+
+    def test_iter_records_directory_is_sorted(self, tmp_path):
+        """Test reading one record per JSON file in name order."""
+        (tmp_path / 'b.json').write_text(json.dumps(make_record(ein='22-2222222')))
+        (tmp_path / 'a.json').write_text(json.dumps(make_record(ein='11-1111111')))
+        (tmp_path / 'notes.txt').write_text('ignored')
+
+        records = list(iter_records(tmp_path))
+
+        assert [r['organization']['ein'] for r in records] == ['11-1111111', '22-2222222']
+
+    def test_prepare_batch_isolates_failures(self, config_dir):
+        """Test that a malformed record fails alone without aborting the run."""
+        malformed = make_record(ein='99-9999999')
+        malformed['financial']['revenue']['contributions'] = 'not a number'
+        records = [make_record(ein='11-1111111'), malformed, make_record(ein='22-2222222')]
+
+        results = list(prepare_batch(records, config_path=config_dir))
+
+        assert [r['status'] for r in results] == ['filing_ready', 'failed', 'filing_ready']
+        assert results[1]['ein'] == '99-9999999'
+        assert 'error' in results[1]
+
+    def test_run_batch_writes_one_file_per_org(self, config_dir, tmp_path):
+        """Test directory output and report counts."""
+        source = tmp_path / 'records.jsonl'
+        source.write_text("\n".join(json.dumps(r) for r in [
+            make_record(ein='11-1111111'),
+            make_record(ein='22-2222222', contributions=300000.0),
+        ]))
+        output = tmp_path / 'results'
+
+        report = run_batch(source, output, config_path=config_dir)
+
+        files = sorted(p.name for p in output.iterdir())
+        assert files == ['00000_111111111.json', '00001_222222222.json']
+        assert json.loads((output / files[1]).read_text())['status'] == 'ineligible'
+        assert report.total == 2
+        assert report.filing_ready == 1
+        assert report.ineligible == 1
+        assert report.throughput > 0
+
+    def test_run_batch_jsonl_output(self, config_dir, tmp_path):
+        """Test JSONL output keeps input order."""
+        source = tmp_path / 'records.jsonl'
+        source.write_text("\n".join(json.dumps(make_record(ein=f'{i:02d}-0000000')) for i in range(5)))
+        output = tmp_path / 'results.jsonl'
+
+        run_batch(source, output, config_path=config_dir)
+
+        lines = output.read_text().splitlines()
+        assert [json.loads(line)['ein'] for line in lines] == [f'{i:02d}-0000000' for i in range(5)]
+
+    def test_malformed_line_fails_alone(self, config_dir, tmp_path):
+        """Test that an unparsable JSONL line becomes a failed result with its line number."""
+        source = tmp_path / 'records.jsonl'
+        source.write_text(
+            json.dumps(make_record(ein='11-1111111')) + "\n"
+            + '{"organization": {"ein": \n'
+            + json.dumps(make_record(ein='22-2222222')) + "\n"
+        )
+        output = tmp_path / 'results.jsonl'
+
+        report = run_batch(source, output, config_path=config_dir)
+
+        results = [json.loads(line) for line in output.read_text().splitlines()]
+        assert [r['status'] for r in results] == ['filing_ready', 'failed', 'filing_ready']
+        assert results[1]['line'] == 2
+        assert results[1]['source'] == str(source)
+        assert 'Invalid JSON' in results[1]['error']
+        assert (report.total, report.failed) == (3, 1)
+
+    @pytest.mark.parametrize('workers', ['0', '-2', 'many'])
+    def test_workers_below_one_rejected(self, workers, capsys):
+        """Test that --workers only accepts a positive process count."""
+        with pytest.raises(SystemExit) as excinfo:
+            main(['records.jsonl', '--output', '-', '--workers', workers])
+
+        assert excinfo.value.code == 2
+        assert '--workers' in capsys.readouterr().err
+
+    def test_prepare_parallel_matches_serial_order(self, config_dir):
+        """Test that worker processes return the serial results in input order."""
+        records = [make_record(ein=f'{i:02d}-0000000', contributions=50000.0 * (i % 5))
+                   for i in range(12)]
+
+        serial = list(prepare_batch(records, config_path=config_dir))
+        parallel = list(prepare_parallel(records, config_path=config_dir, workers=2, chunk_size=5))
+
+        assert [r['ein'] for r in parallel] == [r['ein'] for r in serial]
+        assert [r['status'] for r in parallel] == [r['status'] for r in serial]
+
+    def test_run_batch_parallel_workers(self, config_dir, tmp_path):
+        """Test that --workers output matches the serial run."""
+        source = tmp_path / 'records.jsonl'
+        source.write_text("\n".join(json.dumps(make_record(ein=f'{i:02d}-0000000')) for i in range(7)))
+
+        report = run_batch(source, tmp_path / 'results.jsonl', config_path=config_dir, workers=3)
+
+        lines = (tmp_path / 'results.jsonl').read_text().splitlines()
+        assert [json.loads(line)['ein'] for line in lines] == [f'{i:02d}-0000000' for i in range(7)]
+        assert report.filing_ready == 7
+
+    def test_batch_report_throughput_zero_elapsed(self):
+        """Test throughput is zero before any time has elapsed."""
+        assert BatchReport(total=3).throughput == 0.0
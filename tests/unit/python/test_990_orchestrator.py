@@ -359,11 +359,38 @@ class TestFormPopulation:
 
         part_i = orchestrator._populate_part_i()
 
-        assert part_i['line_10'] == 90000.00   # Program services
-        assert part_i['line_13'] == 25000.00   # Management & general
-        assert part_i['line_14'] == 10000.00   # Fundraising
+        # Only the functional split was collected: officer pay is line 11b
+        # and the rest is reported as other expenses
+        assert part_i['line_10'] == 0          # Grants
+        assert part_i['line_11b'] == 75000.00  # Salaries
+        assert part_i['line_13'] == 0          # Occupancy
+        assert part_i['line_14'] == 0          # Printing and postage
+        assert part_i['line_15'] == 50000.00   # Other expenses
         assert part_i['line_16'] == 125000.00  # Total expenses
 
+    def test_itemized_expense_lines(self, orchestrator, sample_financial_data, sample_governance_data):
+        """Test that itemized expenses land on their own lines and all count toward line 16."""
+        sample_financial_data['expense_lines'] = {
+            'grants_paid': 20000.00, 'member_benefits': 1000.00, 'compensation': 80000.00,
+            'professional_fees': 9000.00, 'occupancy': 6000.00, 'printing_postage': 4000.00,
+            'other': 5000.00,
+        }
+        orchestrator.financial_data = sample_financial_data
+        orchestrator.governance_data = sample_governance_data
+
+        form = orchestrator.populate_form()
+        part_i = form['part_i']
+
+        assert [part_i[line] for line in ('line_10', 'line_11a', 'line_11b', 'line_12',
+                                          'line_13', 'line_14', 'line_15')] == \
+            [20000.00, 1000.00, 80000.00, 9000.00, 6000.00, 4000.00, 5000.00]
+        assert part_i['line_16'] == 125000.00
+        assert form['functional_expenses'] == {
+            'program_services': 90000.00, 'management_general': 25000.00,
+            'fundraising': 10000.00, 'total': 125000.00,
+        }
+        assert orchestrator.validate_form(form)['details']['errors'] == []
+
     def test_populate_part_i_officer_compensation(self, orchestrator, sample_financial_data, sample_governance_data):
         """Test Part I officer compensation calculation."""
         orchestrator.financial_data = sample_financial_data
@@ -434,6 +461,24 @@ class TestFormPopulation:
         assert part_v['line_44b'] is True  # Whistleblower
         assert part_v['line_44c'] is True  # Document retention
 
+    def test_field_plan_runs_once_per_return(self, orchestrator, sample_financial_data,
+                                             sample_governance_data):
+        """Test that the part helpers share one run of the field plan."""
+        orchestrator.financial_data = sample_financial_data
+        orchestrator.governance_data = sample_governance_data
+
+        with patch.object(orchestrator.field_plan, 'populate',
+                          wraps=orchestrator.field_plan.populate) as populate:
+            form = orchestrator.populate_form()
+            assert orchestrator._populate_part_i() is form['part_i']
+            orchestrator._populate_part_ii()
+            orchestrator._populate_part_v()
+            assert populate.call_count == 1
+
+            orchestrator.governance_data = {'officers': [], 'policies': {}}
+            assert orchestrator._populate_part_v()['line_44a'] is False
+            assert populate.call_count == 2
+
     def test_populate_complete_form(self, orchestrator, sample_organization_data,
                                     sample_financial_data, sample_governance_data, sample_program_data):
         """Test complete form population."""
@@ -1456,3 +1501,92 @@ class TestValidationEdgeCases:
 
         # Should have info message about whistleblower policy
         assert any('whistleblower' in i.lower() for i in validation['details']['info'])
+
+
+# ============================================================================
+# CONFIGURATION RELOADING TESTS
+# ============================================================================
+
+@pytest.mark.unit
+@pytest.mark.compliance
+class TestConfigReloading:
+    """Tests for picking up configuration edits without a restart."""
+
+    @staticmethod
+    def _rewrite_rules(config_dir, rules):
+        path = Path(config_dir) / 'validation-rules.yaml'
+        stat = path.stat()
+        with open(path, 'w') as f:
+            yaml.dump(rules, f)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_threshold_change_applied(self, orchestrator, temp_config_dir):
+        """Test that a new gross receipts threshold takes effect after a poll."""
+        from shared.config_loader import ConfigLoader
+
+        orchestrator.watch_config(start=False)
+        try:
+            assert orchestrator.verify_eligibility(180000, 100000)[0] is True
+
+            self._rewrite_rules(temp_config_dir, {'eligibility': {
+                'gross_receipts': {'threshold': 150000},
+                'total_assets': {'threshold': 500000},
+            }})
+            ConfigLoader.watcher().poll()
+        finally:
+            orchestrator.unwatch_config()
+
+        assert orchestrator.verify_eligibility(180000, 100000)[0] is False
+
+    def test_invalid_rules_keep_current_engine(self, orchestrator, temp_config_dir):
+        """Test that rules that fail to compile are not swapped in."""
+        from shared.config_loader import ConfigLoader
+
+        rule_engine = orchestrator.rule_engine
+        orchestrator.watch_config(start=False)
+        try:
+            self._rewrite_rules(temp_config_dir, {'mathematical_validation': {
+                'part_i_checks': {'bad': {'formula': "line_9 +"}},
+            }})
+            with patch('sys.stderr'):
+                ConfigLoader.watcher().poll()
+        finally:
+            orchestrator.unwatch_config()
+
+        assert orchestrator.rule_engine is rule_engine
+
+    def test_symlinked_rules_reach_rules_handler(self, temp_config_dir):
+        """Test that a symlinked config with another target name is reloaded as what it is."""
+        from shared.config_loader import ConfigLoader
+
+        config_dir = Path(temp_config_dir)
+        target = config_dir / 'rules-2024.yaml'
+        os.replace(config_dir / 'validation-rules.yaml', target)
+        (config_dir / 'validation-rules.yaml').symlink_to(target)
+        orchestrator = Form990EZOrchestrator(config_path=temp_config_dir)
+
+        orchestrator.watch_config(start=False)
+        try:
+            self._rewrite_rules(temp_config_dir, {'eligibility': {
+                'gross_receipts': {'threshold': 150000},
+                'total_assets': {'threshold': 500000},
+            }})
+            ConfigLoader.watcher().poll()
+        finally:
+            orchestrator.unwatch_config()
+
+        assert orchestrator.verify_eligibility(180000, 100000)[0] is False
+        assert orchestrator.api_config == {}
+
+    def test_config_directory_left_untouched_by_default(self, temp_config_dir):
+        """Test that configs are only read unless snapshots are requested."""
+        config_dir = Path(temp_config_dir)
+        before = sorted(p.name for p in config_dir.iterdir())
+
+        Form990EZOrchestrator(config_path=temp_config_dir)
+        assert sorted(p.name for p in config_dir.iterdir()) == before
+
+        from shared.config_loader import ConfigLoader
+        ConfigLoader.clear_cache()
+        Form990EZOrchestrator(config_path=temp_config_dir, snapshot=True)
+        assert (config_dir / '.validation-rules.yaml.snapshot').exists()
@@ -6,15 +6,19 @@ Tests cover:
 - Result management
 - Error and warning tracking
 - Lifecycle methods (run, reset)
+- Async lifecycle (arun, run_many)
 - Utility methods
 """
 
+import asyncio
+import os
+
 import pytest
 from pathlib import Path
 from typing import Dict, Any
 
-from shared.base_orchestrator import BaseOrchestrator, OrchestratorError
-from shared.config_loader import ConfigurationError
+from shared.base_orchestrator import BaseOrchestrator, OrchestratorError, run_many
+from shared.config_loader import ConfigLoader, ConfigurationError
 
 
 # ==============================================================================
@@ -261,6 +265,30 @@ class TestErrorAndWarningManagement:
         orch.add_warning("Warning")
         assert orch.has_warnings() is True
 
+    def test_event_capacity_bounds_logs(self):
+        """Test that event_capacity keeps only recent events."""
+        class BoundedOrchestrator(SimpleOrchestrator):
+            event_capacity = 2
+
+        orch = BoundedOrchestrator()
+        for i in range(5):
+            orch.add_error(f"Error {i}")
+
+        assert [e["message"] for e in orch.get_errors()] == ["Error 3", "Error 4"]
+        assert orch.get_summary()["error_count"] == 5
+
+    def test_events_view_iterates_without_copy(self):
+        """Test that events() returns the live log."""
+        orch = SimpleOrchestrator()
+        orch.add_warning("Careful", code="W1")
+
+        view = orch.events("warning")
+        orch.add_warning("Again")
+
+        assert [event.code for event in view] == ["W1", None]
+        with pytest.raises(ValueError):
+            orch.events("debug")
+
     def test_get_errors_returns_copy(self):
         """Test that get_errors returns a copy."""
         orch = SimpleOrchestrator()
@@ -357,6 +385,80 @@ class TestRunLifecycle:
         assert result["timing"]["duration_seconds"] >= 0
 
 
+class AsyncOrchestrator(SimpleOrchestrator):
+    """Orchestrator with native async initialization and execution."""
+
+    active = 0
+    peak = 0
+
+    def _initialize(self) -> None:
+        self.init_calls = 0
+
+    async def _ainitialize(self) -> None:
+        self.init_calls += 1
+
+    async def aexecute(self, **kwargs) -> Dict[str, Any]:
+        AsyncOrchestrator.active += 1
+        AsyncOrchestrator.peak = max(AsyncOrchestrator.peak, AsyncOrchestrator.active)
+        await asyncio.sleep(0.001)
+        AsyncOrchestrator.active -= 1
+        if kwargs.get("fail_on") == self.config.get("name"):
+            raise ValueError("boom")
+        return {"name": self.config.get("name")}
+
+
+class TestAsyncLifecycle:
+    """Tests for arun() and run_many()."""
+
+    def test_arun_wraps_sync_execute(self):
+        """Test that synchronous skills run through arun unchanged."""
+        orch = SimpleOrchestrator()
+
+        result = asyncio.run(orch.arun(value=1))
+
+        assert result["status"] == "success"
+        assert result["result"] == {"executed": True, "kwargs": {"value": 1}}
+        assert result["timing"]["duration_seconds"] >= 0
+
+    def test_arun_initializes_once(self):
+        """Test that _ainitialize runs before the first arun only."""
+        orch = AsyncOrchestrator(config={"name": "a"})
+
+        async def twice():
+            await orch.arun()
+            return await orch.arun()
+
+        result = asyncio.run(twice())
+
+        assert result["result"] == {"name": "a"}
+        assert orch.init_calls == 1
+
+    def test_arun_catches_exceptions(self):
+        """Test that arun reports failures like run."""
+        orch = FailingOrchestrator()
+
+        result = asyncio.run(orch.arun())
+
+        assert result["status"] == "failed"
+        assert orch.has_errors()
+
+    def test_run_many_bounds_concurrency_and_keeps_order(self):
+        """Test that run_many limits in-flight runs and preserves input order."""
+        AsyncOrchestrator.active = AsyncOrchestrator.peak = 0
+        orchestrators = [AsyncOrchestrator(config={"name": i}) for i in range(20)]
+
+        results = asyncio.run(run_many(orchestrators, concurrency=4, fail_on=7))
+
+        assert AsyncOrchestrator.peak == 4
+        assert [r["result"].get("name") for r in results] == [i if i != 7 else None for i in range(20)]
+        assert results[7]["status"] == "failed"
+
+    def test_run_many_rejects_zero_concurrency(self):
+        """Test that concurrency must be positive."""
+        with pytest.raises(ValueError):
+            asyncio.run(run_many([], concurrency=0))
+
+
 class TestReset:
     """Tests for the reset method."""
 
@@ -403,6 +505,37 @@ class TestUtilityMethods:
         assert orch.get_config_value("missing", "default") == "default"
         assert orch.get_config_value("database.missing", 0) == 0
 
+    def test_get_config_value_cache_invalidated_on_reassign(self):
+        """Test that reassigning config drops cached values."""
+        orch = NestedConfigOrchestrator()
+        assert orch.get_config_value("database.port") == 5432
+        assert orch.get_config_value("database.replica", "none") == "none"
+
+        orch.config = {"database": {"port": 6543, "replica": "db2"}}
+
+        assert orch.get_config_value("database.port") == 6543
+        assert orch.get_config_value("database.replica", "none") == "db2"
+
+    def test_get_config_value_sees_in_place_change(self):
+        """Test that mutating the config dict in place is seen immediately."""
+        orch = NestedConfigOrchestrator()
+        assert orch.get_config_value("database.host") == "localhost"
+        assert orch.get_config_value("database.replica") is None
+
+        orch.config["database"]["host"] = "db.internal"
+        orch.config["database"]["replica"] = "db2"
+
+        assert orch.get_config_value("database.host") == "db.internal"
+        assert orch.get_config_value("database.replica") == "db2"
+
+    def test_get_config_values_bulk(self):
+        """Test resolving several keys at once."""
+        orch = NestedConfigOrchestrator()
+
+        values = orch.get_config_values(["database.host", "features", "database.missing"], default=0)
+
+        assert values == {"database.host": "localhost", "features": ["auth", "logging"], "database.missing": 0}
+
     def test_validate_config_passes(self):
         """Test config validation with all required keys present."""
         orch = NestedConfigOrchestrator()
@@ -455,6 +588,62 @@ class TestUtilityMethods:
         assert captured.out == ""
 
 
+class ReloadingOrchestrator(SimpleOrchestrator):
+    """Orchestrator that records configuration reloads."""
+
+    def _initialize(self) -> None:
+        self.reloads = []
+
+    def _on_config_reloaded(self, old_config: Dict[str, Any], new_config: Dict[str, Any]) -> None:
+        self.reloads.append((old_config, new_config))
+
+
+class TestConfigReloading:
+    """Tests for hot reloading the configuration file."""
+
+    def test_config_swapped_when_file_changes(self, tmp_path: Path):
+        """Test that a changed file replaces config and calls the hook."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("setting: before\n")
+        orch = ReloadingOrchestrator(config_path=config_file)
+        orch.watch_config(start=False)
+
+        try:
+            stat = config_file.stat()
+            config_file.write_text("setting: after\ntimeout: 5\n")
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            ConfigLoader.watcher().poll()
+        finally:
+            orch.unwatch_config()
+
+        assert orch.config == {"setting": "after", "timeout": 5}
+        assert orch.reloads == [({"setting": "before"}, {"setting": "after", "timeout": 5})]
+
+    def test_unwatched_orchestrator_keeps_config(self, tmp_path: Path):
+        """Test that unwatch_config stops reloads."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("setting: before\n")
+        orch = ReloadingOrchestrator(config_path=config_file)
+        orch.watch_config(start=False)
+        orch.unwatch_config()
+
+        stat = config_file.stat()
+        config_file.write_text("setting: after\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        ConfigLoader.watcher().poll()
+
+        assert orch.config == {"setting": "before"}
+        assert orch.reloads == []
+
+    def test_watch_requires_config_file(self):
+        """Test that in-memory configuration cannot be watched."""
+        orch = SimpleOrchestrator(config={"setting": "x"})
+
+        assert orch.config_path is None
+        with pytest.raises(OrchestratorError, match="no config_path"):
+            orch.watch_config(start=False)
+
+
 class TestOrchestratorError:
     """Tests for OrchestratorError exception."""
 
@@ -7,11 +7,29 @@ Tests cover:
 - Frontmatter extraction from markdown files
 - Default value merging
 - Required field validation
+- Parsed configuration caching
+- Binary config snapshots
+- Watching config files for changes
 """
 
+import os
+import pickle
+import threading
+import time
+
 import pytest
 from pathlib import Path
-from shared.config_loader import ConfigLoader, ConfigurationError
+import shared.config_loader as config_loader
+from shared.config_loader import (
+    ConfigCache, ConfigLoader, ConfigurationError, ConfigWatcher, snapshot_path
+)
+
+
+def rewrite(path: Path, text: str) -> None:
+    """Replace a file's contents and move its mtime forward."""
+    stat = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
 
 
 class TestLoadYaml:
@@ -91,6 +109,328 @@ features:
         assert result == {"key": "value"}
 
 
+class TestConfigCache:
+    """Tests for the process-wide parsed configuration cache."""
+
+    def setup_method(self):
+        ConfigLoader.clear_cache()
+
+    def teardown_method(self):
+        ConfigLoader.clear_cache()
+
+    def test_second_load_is_a_hit(self, tmp_path: Path):
+        """Test that an unchanged file is parsed once."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("key: value\n")
+
+        ConfigLoader.load_yaml(config_file)
+        result = ConfigLoader.load_yaml(str(config_file))
+
+        assert result == {"key": "value"}
+        info = ConfigLoader.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_changed_file_is_reparsed(self, tmp_path: Path):
+        """Test that a new mtime or size invalidates the entry."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("threshold: 200000\n")
+        ConfigLoader.load_yaml(config_file)
+
+        config_file.write_text("threshold: 250000\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert ConfigLoader.load_yaml(config_file) == {"threshold": 250000}
+        assert ConfigLoader.cache_info().misses == 2
+
+    def test_mutating_result_does_not_corrupt_cache(self, tmp_path: Path):
+        """Test that each mutable load is a private copy."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("nested:\n  items: [1, 2]\n")
+
+        first = ConfigLoader.load_yaml(config_file)
+        first["nested"]["items"].append(3)
+        second = ConfigLoader.load_yaml(config_file)
+        second["nested"]["items"].append(4)
+
+        assert ConfigLoader.load_yaml(config_file) == {"nested": {"items": [1, 2]}}
+
+    def test_frozen_view_is_read_only_and_shared(self, tmp_path: Path):
+        """Test that frozen loads return one immutable view."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("nested:\n  items: [1, 2]\n")
+
+        view = ConfigLoader.load_yaml(config_file, frozen=True)
+
+        assert view["nested"]["items"] == (1, 2)
+        assert ConfigLoader.load_yaml(config_file, frozen=True) is view
+        with pytest.raises(TypeError):
+            view["nested"]["key"] = "value"
+
+    def test_use_cache_false_bypasses_cache(self, tmp_path: Path):
+        """Test that uncached loads leave the counters untouched."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("key: value\n")
+
+        ConfigLoader.load_yaml(config_file, use_cache=False)
+
+        assert ConfigLoader.cache_info().currsize == 0
+        assert ConfigLoader.cache_info().misses == 0
+
+    def test_least_recently_used_entry_evicted(self):
+        """Test LRU eviction order."""
+        cache = ConfigCache(maxsize=2)
+        cache.put("a", (1, 1), {"a": 1})
+        cache.put("b", (1, 1), {"b": 1})
+        cache.get("a", (1, 1))
+        cache.put("c", (1, 1), {"c": 1})
+
+        assert cache.get("b", (1, 1)) is None
+        assert cache.get("a", (1, 1)) == {"a": 1}
+        assert cache.info().currsize == 2
+
+    def test_concurrent_loads(self, tmp_path: Path):
+        """Test that concurrent loads agree and counters stay consistent."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("key: value\n")
+        results = []
+
+        def load():
+            for _ in range(50):
+                results.append(ConfigLoader.load_yaml(config_file, frozen=True)["key"])
+
+        threads = [threading.Thread(target=load) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = ConfigLoader.cache_info()
+        assert results == ["value"] * 400
+        assert info.hits + info.misses == 400
+
+
+class TestSnapshots:
+    """Tests for binary snapshots of parsed configuration files."""
+
+    def test_snapshot_written_next_to_source(self, tmp_path: Path):
+        """Test that a hidden snapshot is created on first load."""
+        config_file = tmp_path / "rules.yaml"
+        config_file.write_text("threshold: 200000\nupdated: 2025-11-17\n")
+
+        result = ConfigLoader.load_yaml(config_file, use_cache=False, snapshot=True)
+
+        assert snapshot_path(config_file) == tmp_path / ".rules.yaml.snapshot"
+        assert snapshot_path(config_file).exists()
+        assert result["threshold"] == 200000
+
+    def test_snapshot_reused_without_parsing(self, tmp_path: Path, monkeypatch):
+        """Test that an unchanged source is loaded from its snapshot."""
+        config_file = tmp_path / "rules.yaml"
+        config_file.write_text("threshold: 200000\nupdated: 2025-11-17\n")
+        expected = ConfigLoader.load_yaml(config_file, use_cache=False, snapshot=True)
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("YAML should not be parsed")
+
+        monkeypatch.setattr(config_loader.yaml, "load", fail_parse)
+
+        assert ConfigLoader.load_yaml(config_file, use_cache=False, snapshot=True) == expected
+
+    def test_changed_source_refreshes_snapshot(self, tmp_path: Path):
+        """Test that a snapshot is ignored once the source hash changes."""
+        config_file = tmp_path / "rules.yaml"
+        config_file.write_text("threshold: 200000\n")
+        ConfigLoader.load_yaml(config_file, use_cache=False, snapshot=True)
+
+        config_file.write_text("threshold: 250000\n")
+
+        assert ConfigLoader.load_yaml(config_file, use_cache=False, snapshot=True) == {"threshold": 250000}
+        assert ConfigLoader.load_yaml(config_file, use_cache=False, snapshot=True) == {"threshold": 250000}
+
+    def test_untrusted_snapshot_types_rejected(self, tmp_path: Path):
+        """Test that snapshots cannot smuggle arbitrary objects."""
+        config_file = tmp_path / "rules.yaml"
+        config_file.write_text("threshold: 200000\n")
+        ConfigLoader.load_yaml(config_file, use_cache=False, snapshot=True)
+        with open(snapshot_path(config_file), "rb") as f:
+            digest = pickle.load(f)["sha256"]
+        with open(snapshot_path(config_file), "wb") as f:
+            pickle.dump({"version": 1, "sha256": digest, "data": ConfigurationError("x")}, f)
+
+        assert ConfigLoader.load_yaml(config_file, use_cache=False, snapshot=True) == {"threshold": 200000}
+
+    def test_stale_snapshot_version_ignored(self, tmp_path: Path, monkeypatch):
+        """Test that snapshots from another layout version are not used."""
+        config_file = tmp_path / "rules.yaml"
+        config_file.write_text("threshold: 200000\n")
+        ConfigLoader.load_yaml(config_file, use_cache=False, snapshot=True)
+
+        monkeypatch.setattr(config_loader, "SNAPSHOT_VERSION", 2)
+        with open(snapshot_path(config_file), "rb") as f:
+            assert pickle.load(f)["version"] == 1
+
+        ConfigLoader.load_yaml(config_file, use_cache=False, snapshot=True)
+
+        with open(snapshot_path(config_file), "rb") as f:
+            assert pickle.load(f)["version"] == 2
+
+
+class TestConfigWatcher:
+    """Tests for ConfigWatcher change notifications."""
+
+    def test_unchanged_file_not_reported(self, tmp_path: Path):
+        """Test that subscribing does not trigger a reload by itself."""
+        config_file = tmp_path / "rules.yaml"
+        config_file.write_text("threshold: 200000\n")
+        watcher = ConfigWatcher()
+        calls = []
+        watcher.subscribe(config_file, lambda path, config: calls.append(config))
+
+        assert watcher.poll() == []
+        assert calls == []
+
+    def test_changed_file_reparsed_once_for_all_subscribers(self, tmp_path: Path, monkeypatch):
+        """Test that each subscriber gets the new config from a single parse."""
+        config_file = tmp_path / "rules.yaml"
+        other_file = tmp_path / "other.yaml"
+        config_file.write_text("threshold: 200000\n")
+        other_file.write_text("unchanged: true\n")
+        watcher = ConfigWatcher()
+        calls = []
+        watcher.subscribe(config_file, lambda path, config: calls.append(("a", config)))
+        watcher.subscribe(config_file, lambda path, config: calls.append(("b", config)))
+        watcher.subscribe(other_file, lambda path, config: calls.append(("other", config)))
+
+        parses = []
+        parse = config_loader._parse_yaml_file
+        monkeypatch.setattr(config_loader, "_parse_yaml_file",
+                            lambda *args: parses.append(args[0]) or parse(*args))
+        rewrite(config_file, "threshold: 250000\n")
+
+        assert watcher.poll() == [config_file]
+        assert calls == [("a", {"threshold": 250000}), ("b", {"threshold": 250000})]
+        assert len(parses) == 1
+
+    def test_invalid_edit_reported_not_delivered(self, tmp_path: Path):
+        """Test that a broken file keeps subscribers on the old config."""
+        config_file = tmp_path / "rules.yaml"
+        config_file.write_text("threshold: 200000\n")
+        errors = []
+        watcher = ConfigWatcher(on_error=lambda path, error: errors.append(error))
+        calls = []
+        watcher.subscribe(config_file, lambda path, config: calls.append(config))
+
+        rewrite(config_file, "threshold: [unclosed\n")
+
+        assert watcher.poll() == []
+        assert calls == []
+        assert isinstance(errors[0], ConfigurationError)
+
+    def test_invalid_edit_retried_until_it_parses(self, tmp_path: Path):
+        """Test that a half-written file is reloaded once complete, with one error report."""
+        config_file = tmp_path / "rules.yaml"
+        config_file.write_text("threshold: 200000\n")
+        errors = []
+        watcher = ConfigWatcher(on_error=lambda path, error: errors.append(error))
+        calls = []
+        watcher.subscribe(config_file, lambda path, config: calls.append(config))
+        rewrite(config_file, "threshold: [1, 22\n")
+        watcher.poll()
+        watcher.poll()
+
+        # Completed in place with the same size and mtime
+        stat = config_file.stat()
+        config_file.write_text("threshold: 250000\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        ConfigLoader.clear_cache()
+
+        assert watcher.poll() == [config_file]
+        assert calls == [{"threshold": 250000}]
+        assert len(errors) == 1
+
+    def test_undecodable_edit_keeps_thread_polling(self, tmp_path: Path):
+        """Test that non-YAML errors are reported and later edits still arrive."""
+        config_file = tmp_path / "rules.yaml"
+        config_file.write_text("threshold: 200000\n")
+        errors = []
+        received = threading.Event()
+        watcher = ConfigWatcher(interval=0.01, on_error=lambda path, error: errors.append(error))
+        watcher.subscribe(config_file, lambda path, config: received.set())
+
+        with watcher:
+            stat = config_file.stat()
+            config_file.write_bytes(b"threshold: \xff\xfe\n")
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            deadline = time.monotonic() + 5
+            while not errors and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert isinstance(errors[0], UnicodeDecodeError)
+
+            rewrite(config_file, "threshold: 250000\n")
+            assert received.wait(5)
+
+        assert len(errors) == 1
+
+    def test_symlink_swap_detected(self, tmp_path: Path):
+        """Test that re-pointing a watched symlink at a new file triggers a reload."""
+        old_target = tmp_path / "v1" / "rules.yaml"
+        new_target = tmp_path / "v2" / "rules.yaml"
+        for target, threshold in ((old_target, 200000), (new_target, 250000)):
+            target.parent.mkdir()
+            target.write_text(f"threshold: {threshold}\n")
+        link = tmp_path / "rules.yaml"
+        link.symlink_to(old_target)
+        watcher = ConfigWatcher()
+        calls = []
+        watcher.subscribe(link, lambda path, config: calls.append((path, config)))
+
+        swap = tmp_path / "rules.yaml.new"
+        swap.symlink_to(new_target)
+        os.replace(swap, link)
+        old_target.unlink()
+
+        assert watcher.poll() == [link]
+        assert calls == [(link, {"threshold": 250000})]
+
+    def test_unsubscribe_and_dead_weak_callbacks(self, tmp_path: Path):
+        """Test that removed and garbage-collected subscribers are not called."""
+        config_file = tmp_path / "rules.yaml"
+        config_file.write_text("threshold: 200000\n")
+        watcher = ConfigWatcher()
+        calls = []
+
+        class Listener:
+            def on_change(self, path, config):
+                calls.append(config)
+
+        listener = Listener()
+        watcher.subscribe(config_file, listener.on_change, weak=True)
+        subscription = watcher.subscribe(config_file, lambda path, config: calls.append(config))
+        watcher.unsubscribe(subscription)
+        del listener
+
+        rewrite(config_file, "threshold: 250000\n")
+        watcher.poll()
+
+        assert calls == []
+        assert watcher._subscriptions == {}
+
+    def test_background_thread_delivers_changes(self, tmp_path: Path):
+        """Test that start() polls until stop() is called."""
+        config_file = tmp_path / "rules.yaml"
+        config_file.write_text("threshold: 200000\n")
+        received = threading.Event()
+        watcher = ConfigWatcher(interval=0.01)
+        watcher.subscribe(config_file, lambda path, config: received.set())
+
+        with watcher:
+            rewrite(config_file, "threshold: 250000\n")
+            assert received.wait(5)
+
+        assert not watcher.running
+
+
 class TestLoadYamlWithDefaults:
     """Tests for ConfigLoader.load_yaml_with_defaults()"""
 
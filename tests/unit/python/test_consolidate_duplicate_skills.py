@@ -0,0 +1,165 @@
+"""
+Unit tests for the skill consolidation script.
+
+Tests cover:
+- Single-walk directory scans and size totals
+- Size-first, hash-second file comparison with cached digests
+- Merge planning for files only in the user copy
+- Concurrent planning of every skill and applying the merged plan
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+scripts_dir = Path(__file__).parent.parent.parent.parent / "scripts"
+sys.path.insert(0, str(scripts_dir))
+
+import consolidate_duplicate_skills as consolidate  # noqa: E402
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create one skill in both skills/ and .claude/skills/."""
+    user = tmp_path / "skills" / "demo"
+    managed = tmp_path / ".claude" / "skills" / "demo"
+    for root in (user, managed):
+        (root / "assets").mkdir(parents=True)
+        (root / "SKILL.md").write_text("# Demo\n")
+        (root / "assets" / "logo.bin").write_bytes(b"\x00" * 4096)
+    (user / "assets" / "logo.bin").write_bytes(b"\x01" * 4096)
+    (user / "notes.md").write_text("only here")
+    (managed / "README.md").write_text("readme")
+    consolidate._digest_cache.clear()
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestCompareDirectories:
+    """Tests for comparing duplicate skill trees."""
+
+    def test_analyze_skill(self, project):
+        """Test unique, different and total-size reporting."""
+        result = consolidate.analyze_skill("demo", project)
+
+        assert result["only_in_user"] == ["notes.md"]
+        assert result["only_in_managed"] == ["README.md"]
+        assert result["different_files"] == [str(Path("assets") / "logo.bin")]
+        assert result["user_size_kb"] == 4
+
+    def test_size_mismatch_skips_hashing(self, project, monkeypatch):
+        """Test that files of different sizes are never read."""
+        managed_skill = project / ".claude" / "skills" / "demo"
+        (managed_skill / "SKILL.md").write_text("# Demo, managed edition\n")
+        hashed = []
+        original = consolidate.file_digest
+        monkeypatch.setattr(
+            consolidate, "file_digest", lambda path, info: hashed.append(path.name) or original(path, info)
+        )
+
+        _, _, different = consolidate.compare_directories(project / "skills" / "demo", managed_skill)
+
+        assert Path("SKILL.md") in different
+        assert "SKILL.md" not in hashed
+
+    def test_digests_cached_until_file_changes(self, project):
+        """Test that repeat comparisons reuse digests and see edits."""
+        user_skill = project / "skills" / "demo"
+        managed_skill = project / ".claude" / "skills" / "demo"
+
+        consolidate.compare_directories(user_skill, managed_skill)
+        cached = len(consolidate._digest_cache)
+        consolidate.compare_directories(user_skill, managed_skill)
+        assert len(consolidate._digest_cache) == cached
+
+        logo = user_skill / "assets" / "logo.bin"
+        stat = logo.stat()
+        logo.write_bytes(b"\x00" * 4096)
+        os.utime(logo, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        _, _, different = consolidate.compare_directories(user_skill, managed_skill)
+        assert different == []
+
+    def test_merge_plans_user_only_files(self, project):
+        """Test that only files missing from the managed copy are merged."""
+        actions = consolidate.merge_unique_files("demo", project, dry_run=True)
+
+        assert len(actions) == 1
+        assert actions[0].startswith("Copy: ") and "notes.md" in actions[0]
+
+
+@pytest.mark.unit
+class TestPlanAll:
+    """Tests for --plan-all and --apply."""
+
+    def test_plan_covers_every_duplicate(self, project):
+        """Test discovery, per-skill savings and totals."""
+        (project / "skills" / "user-only").mkdir()
+        other = project / "skills" / "other"
+        for root in (other, project / ".claude" / "skills" / "other"):
+            root.mkdir(parents=True)
+            (root / "SKILL.md").write_text("same")
+
+        plan = consolidate.plan_all(project, workers=2)
+
+        by_skill = {entry["skill"]: entry for entry in plan["skills"]}
+        assert sorted(by_skill) == ["demo", "other"]
+        assert by_skill["demo"]["copies"][0]["bytes"] == len("only here")
+        assert by_skill["demo"]["savings_bytes"] == by_skill["demo"]["user_bytes"] - len("only here")
+        assert by_skill["other"]["savings_bytes"] == 4
+        assert plan["total_copies"] == 1
+        assert plan["total_savings_bytes"] == sum(e["savings_bytes"] for e in plan["skills"])
+
+    def test_apply_copies_then_symlinks(self, project):
+        """Test that applying merges unique files and links the user copy."""
+        plan = consolidate.plan_all(project)
+
+        applied = consolidate.apply_plan(plan, project)
+
+        assert applied["demo"].startswith("Symlink: ")
+        assert (project / "skills" / "demo").is_symlink()
+        assert (project / ".claude" / "skills" / "demo" / "notes.md").read_text() == "only here"
+        assert (project / "skills" / ".demo.backup" / "notes.md").exists()
+
+    def test_large_file_copy_falls_back(self, tmp_path, monkeypatch):
+        """Test that large copies survive copy_file_range being unsupported."""
+        def unsupported(*args):
+            raise OSError(18, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+        source = tmp_path / "big.bin"
+        source.write_bytes(os.urandom(consolidate.LARGE_FILE_BYTES + 12345))
+
+        consolidate.copy_file(source, tmp_path / "copy.bin", source.stat().st_size)
+
+        assert (tmp_path / "copy.bin").read_bytes() == source.read_bytes()
+
+    def test_failed_large_copy_removes_partial_file(self, tmp_path, monkeypatch):
+        """Test that a copy failing partway leaves no truncated destination."""
+        def fails_midway(src_fd, dst_fd, size):
+            os.write(dst_fd, b"partial")
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr(consolidate, "_copy_in_kernel", fails_midway)
+        source = tmp_path / "big.bin"
+        source.write_bytes(b"\x00" * (consolidate.LARGE_FILE_BYTES + 1))
+
+        with pytest.raises(OSError):
+            consolidate.copy_file(source, tmp_path / "copy.bin", source.stat().st_size)
+
+        assert not (tmp_path / "copy.bin").exists()
+
+    def test_symlink_failure_reported_on_stderr(self, project, monkeypatch, capsys):
+        """Test that symlink errors do not corrupt the JSON plan on stdout."""
+        def refuse(self, target):
+            raise OSError(1, "Operation not permitted")
+
+        monkeypatch.setattr(Path, "symlink_to", refuse)
+        applied = consolidate.apply_plan(consolidate.plan_all(project), project)
+
+        captured = capsys.readouterr()
+        assert applied["demo"].startswith("FAILED: ")
+        assert captured.out == ""
+        assert "ERROR creating symlink" in captured.err
+        assert (project / "skills" / "demo" / "notes.md").exists()
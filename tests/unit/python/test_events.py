@@ -0,0 +1,92 @@
+"""
+Tests for the shared events module.
+
+Tests cover:
+- Event records and their mapping interface
+- Lazy timestamp formatting
+- Bounded ring-buffer logs
+"""
+
+from datetime import datetime
+
+import pytest
+
+from shared.events import Event, EventLog
+
+
+class TestEvent:
+    """Tests for individual event records."""
+
+    def test_mapping_matches_level_layout(self):
+        """Test that each level exposes the historical dict keys."""
+        error = Event("error", "Bad total", code="MATH", phase="validation")
+        info = Event("info", "Started", phase="init")
+
+        assert set(error) == {"message", "code", "phase", "details", "timestamp"}
+        assert error["details"] == {}
+        assert set(info) == {"message", "phase", "timestamp"}
+        with pytest.raises(KeyError):
+            info["code"]
+
+    def test_compares_equal_to_dict(self):
+        """Test that events compare equal to their dictionary form."""
+        event = Event("warning", "Low ratio", code="R1")
+
+        assert event == event.to_dict()
+        assert event.to_dict()["code"] == "R1"
+
+    def test_timestamp_is_current_wall_time(self):
+        """Test that monotonic stamps format to wall-clock ISO strings."""
+        before = datetime.now()
+        event = Event("info", "x")
+        after = datetime.now()
+
+        stamp = datetime.fromisoformat(event.timestamp)
+
+        assert abs((stamp - before).total_seconds()) < 1
+        assert abs((after - stamp).total_seconds()) < 1
+
+    def test_records_have_no_instance_dict(self):
+        """Test that events use slots."""
+        assert not hasattr(Event("info", "x"), "__dict__")
+
+
+class TestEventLog:
+    """Tests for event logs."""
+
+    def test_unbounded_log_keeps_everything(self):
+        """Test appending and reading back events in order."""
+        log = EventLog("error")
+        log.append("first", code="A")
+        log.append("second", details={"line": 9})
+
+        assert len(log) == 2
+        assert [event.message for event in log] == ["first", "second"]
+        assert log[-1]["details"] == {"line": 9}
+        assert log.dropped == 0
+
+    def test_capacity_keeps_most_recent(self):
+        """Test that a bounded log drops the oldest events."""
+        log = EventLog("warning", capacity=3)
+        for i in range(10):
+            log.append(f"warning {i}")
+
+        assert [event.message for event in log] == ["warning 7", "warning 8", "warning 9"]
+        assert log.total == 10
+        assert log.dropped == 7
+
+    def test_to_list_and_equality(self):
+        """Test conversion to plain dicts and list comparison."""
+        log = EventLog("info")
+        assert log == []
+
+        log.append("hello", phase="p")
+
+        assert log.to_list() == [{"message": "hello", "phase": "p", "timestamp": log[0].timestamp}]
+        assert log == log.to_list()
+
+    @pytest.mark.parametrize("level, capacity", [("debug", None), ("info", 0)])
+    def test_invalid_arguments_rejected(self, level, capacity):
+        """Test that unknown levels and empty capacities are rejected."""
+        with pytest.raises(ValueError):
+            EventLog(level, capacity)
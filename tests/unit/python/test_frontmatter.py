@@ -0,0 +1,166 @@
+"""
+Tests for the shared frontmatter scanner.
+
+Tests cover:
+- Finding opened, closed and missing frontmatter blocks
+- Stopping at the closing delimiter and bounding unclosed reads
+- Caching by mtime and size, and isolation of returned copies
+- The pre-commit frontmatter check built on the scanner
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Import yaml with guard to prevent CI failures
+try:
+    import yaml
+except ImportError:
+    yaml = None  # type: ignore
+
+from shared import frontmatter
+from shared.frontmatter import load_frontmatter, scan_frontmatter, split_frontmatter
+
+scripts_dir = Path(__file__).parent.parent.parent.parent / "scripts"
+sys.path.insert(0, str(scripts_dir))
+
+from check_skill_frontmatter import check_frontmatter  # noqa: E402
+
+requires_yaml = pytest.mark.skipif(
+    yaml is None,
+    reason="PyYAML not installed - skipping yaml-dependent tests"
+)
+
+
+SKILL_MD = """---
+name: test-skill
+version: 1.0.0
+description: A test skill
+---
+
+# Test Skill
+"""
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    frontmatter.clear_cache()
+    yield
+    frontmatter.clear_cache()
+
+
+def rewrite(path: Path, content: str) -> None:
+    """Write content and move the mtime forward so the change is visible."""
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.unit
+class TestSplitFrontmatter:
+    """Tests for locating the frontmatter block."""
+
+    def test_closed_block(self):
+        """Test that the text between the delimiters is returned."""
+        scan = split_frontmatter(SKILL_MD.splitlines(keepends=True))
+
+        assert scan.opened and scan.closed
+        assert scan.text == "name: test-skill\nversion: 1.0.0\ndescription: A test skill\n"
+
+    def test_missing_and_unclosed(self):
+        """Test documents without an opening or closing delimiter."""
+        missing = split_frontmatter(["# Title\n", "---\n"])
+        unclosed = split_frontmatter(["---\n", "name: x\n", "# Body\n"])
+
+        assert not missing.opened and missing.text is None
+        assert unclosed.opened and not unclosed.closed
+
+    def test_stops_at_closing_delimiter(self):
+        """Test that lines after the closing delimiter are not consumed."""
+        lines = iter(["---\n", "name: x\n", "---\n", "body\n"])
+
+        split_frontmatter(lines)
+
+        assert list(lines) == ["body\n"]
+
+    def test_oversized_block_treated_as_unclosed(self):
+        """Test that an unterminated block stops at max_length."""
+        lines = iter(["---\n"] + ["x: 1\n"] * 100)
+
+        scan = split_frontmatter(lines, max_length=20)
+
+        assert not scan.closed
+        assert len(list(lines)) > 90
+
+
+@pytest.mark.unit
+class TestScanFrontmatter:
+    """Tests for scanning files."""
+
+    def test_large_body_not_read(self, tmp_path: Path):
+        """Test that reading stops before the body (invalid UTF-8 there is never decoded)."""
+        md_file = tmp_path / "SKILL.md"
+        md_file.write_bytes(SKILL_MD.encode() + b"x" * 100_000 + b"\xff" * 1_000)
+
+        assert scan_frontmatter(md_file).closed
+
+    def test_missing_file_raises(self, tmp_path: Path):
+        """Test that unreadable files raise OSError."""
+        with pytest.raises(FileNotFoundError):
+            scan_frontmatter(tmp_path / "missing.md")
+
+
+@requires_yaml
+@pytest.mark.unit
+class TestLoadFrontmatter:
+    """Tests for parsing and caching."""
+
+    def test_cached_until_file_changes(self, tmp_path: Path):
+        """Test that repeat loads hit the cache and edits are picked up."""
+        md_file = tmp_path / "SKILL.md"
+        md_file.write_text(SKILL_MD)
+
+        assert load_frontmatter(md_file)["version"] == "1.0.0"
+        assert load_frontmatter(md_file)["version"] == "1.0.0"
+        assert frontmatter.cache_info().hits == 1
+
+        rewrite(md_file, SKILL_MD.replace("1.0.0", "2.0.0"))
+
+        assert load_frontmatter(md_file)["version"] == "2.0.0"
+        assert frontmatter.cache_info().currsize == 1
+
+    def test_returns_private_copy(self, tmp_path: Path):
+        """Test that mutating a result does not affect the cache."""
+        md_file = tmp_path / "SKILL.md"
+        md_file.write_text(SKILL_MD)
+
+        load_frontmatter(md_file)["name"] = "changed"
+
+        assert load_frontmatter(md_file)["name"] == "test-skill"
+
+
+@pytest.mark.unit
+class TestCheckSkillFrontmatter:
+    """Tests for the pre-commit frontmatter check."""
+
+    def test_valid_file_passes(self, tmp_path: Path):
+        """Test that complete frontmatter passes."""
+        md_file = tmp_path / "SKILL.md"
+        md_file.write_text(SKILL_MD)
+
+        assert check_frontmatter(str(md_file))
+
+    @pytest.mark.parametrize("content, message", [
+        ("# No frontmatter\n", "Missing frontmatter"),
+        ("---\nname: x\n", "Unclosed frontmatter"),
+        ("---\nname: x\nversion: 1\n---\ndescription: body\n", "Missing description:"),
+    ])
+    def test_invalid_files_reported(self, tmp_path: Path, capsys, content, message):
+        """Test that each failure is reported."""
+        md_file = tmp_path / "SKILL.md"
+        md_file.write_text(content)
+
+        assert not check_frontmatter(str(md_file))
+        assert message in capsys.readouterr().out
@@ -0,0 +1,225 @@
+"""
+Unit tests for the skill documentation generator.
+
+Tests cover:
+- Discovering skill definition files
+- Bulk generation with --all in worker processes
+- Reusing compiled templates from the bytecode cache
+- Skipping unchanged skills and leaving identical files untouched
+- Streaming large documents to disk with bounded memory
+"""
+
+import hashlib
+import os
+import stat
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+# Import yaml with guard to prevent CI failures
+try:
+    import yaml
+except ImportError:
+    yaml = None  # type: ignore
+
+pytest.importorskip("jinja2")
+
+pytestmark = pytest.mark.skipif(
+    yaml is None,
+    reason="PyYAML not installed - skipping yaml-dependent tests"
+)
+
+scripts_dir = Path(__file__).parent.parent.parent.parent / "scripts"
+sys.path.insert(0, str(scripts_dir))
+
+import generate_skill_docs  # noqa: E402
+
+TEMPLATE_DIR = scripts_dir.parent / "templates" / "skill-docs"
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    """Create skill definitions in both skill directories."""
+    for directory, name in (("skills", "alpha"), ("skills", "beta"), (".claude/skills", "gamma")):
+        skill_def = generate_skill_docs.create_sample_definition()
+        skill_def["skill"]["name"] = name.title()
+        path = tmp_path / directory / name / generate_skill_docs.DEFINITION_FILE
+        path.parent.mkdir(parents=True)
+        path.write_text(yaml.safe_dump(skill_def))
+    (tmp_path / "skills" / "no-definition").mkdir()
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestGenerateAll:
+    """Tests for --all bulk generation."""
+
+    def test_finds_definitions(self, catalog):
+        """Test that definitions are found under both skill directories."""
+        found = generate_skill_docs.find_skill_definitions(catalog)
+
+        assert [path.parent.name for path in found] == ["gamma", "alpha", "beta"]
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_renders_every_skill(self, catalog, tmp_path, jobs):
+        """Test that each skill's docs are written next to its definition."""
+        definitions = generate_skill_docs.find_skill_definitions(catalog)
+
+        results = generate_skill_docs.generate_all(
+            definitions, TEMPLATE_DIR, jobs=jobs, bytecode_cache_dir=tmp_path / "bytecode"
+        )
+
+        assert [count for _, count, _ in results] == [3, 3, 3]
+        readme = (catalog / "skills" / "beta" / "README.md").read_text()
+        assert "Beta" in readme
+        assert "Generated:" in results[0][2]
+
+    def test_templates_compiled_once(self, catalog, tmp_path, monkeypatch):
+        """Test that a warm bytecode cache skips template compilation."""
+        cache_dir = tmp_path / "bytecode"
+        definitions = generate_skill_docs.find_skill_definitions(catalog)
+        generate_skill_docs.generate_all(definitions, TEMPLATE_DIR, jobs=1, bytecode_cache_dir=cache_dir)
+        assert len(list(cache_dir.iterdir())) == 3
+
+        compiled = []
+        original = generate_skill_docs.Environment.compile
+        monkeypatch.setattr(
+            generate_skill_docs.Environment, "compile",
+            lambda self, *args, **kwargs: compiled.append(args) or original(self, *args, **kwargs)
+        )
+        generate_skill_docs.generate_all(definitions, TEMPLATE_DIR, jobs=1, bytecode_cache_dir=cache_dir)
+
+        assert compiled == []
+
+
+@pytest.mark.unit
+class TestIncrementalGeneration:
+    """Tests for fingerprint-based skipping."""
+
+    def run(self, catalog, manifest_path):
+        manifest = generate_skill_docs.DocsManifest(manifest_path)
+        definitions = generate_skill_docs.find_skill_definitions(catalog)
+        return generate_skill_docs.generate_all(definitions, TEMPLATE_DIR, jobs=1, manifest=manifest)
+
+    def test_unchanged_skills_skipped(self, catalog, tmp_path):
+        """Test that a second run renders nothing and keeps file mtimes."""
+        self.run(catalog, tmp_path / "manifest.json")
+        readme = catalog / "skills" / "alpha" / "README.md"
+        mtime = readme.stat().st_mtime_ns
+
+        results = self.run(catalog, tmp_path / "manifest.json")
+
+        assert all("Up to date" in output for _, _, output in results)
+        assert [count for _, count, _ in results] == [3, 3, 3]
+        assert readme.stat().st_mtime_ns == mtime
+
+    def test_changed_definition_rerendered(self, catalog, tmp_path):
+        """Test that only the edited skill is rendered again."""
+        self.run(catalog, tmp_path / "manifest.json")
+        definition = catalog / "skills" / "beta" / generate_skill_docs.DEFINITION_FILE
+        skill_def = yaml.safe_load(definition.read_text())
+        skill_def["skill"]["tags"].append("new-tag")
+        definition.write_text(yaml.safe_dump(skill_def))
+
+        results = {Path(path).parent.name: output for path, _, output in self.run(catalog, tmp_path / "manifest.json")}
+
+        assert "Up to date" in results["alpha"]
+        assert "Up to date" not in results["beta"]
+
+    def test_fingerprint_with_mixed_key_types(self):
+        """Test that frontmatter mixing int and str keys can still be fingerprinted."""
+        skill_def = {"skill": {"name": "alpha"}, "phases": {1: "Intake", "final": "Report"}}
+
+        fingerprint = generate_skill_docs.docs_fingerprint(skill_def, "digest")
+
+        assert fingerprint == generate_skill_docs.docs_fingerprint(dict(reversed(skill_def.items())), "digest")
+        renamed = {**skill_def, "phases": {"1": "Intake", "final": "Report"}}
+        assert generate_skill_docs.docs_fingerprint(renamed, "digest") != fingerprint
+
+    def test_identical_content_not_rewritten(self, tmp_path):
+        """Test that write_if_changed leaves identical files alone."""
+        path = tmp_path / "README.md"
+        assert generate_skill_docs.write_if_changed(path, "same")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000_000))
+        mtime = path.stat().st_mtime_ns
+
+        assert not generate_skill_docs.write_if_changed(path, "same")
+        assert path.stat().st_mtime_ns == mtime
+        assert generate_skill_docs.write_if_changed(path, "different")
+        assert path.read_text() == "different"
+        assert [p.name for p in tmp_path.iterdir()] == ["README.md"]
+
+    def test_written_files_keep_normal_permissions(self, tmp_path):
+        """Test that new files follow the umask and rewrites keep the existing mode."""
+        umask = os.umask(0o022)
+        try:
+            new_file = tmp_path / "README.md"
+            generate_skill_docs.write_if_changed(new_file, "first")
+            assert stat.S_IMODE(new_file.stat().st_mode) == 0o644
+
+            new_file.chmod(0o664)
+            generate_skill_docs.write_if_changed(new_file, "second")
+            assert stat.S_IMODE(new_file.stat().st_mode) == 0o664
+        finally:
+            os.umask(umask)
+
+
+@pytest.mark.unit
+class TestStreamingGeneration:
+    """Tests for --stream rendering."""
+
+    @pytest.fixture
+    def large_definition(self):
+        skill_def = generate_skill_docs.create_sample_definition()
+        skill_def["skill"]["features"] = [
+            {"name": f"Feature {i}", "description": "x" * 200} for i in range(20_000)
+        ]
+        return skill_def
+
+    def test_stream_matches_render(self, tmp_path):
+        """Test that streamed files equal rendered ones and metadata is returned."""
+        skill_def = generate_skill_docs.create_sample_definition()
+        rendered = generate_skill_docs.generate_docs(skill_def, TEMPLATE_DIR, tmp_path / "a")
+
+        streamed = generate_skill_docs.generate_docs(skill_def, TEMPLATE_DIR, tmp_path / "b", stream=True)
+
+        for name, content in rendered.items():
+            doc = streamed[name]
+            data = content.encode("utf-8")
+            assert doc.path.read_bytes() == data
+            assert (doc.bytes, doc.sha256) == (len(data), hashlib.sha256(data).hexdigest())
+
+    def test_streamed_files_keep_normal_permissions(self, tmp_path):
+        """Test that streamed docs get the umask default mode, not mkstemp's 0600."""
+        umask = os.umask(0o022)
+        try:
+            path = tmp_path / "README.md"
+            generate_skill_docs.stream_to_file(iter(["a", "b"]), path)
+        finally:
+            os.umask(umask)
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+        assert [p.name for p in tmp_path.iterdir()] == ["README.md"]
+
+    def test_peak_memory_stays_below_document_size(self, tmp_path, large_definition):
+        """Test that streaming does not hold the rendered document in memory."""
+        env = generate_skill_docs.setup_jinja_env(TEMPLATE_DIR)
+        generate_skill_docs.generate_docs(
+            large_definition, TEMPLATE_DIR, tmp_path, templates=["README"], env=env, stream=True
+        )
+        size = (tmp_path / "README.md").stat().st_size
+
+        tracemalloc.start()
+        try:
+            doc = generate_skill_docs.generate_docs(
+                large_definition, TEMPLATE_DIR, tmp_path, templates=["README"], env=env, stream=True
+            )["README"]
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert doc.bytes == size > 4_000_000
+        assert peak < size / 4
@@ -0,0 +1,231 @@
+"""
+Unit tests for the skill test template generator.
+
+Tests cover:
+- Finding classes, public methods and signatures with ast
+- Reusing analysis results from the on-disk index across runs
+- Re-analyzing only files whose content changed
+- Concurrent whole-repo analysis, batched writes and the timing report
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Import yaml with guard to prevent CI failures
+try:
+    import yaml
+except ImportError:
+    yaml = None  # type: ignore
+
+scripts_dir = Path(__file__).parent.parent.parent.parent / "scripts"
+sys.path.insert(0, str(scripts_dir))
+
+import generate_skill_tests  # noqa: E402
+from generate_skill_tests import SkillIndex, analyze_skill, parse_python_classes  # noqa: E402
+
+requires_yaml = pytest.mark.skipif(
+    yaml is None,
+    reason="PyYAML not installed - skipping yaml-dependent tests"
+)
+
+SKILL_MD = """---
+name: sample-skill
+version: 2.0.0
+description: A sample skill
+---
+
+# Sample Skill
+
+## Phase 1: Gather Inputs
+
+## Phase 2: Build Report
+"""
+
+ORCHESTRATOR_PY = '''
+class SampleOrchestrator:
+    def __init__(self, config=None):
+        self.config = config
+
+    def run(self, data: dict, strict: bool = False) -> dict:
+        return data
+
+    async def fetch(self, url):
+        return url
+
+    def _helper(self):
+        pass
+
+    class Nested:
+        pass
+
+
+def make():
+    class Local:
+        pass
+'''
+
+
+@pytest.fixture
+def skill_dir(tmp_path: Path) -> Path:
+    """Create a skill with a SKILL.md and one source module."""
+    skill = tmp_path / "sample-skill"
+    (skill / "src").mkdir(parents=True)
+    (skill / "SKILL.md").write_text(SKILL_MD)
+    (skill / "src" / "orchestrator.py").write_text(ORCHESTRATOR_PY)
+    return skill
+
+
+@pytest.mark.unit
+class TestParsePythonClasses:
+    """Tests for ast-based class discovery."""
+
+    def test_module_level_classes_and_public_methods(self):
+        """Test that only module-level classes and public methods are found."""
+        classes = parse_python_classes(ORCHESTRATOR_PY)
+
+        assert [cls.name for cls in classes] == ["SampleOrchestrator"]
+        methods = {method.name: method.signature for method in classes[0].methods}
+        assert methods == {
+            "run": "self, data: dict, strict: bool=False",
+            "fetch": "self, url",
+        }
+
+    def test_unparsable_source_falls_back_to_class_lines(self):
+        """Test that a syntax error still reports class names."""
+        classes = parse_python_classes("class Broken(:\n    pass\nclass Other:\n")
+
+        assert [cls.name for cls in classes] == ["Broken", "Other"]
+
+
+@requires_yaml
+@pytest.mark.unit
+class TestExtractFrontmatter:
+    """Tests for reading SKILL.md frontmatter."""
+
+    def test_accepts_path_or_content(self, skill_dir: Path):
+        """Test that a file path and the markdown text give the same result."""
+        skill_md = skill_dir / "SKILL.md"
+
+        from_path = generate_skill_tests.extract_frontmatter(skill_md)
+        from_content = generate_skill_tests.extract_frontmatter(SKILL_MD)
+
+        assert from_path == from_content == {
+            "name": "sample-skill", "version": "2.0.0", "description": "A sample skill",
+        }
+        assert generate_skill_tests.extract_frontmatter("# No frontmatter") is None
+
+
+@requires_yaml
+@pytest.mark.unit
+class TestSkillIndex:
+    """Tests for reusing analysis across runs."""
+
+    def test_analysis_reused_across_runs(self, skill_dir: Path, tmp_path: Path):
+        """Test that a second run reads results from the index file."""
+        index_path = tmp_path / "cache" / "index.json"
+        first = SkillIndex(index_path)
+        info = analyze_skill(skill_dir, first)
+        first.save()
+
+        second = SkillIndex(index_path)
+        again = analyze_skill(skill_dir, second)
+
+        assert first.misses == 2
+        assert (second.hits, second.misses) == (2, 0)
+        assert again == info
+        assert info.version == "2.0.0"
+        assert [c.name for c in info.capabilities] == ["Gather Inputs", "Build Report"]
+        assert info.python_classes == ["SampleOrchestrator"]
+
+    def test_changed_file_reanalyzed(self, skill_dir: Path, tmp_path: Path):
+        """Test that edits are picked up and identical content is not re-parsed."""
+        index_path = tmp_path / "index.json"
+        index = SkillIndex(index_path)
+        analyze_skill(skill_dir, index)
+        index.save()
+
+        source = skill_dir / "src" / "orchestrator.py"
+        stat = source.stat()
+        source.write_text(ORCHESTRATOR_PY.replace("SampleOrchestrator", "RenamedOrchestrator"))
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        (skill_dir / "SKILL.md").touch()
+
+        index = SkillIndex(index_path)
+        info = analyze_skill(skill_dir, index)
+
+        assert info.python_classes == ["RenamedOrchestrator"]
+        assert (index.hits, index.misses) == (1, 1)
+
+    def test_dry_run_leaves_index_unwritten(self, skill_dir: Path, tmp_path: Path, monkeypatch, capsys):
+        """Test that --dry-run does not create or update the index file."""
+        monkeypatch.setattr(generate_skill_tests, "find_project_root", lambda: tmp_path)
+        monkeypatch.setattr(sys, "argv", ["generate_skill_tests.py", "--skill", "sample-skill", "--dry-run",
+                                          "--index", "cache/index.json"])
+        (tmp_path / "skills").mkdir()
+        skill_dir.rename(tmp_path / "skills" / "sample-skill")
+
+        generate_skill_tests.main()
+
+        assert "Would write" in capsys.readouterr().out
+        assert not (tmp_path / "cache" / "index.json").exists()
+
+    def test_template_lists_public_methods(self, skill_dir: Path):
+        """Test that generated templates stub out the primary class's methods."""
+        template = generate_skill_tests.generate_test_template(analyze_skill(skill_dir))
+
+        assert "def test_run(self):" in template
+        assert "SampleOrchestrator.run(self, data: dict, strict: bool=False)" in template
+        assert "_helper" not in template
+
+
+@requires_yaml
+@pytest.mark.unit
+class TestAnalyzeAll:
+    """Tests for concurrent analysis with --jobs."""
+
+    @pytest.fixture
+    def skills(self, tmp_path: Path):
+        paths = []
+        for i in range(6):
+            skill = tmp_path / f"skill-{i}"
+            (skill / "src").mkdir(parents=True)
+            (skill / "SKILL.md").write_text(SKILL_MD.replace("sample-skill", f"skill-{i}"))
+            (skill / "src" / "orchestrator.py").write_text(ORCHESTRATOR_PY)
+            paths.append(skill)
+        (tmp_path / "broken").mkdir()
+        paths.append(tmp_path / "broken")
+        return paths
+
+    def test_threads_match_serial(self, skills):
+        """Test that concurrent results equal serial results, in input order."""
+        serial = generate_skill_tests.analyze_all(skills, SkillIndex(), jobs=1)
+        index = SkillIndex()
+        threaded = generate_skill_tests.analyze_all(skills, index, jobs=4)
+
+        assert [info for _, info, _ in threaded] == [info for _, info, _ in serial]
+        assert [path for path, _, _ in threaded] == skills
+        # Six distinct SKILL.md files share one source file's analysis
+        assert len(index.entries) == 6 + 1
+
+    def test_report_and_batched_writes(self, skills, tmp_path: Path):
+        """Test the timing report and writing all templates at once."""
+        index = SkillIndex()
+        results = generate_skill_tests.analyze_all(skills, index, jobs=2)
+        report = generate_skill_tests.build_report(results, 2, 0.5, index)
+
+        seconds = [entry["seconds"] for entry in report["skills"]]
+        assert seconds == sorted(seconds, reverse=True)
+        assert [e["skill"] for e in report["skills"] if not e["analyzed"]] == ["broken"]
+
+        output_dir = tmp_path / "out" / "tests"
+        written = generate_skill_tests.write_templates([
+            (output_dir / f"test_{info.name.replace('-', '_')}.py",
+             generate_skill_tests.generate_test_template(info))
+            for _, info, _ in results if info
+        ])
+
+        assert sorted(path.name for path in output_dir.iterdir()) == sorted(p.name for p in written)
+        assert len(written) == 6
@@ -0,0 +1,164 @@
+"""
+Tests for the shared pipeline module.
+
+Tests cover:
+- Wiring validation (unknown sources, cycles, parameters)
+- Data flow between nodes and pipeline inputs
+- Failure isolation and skipped dependents
+- Concurrent branches on threads and asyncio
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import pytest
+
+from shared.base_orchestrator import BaseOrchestrator
+from shared.pipeline import Pipeline, PipelineError
+
+
+class SleepyOrchestrator(BaseOrchestrator):
+    """Orchestrator that waits, then echoes its input."""
+
+    def _get_default_config(self) -> Dict[str, Any]:
+        return {"delay": 0.0}
+
+    def _initialize(self) -> None:
+        pass
+
+    def execute(self, value: Any = None, **kwargs) -> Dict[str, Any]:
+        time.sleep(self.config["delay"])
+        return {"value": value, "extra": kwargs}
+
+
+class SumOrchestrator(BaseOrchestrator):
+    """Orchestrator that adds a list of numbers."""
+
+    def _get_default_config(self) -> Dict[str, Any]:
+        return {}
+
+    def _initialize(self) -> None:
+        pass
+
+    def execute(self, numbers: List[int]) -> Dict[str, Any]:
+        if not numbers:
+            raise ValueError("nothing to add")
+        return {"total": sum(numbers)}
+
+
+def sleepy(delay: float = 0.0) -> SleepyOrchestrator:
+    return SleepyOrchestrator(config={"delay": delay})
+
+
+class TestPipelineWiring:
+    """Tests for validating pipeline structure."""
+
+    def test_unknown_parameter_rejected(self):
+        """Test that inputs must match execute() parameters."""
+        with pytest.raises(PipelineError, match="no parameter"):
+            Pipeline().add("sum", SumOrchestrator(), inputs={"values": "input.numbers"})
+
+    def test_required_parameter_must_be_wired(self):
+        """Test that required execute() parameters need a source."""
+        with pytest.raises(PipelineError, match="required input"):
+            Pipeline().add("sum", SumOrchestrator())
+
+    def test_unknown_dependency_rejected(self):
+        """Test that sources must name existing nodes."""
+        pipeline = Pipeline().add("b", sleepy(), inputs={"value": "a.value"})
+
+        with pytest.raises(PipelineError, match="unknown node 'a'"):
+            pipeline.run()
+
+    def test_cycle_rejected(self):
+        """Test that cyclic wiring is reported."""
+        pipeline = (
+            Pipeline()
+            .add("a", sleepy(), inputs={"value": "b"})
+            .add("b", sleepy(), inputs={"value": "a"})
+        )
+
+        with pytest.raises(PipelineError, match="cycle"):
+            pipeline.order()
+
+    def test_orchestrator_reuse_rejected(self):
+        """Test that one instance cannot back two nodes."""
+        orch = sleepy()
+
+        with pytest.raises(PipelineError, match="already used"):
+            Pipeline().add("a", orch).add("b", orch)
+
+
+class TestPipelineRun:
+    """Tests for running pipelines."""
+
+    def test_values_flow_between_nodes(self):
+        """Test pipeline inputs, whole results and keyed results."""
+        pipeline = (
+            Pipeline()
+            .add("first", sleepy(), inputs={"value": "input.start"})
+            .add("second", sleepy(), inputs={"value": "first.value", "whole": "first"})
+        )
+
+        result = pipeline.run(start=5)
+
+        assert result.status == "success"
+        assert result["second"].output == {"value": 5, "extra": {"whole": {"value": 5, "extra": {}}}}
+
+    def test_failure_skips_dependents_only(self):
+        """Test that a failed node skips its dependents but not other branches."""
+        pipeline = (
+            Pipeline()
+            .add("sum", SumOrchestrator(), inputs={"numbers": "input.numbers"})
+            .add("after", sleepy(), inputs={"value": "sum.total"})
+            .add("other", sleepy(), inputs={"value": "input.numbers"})
+        )
+
+        result = pipeline.run(numbers=[])
+
+        assert result.status == "failed"
+        assert result["sum"].status == "failed"
+        assert result["after"].status == "skipped"
+        assert result["other"].ok
+
+    def test_input_type_checked_against_annotation(self):
+        """Test that inputs are checked against execute() annotations."""
+        pipeline = Pipeline().add("sum", SumOrchestrator(), inputs={"numbers": "input.numbers"})
+
+        result = pipeline.run(numbers="1,2")
+
+        assert result["sum"].status == "failed"
+        assert "expected list" in result["sum"].errors[0]["message"]
+
+    def test_independent_branches_overlap(self):
+        """Test that branches run concurrently and timing is recorded."""
+        pipeline = (
+            Pipeline()
+            .add("a", sleepy(0.2))
+            .add("b", sleepy(0.2))
+            .add("join", sleepy(), inputs={"value": "a.value", "b": "b"})
+        )
+
+        result = pipeline.run()
+
+        assert result.status == "success"
+        assert result.duration_seconds < 0.35
+        assert result["join"].started_at >= result["a"].started_at + result["a"].duration_seconds
+
+    def test_arun_matches_run(self):
+        """Test that the asyncio runner produces the same outputs."""
+        def build():
+            return (
+                Pipeline()
+                .add("sum", SumOrchestrator(), inputs={"numbers": "input.numbers"})
+                .add("echo", sleepy(0.01), inputs={"value": "sum.total"})
+            )
+
+        threaded = build().run(numbers=[1, 2, 3])
+        awaited = asyncio.run(build().arun(numbers=[1, 2, 3]))
+
+        assert awaited.outputs == threaded.outputs == {
+            "sum": {"total": 6},
+            "echo": {"value": 6, "extra": {}},
+        }
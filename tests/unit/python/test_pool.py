@@ -0,0 +1,127 @@
+"""
+Tests for the shared pool module.
+
+Tests cover:
+- Reuse of initialized orchestrators
+- Keying by class and configuration
+- Reset on release, size caps and idle eviction
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from shared.base_orchestrator import BaseOrchestrator
+from shared.pool import OrchestratorPool, config_fingerprint
+
+
+class CountingInitOrchestrator(BaseOrchestrator):
+    """Orchestrator that counts how often it is initialized."""
+
+    initializations = 0
+
+    def _get_default_config(self) -> Dict[str, Any]:
+        return {"mode": "default"}
+
+    def _initialize(self) -> None:
+        CountingInitOrchestrator.initializations += 1
+
+    def execute(self, **kwargs) -> Dict[str, Any]:
+        self.set_result("seen", kwargs)
+        self.add_warning("ran")
+        return {"mode": self.config["mode"]}
+
+
+class OtherOrchestrator(CountingInitOrchestrator):
+    """Second class sharing the same configuration."""
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    CountingInitOrchestrator.initializations = 0
+
+
+class TestOrchestratorPool:
+    """Tests for OrchestratorPool."""
+
+    def test_released_instance_reused_and_reset(self):
+        """Test that a returned orchestrator is handed out again, cleaned."""
+        pool = OrchestratorPool()
+
+        with pool.lease(CountingInitOrchestrator) as first:
+            first.run(job=1)
+        with pool.lease(CountingInitOrchestrator) as second:
+            assert second is first
+            assert second.get_results() == {}
+            assert not second.has_warnings()
+
+        assert CountingInitOrchestrator.initializations == 1
+        assert pool.info().hits == 1 and pool.info().misses == 1
+
+    def test_keyed_by_class_and_config(self):
+        """Test that different classes or configs get separate instances."""
+        pool = OrchestratorPool()
+        with pool.lease(CountingInitOrchestrator, config={"mode": "a"}) as a:
+            pass
+
+        with pool.lease(CountingInitOrchestrator, config={"mode": "b"}) as b:
+            assert b is not a
+        with pool.lease(OtherOrchestrator, config={"mode": "a"}) as other:
+            assert other is not a
+        with pool.lease(CountingInitOrchestrator, config={"mode": "a"}) as again:
+            assert again is a
+
+    def test_changed_config_file_gets_new_instance(self, tmp_path: Path):
+        """Test that editing the config file stops reuse of old instances."""
+        config_file = tmp_path / "skill.yaml"
+        config_file.write_text("mode: before\n")
+        pool = OrchestratorPool()
+        with pool.lease(CountingInitOrchestrator, config_path=config_file) as first:
+            pass
+
+        stat = config_file.stat()
+        config_file.write_text("mode: after\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        with pool.lease(CountingInitOrchestrator, config_path=config_file) as second:
+            assert second is not first
+            assert second.config["mode"] == "after"
+
+    def test_max_size_caps_idle_instances(self):
+        """Test that at most max_size instances are kept per key."""
+        pool = OrchestratorPool(max_size=2)
+        leased = [pool.acquire(CountingInitOrchestrator) for _ in range(4)]
+
+        for orchestrator in leased:
+            pool.release(orchestrator)
+
+        assert pool.info().idle == 2
+        assert pool.info().evictions == 2
+
+    def test_idle_instances_expire(self):
+        """Test that instances idle past max_idle_seconds are evicted."""
+        pool = OrchestratorPool(max_idle_seconds=0)
+        pool.release(pool.acquire(CountingInitOrchestrator))
+
+        pool.evict_idle()
+
+        assert pool.info().idle == 0
+        assert pool.acquire(CountingInitOrchestrator) is not None
+        assert CountingInitOrchestrator.initializations == 2
+
+    def test_replaced_config_not_pooled(self):
+        """Test that instances whose config was swapped are discarded."""
+        pool = OrchestratorPool()
+        orchestrator = pool.acquire(CountingInitOrchestrator)
+        orchestrator.config = {"mode": "patched"}
+
+        pool.release(orchestrator)
+
+        assert pool.info().idle == 0
+
+    def test_fingerprint_ignores_key_order(self):
+        """Test that equal configs fingerprint identically."""
+        assert config_fingerprint({"a": 1, "b": [1, 2]}) == config_fingerprint({"b": [1, 2], "a": 1})
+        assert config_fingerprint({"a": 1}) != config_fingerprint({"a": 2})
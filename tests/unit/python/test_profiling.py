@@ -0,0 +1,217 @@
+"""
+Tests for the shared profiling module.
+
+Tests cover:
+- Nested span timing and summaries
+- Method decorator and BaseOrchestrator integration
+- Wall-time-only spans for async code and per-run summaries
+- Peak memory tracking
+- OpenTelemetry and collapsed-stack export
+"""
+
+import asyncio
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from shared.base_orchestrator import BaseOrchestrator
+from shared.profiling import PhaseProfiler, phase
+
+
+class PhasedOrchestrator(BaseOrchestrator):
+    """Orchestrator whose execute() runs two decorated phases."""
+
+    def _get_default_config(self) -> Dict[str, Any]:
+        return {}
+
+    def _initialize(self) -> None:
+        pass
+
+    @phase("load")
+    def load(self) -> list:
+        time.sleep(0.01)
+        return list(range(10))
+
+    @phase()
+    def validate(self, rows: list) -> int:
+        with self.span("math", rows=len(rows)):
+            return sum(rows)
+
+    def execute(self, **kwargs) -> Dict[str, Any]:
+        return {"total": self.validate(self.load())}
+
+
+class TestPhaseProfiler:
+    """Tests for recording spans."""
+
+    def test_nested_spans_record_parent_and_timing(self):
+        """Test that child spans link to their parent and are timed."""
+        profiler = PhaseProfiler()
+
+        with profiler.span("outer"):
+            with profiler.span("inner", step=1):
+                time.sleep(0.01)
+
+        inner, outer = profiler.spans
+        assert inner.parent_id == outer.span_id
+        assert inner.attributes == {"step": 1}
+        assert outer.duration_seconds >= inner.duration_seconds >= 0.01
+
+    def test_exception_marks_span(self):
+        """Test that a failing block records the error and re-raises."""
+        profiler = PhaseProfiler()
+
+        with pytest.raises(ValueError):
+            with profiler.span("broken"):
+                raise ValueError("bad data")
+
+        assert profiler.spans[0].error == "ValueError: bad data"
+
+    def test_disabled_profiler_records_nothing(self):
+        """Test that spans are no-ops when disabled."""
+        profiler = PhaseProfiler(enabled=False)
+
+        with profiler.span("outer") as span:
+            assert span is None
+
+        assert profiler.spans == []
+
+    def test_peak_memory_per_span(self):
+        """Test that memory mode records each span's allocation peak."""
+        profiler = PhaseProfiler(memory=True)
+        was_tracing = tracemalloc.is_tracing()
+
+        with profiler.span("outer"):
+            with profiler.span("allocate"):
+                block = bytearray(2_000_000)
+                del block
+
+        allocate, outer = profiler.spans
+        assert allocate.peak_memory >= 2_000_000
+        assert outer.peak_memory >= allocate.peak_memory
+        assert tracemalloc.is_tracing() == was_tracing
+
+    def test_spans_nest_across_to_thread(self):
+        """Test that spans opened in asyncio.to_thread nest under the caller."""
+        profiler = PhaseProfiler()
+
+        def work():
+            with profiler.span("worker"):
+                pass
+
+        async def main():
+            with profiler.span("task"):
+                await asyncio.to_thread(work)
+
+        asyncio.run(main())
+
+        worker, task = profiler.spans
+        assert worker.parent_id == task.span_id
+
+
+class TestExports:
+    """Tests for OpenTelemetry and flamegraph output."""
+
+    @pytest.fixture
+    def profiler(self):
+        profiler = PhaseProfiler(service_name="test-skill")
+        with profiler.span("run"):
+            with profiler.span("validate"):
+                time.sleep(0.002)
+            with profiler.span("validate"):
+                pass
+        return profiler
+
+    def test_summary_aggregates_by_path(self, profiler):
+        """Test that repeated phases are summed under one path."""
+        summary = profiler.summary()
+
+        assert list(summary) == ["run", "run;validate"]
+        assert summary["run;validate"]["calls"] == 2
+
+    def test_otel_export_shape(self, profiler, tmp_path: Path):
+        """Test that spans are exported as OTLP/JSON."""
+        profiler.write_otel(tmp_path / "trace.json")
+        data = json.loads((tmp_path / "trace.json").read_text())
+
+        resource = data["resourceSpans"][0]
+        spans = resource["scopeSpans"][0]["spans"]
+        root = next(s for s in spans if "parentSpanId" not in s)
+        assert resource["resource"]["attributes"][0]["value"] == {"stringValue": "test-skill"}
+        assert len(spans) == 3
+        assert len(root["traceId"]) == 32 and len(root["spanId"]) == 16
+        assert int(root["endTimeUnixNano"]) > int(root["startTimeUnixNano"]) > 1_600_000_000 * 10**9
+        assert {s["parentSpanId"] for s in spans if s is not root} == {root["spanId"]}
+
+    def test_collapsed_stacks_use_self_time(self, profiler):
+        """Test collapsed output lines and that self times sum to the root."""
+        lines = dict(line.rsplit(" ", 1) for line in profiler.to_collapsed().splitlines())
+
+        root = next(s for s in profiler.spans if s.parent_id is None)
+        assert set(lines) == {"run", "run;validate"}
+        assert int(lines["run;validate"]) >= 2000
+        assert abs(sum(map(int, lines.values())) - (root.end_ns - root.start_ns) // 1000) <= 2
+
+
+class TestOrchestratorPhases:
+    """Tests for phase spans inside BaseOrchestrator.run()."""
+
+    def test_run_reports_phase_tree(self):
+        """Test that decorated methods and self.span nest under run."""
+        result = PhasedOrchestrator().run()
+
+        phases = result["timing"]["phases"]
+        assert result["result"] == {"total": 45}
+        assert list(phases) == ["run", "run;load", "run;validate", "run;validate;math"]
+        assert phases["run;load"]["duration_seconds"] >= 0.01
+
+    def test_reset_clears_spans(self):
+        """Test that reset() discards recorded spans."""
+        orch = PhasedOrchestrator()
+        orch.run()
+
+        orch.reset()
+
+        assert orch.profiler.spans == []
+
+    def test_repeated_runs_report_current_run_only(self):
+        """Test that each run's phases exclude earlier runs and spans do not pile up."""
+        orch = PhasedOrchestrator()
+        orch.run()
+
+        phases = orch.run()["timing"]["phases"]
+
+        assert phases["run;load"]["calls"] == 1
+        assert len(orch.profiler.spans) == 4
+
+    def test_async_spans_record_wall_time_only(self):
+        """Test that arun and async phases do not charge event-loop CPU time."""
+        class AsyncOrchestrator(PhasedOrchestrator):
+            @phase("fetch")
+            async def fetch(self) -> int:
+                await asyncio.sleep(0.01)
+                return 1
+
+            async def aexecute(self, **kwargs) -> Dict[str, Any]:
+                return {"fetched": await self.fetch()}
+
+        async def busy():
+            deadline = time.thread_time() + 0.05
+            while time.thread_time() < deadline:
+                await asyncio.sleep(0)
+
+        async def main():
+            orch = AsyncOrchestrator()
+            result, _ = await asyncio.gather(orch.arun(), busy())
+            return result
+
+        phases = asyncio.run(main())["timing"]["phases"]
+
+        assert list(phases) == ["run", "run;fetch"]
+        assert phases["run"]["cpu_seconds"] is None
+        assert phases["run;fetch"]["cpu_seconds"] is None
+        assert phases["run;fetch"]["duration_seconds"] >= 0.01
@@ -5,8 +5,13 @@ Tests the validate_skill_structure.py script to ensure it correctly
 validates skill directory structure and frontmatter.
 """
 
+import io
+import json
 import os
+import subprocess
 import tempfile
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -32,7 +37,11 @@ sys.path.insert(0, str(scripts_dir))
 # which would kill pytest during test collection. We need to prevent that.
 if yaml is not None:
     from validate_skill_structure import (
+        JsonLinesWriter,
+        SarifWriter,
         SkillStructureValidator,
+        TextWriter,
+        ValidationCache,
         ValidationResult,
         SkillValidationSummary
     )
@@ -496,6 +505,284 @@ class TestSkillStructureValidator:
         assert len(invalid_summary.errors) > 0
 
 
+    @pytest.mark.parametrize("use_threads", [False, True])
+    def test_parallel_matches_serial(self, sample_config, temp_project_root, capsys, use_threads):
+        """Test that --jobs produces the same summaries and output as a serial run."""
+        for i in range(12):
+            frontmatter = {'name': f'skill-{i}', 'description': 'A user skill'} if i % 3 else None
+            create_skill(temp_project_root / "skills" / f"skill-{i}", frontmatter=frontmatter)
+        (temp_project_root / "skills" / "broken").mkdir()
+        (temp_project_root / "skills" / "broken" / "SKILL.md").write_bytes(b"---\nname: [\xff\n---\n")
+
+        validator = SkillStructureValidator(config_path=str(sample_config), verbose=True)
+        validator.project_root = temp_project_root
+
+        serial = validator.validate_all()
+        validator.print_summary(serial)
+        serial_output = capsys.readouterr().out
+
+        parallel = validator.validate_all(jobs=4, use_threads=use_threads)
+        validator.print_summary(parallel)
+        parallel_output = capsys.readouterr().out
+
+        assert parallel == serial
+        assert parallel_output == serial_output
+        assert "Error extracting frontmatter" in serial_output
+
+
+@pytest.mark.unit
+class TestIncrementalValidation:
+    """Tests for the validation cache and --changed-since."""
+
+    @pytest.fixture
+    def skills(self, temp_project_root):
+        for name in ("alpha", "beta"):
+            create_skill(
+                temp_project_root / "skills" / name,
+                frontmatter={'name': name, 'description': 'A user skill'}
+            )
+        return temp_project_root / "skills"
+
+    def run_cached(self, validator, cache_dir):
+        cache = ValidationCache(cache_dir, validator.config_hash())
+        return validator.validate_all(cache=cache), cache
+
+    def test_unchanged_skills_reused(self, validator, skills, tmp_path, monkeypatch):
+        """Test that a second run validates nothing and returns equal results."""
+        first, cache = self.run_cached(validator, tmp_path / "cache")
+        assert cache.misses == 2
+
+        monkeypatch.setattr(validator, "validate_skill", lambda *args: pytest.fail("revalidated"))
+        second, cache = self.run_cached(validator, tmp_path / "cache")
+
+        assert cache.hits == 2
+        assert second == first
+
+    def test_edited_skill_revalidated(self, validator, skills, tmp_path):
+        """Test that only the skill whose file changed is validated again."""
+        self.run_cached(validator, tmp_path / "cache")
+        skill_md = skills / "beta" / "SKILL.md"
+        skill_md.write_text(skill_md.read_text().replace("A user skill", "X"))
+
+        summaries, cache = self.run_cached(validator, tmp_path / "cache")
+
+        assert (cache.hits, cache.misses) == (1, 1)
+        beta = next(s for s in summaries if s.skill_name == "beta")
+        assert not beta.is_valid
+
+    def test_touched_but_identical_file_hits(self, validator, skills, tmp_path):
+        """Test that a new timestamp with the same content still hits."""
+        self.run_cached(validator, tmp_path / "cache")
+        readme = skills / "alpha" / "README.md"
+        stat = readme.stat()
+        os.utime(readme, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        _, cache = self.run_cached(validator, tmp_path / "cache")
+
+        assert cache.hits == 2
+
+    def test_config_change_invalidates_cache(self, validator, skills, tmp_path, sample_config):
+        """Test that editing the configuration discards cached results."""
+        self.run_cached(validator, tmp_path / "cache")
+        with open(sample_config, 'a') as f:
+            f.write("\n# edited\n")
+
+        _, cache = self.run_cached(validator, tmp_path / "cache")
+
+        assert cache.misses == 2
+
+    def test_unwritable_cache_dir_skipped(self, validator, skills, tmp_path):
+        """Test that a cache directory that cannot be created does not fail the run."""
+        (tmp_path / "blocked").write_text("")
+
+        summaries, cache = self.run_cached(validator, tmp_path / "blocked" / "cache")
+
+        assert len(summaries) == 2
+        assert cache.misses == 2
+
+    @pytest.mark.parametrize("flags, cached", [([], False), (["--cache"], True)])
+    def test_cache_is_opt_in(self, skills, sample_config, temp_project_root, monkeypatch, capsys,
+                             flags, cached):
+        """Test that the CLI only writes the cache manifest with --cache."""
+        import validate_skill_structure
+
+        monkeypatch.setattr(validate_skill_structure.SkillStructureValidator, "_find_project_root",
+                            lambda self: temp_project_root)
+        monkeypatch.setattr(sys, "argv", ["validate_skill_structure.py", "--config", str(sample_config), *flags])
+
+        with pytest.raises(SystemExit):
+            validate_skill_structure.main()
+
+        assert (temp_project_root / ".cache" / "skill-validation" / "manifest.json").exists() is cached
+
+    def test_changed_since_limits_skills(self, validator, skills, temp_project_root):
+        """Test that --changed-since only validates skills with changed files."""
+        def git(*args):
+            subprocess.run(["git", *args], cwd=temp_project_root, check=True, capture_output=True)
+
+        git("init", "-q")
+        git("add", "-A")
+        git("-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-qm", "init")
+        (skills / "beta" / "notes.txt").write_text("draft")
+
+        summaries = validator.validate_all(changed_files=validator.changed_since("HEAD"))
+
+        assert [s.skill_name for s in summaries] == ["beta"]
+
+
+@pytest.mark.unit
+class TestWatchMode:
+    """Tests for --watch revalidation."""
+
+    @pytest.fixture
+    def skills(self, temp_project_root):
+        for name in ("alpha", "beta"):
+            create_skill(
+                temp_project_root / "skills" / name,
+                frontmatter={'name': name, 'description': 'A user skill'}
+            )
+        return temp_project_root / "skills"
+
+    def test_refresh_revalidates_only_changed_skill(self, validator, skills, monkeypatch):
+        """Test that a change revalidates just the skill it belongs to."""
+        validated = []
+        original = validator.validate_skill
+        monkeypatch.setattr(
+            validator, "validate_skill",
+            lambda path, skill_type: validated.append(path.name) or original(path, skill_type)
+        )
+        skill_md = skills / "beta" / "SKILL.md"
+        skill_md.write_text(skill_md.read_text().replace("A user skill", "X"))
+
+        summaries = validator.refresh([skill_md, skills / "alpha" / "src" / "notes.py"])
+
+        assert validated == ["beta"]
+        assert [s.skill_name for s in summaries] == ["beta"]
+        assert not summaries[0].is_valid
+
+    def test_refresh_drops_removed_skill(self, validator, skills, capsys):
+        """Test that deleting a skill directory removes it from the state."""
+        validator.refresh([skills / "alpha", skills / "beta"])
+        for path in (skills / "beta").iterdir():
+            path.unlink()
+        (skills / "beta").rmdir()
+
+        assert validator.refresh([skills / "beta"]) == []
+        assert list(validator._watch_state) == [f"user:{skills / 'alpha'}"]
+        assert "beta (user) removed" in capsys.readouterr().out
+
+    def test_watch_reports_saved_file(self, validator, skills, capsys):
+        """Test that polling watch mode picks up an edit and reports it."""
+        stop = threading.Event()
+        watcher = threading.Thread(
+            target=validator.watch, kwargs={"use_polling": True, "poll_interval": 0.01, "stop": stop}
+        )
+        watcher.start()
+        try:
+            deadline = time.monotonic() + 5
+            while "Watching 2 skill(s)" not in capsys.readouterr().out:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+            skill_md = skills / "alpha" / "SKILL.md"
+            stat = skill_md.stat()
+            skill_md.write_text(skill_md.read_text().replace("A user skill", "X"))
+            os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            output = ""
+            while "alpha (user): 1 error(s)" not in output:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+                output += capsys.readouterr().out
+            assert "1/2 skill(s) valid" in output
+        finally:
+            stop.set()
+            watcher.join()
+
+
+@pytest.mark.unit
+class TestOutputFormats:
+    """Tests for streaming JSON Lines and SARIF output."""
+
+    @pytest.fixture
+    def skills(self, temp_project_root):
+        create_skill(
+            temp_project_root / "skills" / "alpha",
+            frontmatter={'name': 'alpha', 'description': 'A user skill'}
+        )
+        create_skill(temp_project_root / "skills" / "beta", frontmatter={'name': 'beta'})
+        return temp_project_root / "skills"
+
+    def test_results_stream_before_run_completes(self, validator, skills, monkeypatch):
+        """Test that each summary is yielded before later skills are validated."""
+        validated = []
+        original = validator.validate_skill
+        monkeypatch.setattr(
+            validator, "validate_skill",
+            lambda path, skill_type: validated.append(path.name) or original(path, skill_type)
+        )
+        stream = io.StringIO()
+        writer = JsonLinesWriter(stream)
+
+        results = validator.iter_validate()
+        writer.write(next(results))
+
+        assert len(validated) == 1
+        assert json.loads(stream.getvalue())["skill_name"] == validated[0]
+
+    def test_text_summary_goes_to_writer_stream(self, validator, skills, capsys):
+        """Test that the text report is written to the writer's stream, not stdout."""
+        stream = io.StringIO()
+        writer = TextWriter(stream, validator)
+        for summary in validator.iter_validate():
+            writer.write(summary)
+        writer.close()
+
+        assert "SKILL STRUCTURE VALIDATION SUMMARY" in stream.getvalue()
+        assert "Total skills validated: 2" in stream.getvalue()
+        assert "SUMMARY" not in capsys.readouterr().out
+
+    def test_jsonl_records(self, validator, skills):
+        """Test one record per skill followed by a totals line."""
+        stream = io.StringIO()
+        writer = JsonLinesWriter(stream)
+        for summary in validator.iter_validate():
+            writer.write(summary)
+        writer.close()
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+
+        by_name = {r["skill_name"]: r for r in records if r["type"] == "skill"}
+        assert by_name["alpha"]["valid"] and not by_name["beta"]["valid"]
+        assert by_name["beta"]["errors"][0]["check_type"] == "frontmatter"
+        assert records[-1] == {"type": "summary", "skills": 2, "invalid": 1, "errors": 1, "warnings": 0}
+
+    def test_sarif_log(self, validator, skills, temp_project_root):
+        """Test that the streamed SARIF log is valid JSON with relative locations."""
+        stream = io.StringIO()
+        writer = SarifWriter(stream, temp_project_root)
+        for summary in validator.iter_validate():
+            writer.write(summary)
+        writer.close()
+
+        run = json.loads(stream.getvalue())["runs"][0]
+        errors = [r for r in run["results"] if r["level"] == "error"]
+
+        assert len(errors) == 1
+        assert errors[0]["ruleId"] == "frontmatter"
+        assert errors[0]["locations"][0]["physicalLocation"]["artifactLocation"] == {
+            "uri": "skills/beta/SKILL.md", "uriBaseId": "%SRCROOT%"
+        }
+
+    def test_empty_sarif_log(self, temp_project_root):
+        """Test that a run without findings still produces a valid log."""
+        stream = io.StringIO()
+        writer = SarifWriter(stream, temp_project_root)
+        writer.close()
+
+        assert json.loads(stream.getvalue())["runs"][0]["results"] == []
+
+
 @pytest.mark.unit
 class TestValidationResult:
     """Test ValidationResult dataclass."""